@@ -0,0 +1,56 @@
+"""
+Scaling benchmark for parallel batch design.
+
+Designs the same synthetic model with batch.design_members at 1, 2, 4 and N
+workers (plus the in-process serial path) and reports throughput.
+
+Usage:
+    python benchmarks/bench_batch_scaling.py [--members 20000] [--chunksize 256]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(__file__))
+from models import synthetic_members
+from pysteelmanual.batch import design_members
+
+
+def run(members: int, workers: int, chunksize: int) -> float:
+    """Return wall time in seconds to design the synthetic model"""
+    start = time.perf_counter()
+    failures = 0
+    for result in design_members(synthetic_members(members), workers=workers,
+                                 chunksize=chunksize):
+        failures += not result.ok
+    elapsed = time.perf_counter() - start
+    if failures:
+        print(f"  warning: {failures} members failed")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--members", type=int, default=20000)
+    parser.add_argument("--chunksize", type=int, default=256)
+    parser.add_argument("--workers", type=int, nargs="*",
+                        help="worker counts to run (default: 0 1 2 4 N)")
+    args = parser.parse_args()
+
+    cpus = os.cpu_count() or 1
+    worker_counts = args.workers or sorted({0, 1, 2, 4, cpus})
+    baseline = None
+    print(f"{args.members} members, chunksize {args.chunksize}, {cpus} CPUs")
+    print(f"{'workers':>8} {'time (s)':>10} {'members/s':>12} {'speedup':>8}")
+    for workers in worker_counts:
+        elapsed = run(args.members, workers, args.chunksize)
+        baseline = baseline or elapsed
+        label = "serial" if workers == 0 else str(workers)
+        print(f"{label:>8} {elapsed:10.2f} {args.members/elapsed:12.0f} "
+              f"{baseline/elapsed:8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Import-time benchmark for pysteelmanual.
+
+Runs ``python -X importtime`` in fresh interpreters and reports the cumulative
+import time of pysteelmanual, with and without loading the steelpy AISC shape
+database. The shape database and the design modules are deferred until
+first use, so plain ``import pysteelmanual`` should not import steelpy,
+pandas, NumPy or Efficalc at all. The run fails (exit status 1) if it does,
+or if its median import time exceeds --max-ms.
+
+Usage:
+    python benchmarks/bench_import.py [--repeat N] [--max-ms MS]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+SCENARIOS = {
+    "import pysteelmanual": "import pysteelmanual",
+    "import + load AISC shapes": ("import pysteelmanual\n"
+                                  "pysteelmanual.sections.get_aisc_profiles()"),
+}
+
+# Modules that plain "import pysteelmanual" must not load
+HEAVY_MODULES = {"steelpy", "pandas", "numpy", "efficalc"}
+
+
+def measure(code: str) -> tuple[float, set[str]]:
+    """Return total import time in ms and the set of top-level modules
+    imported while running the given code in a fresh interpreter."""
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                               capture_output=True, text=True, check=True)
+    total_us = 0
+    modules = set()
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # header row
+        # Top-level imports are not indented past the first space
+        if not name.startswith("  "):
+            total_us += int(cumulative)
+        modules.add(name.strip().split(".")[0])
+    return total_us/1000, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-ms", type=float, default=50.0,
+                        help="largest median time allowed for plain import pysteelmanual")
+    args = parser.parse_args()
+
+    failures = []
+    for label, code in SCENARIOS.items():
+        times = []
+        for _ in range(args.repeat):
+            ms, modules = measure(code)
+            times.append(ms)
+        heavy = sorted(modules & HEAVY_MODULES)
+        median = statistics.median(times)
+        print(f"{label:<28} median {median:8.1f} ms  "
+              f"(min {min(times):.1f} ms)  heavy modules: {', '.join(heavy) or 'none'}")
+        if label == "import pysteelmanual":
+            if heavy:
+                failures.append(f"{label} imports {', '.join(heavy)}")
+            if median > args.max_ms:
+                failures.append(f"{label} takes {median:.1f} ms (limit {args.max_ms:g} ms)")
+    for failure in failures:
+        print(f"FAILED: {failure}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
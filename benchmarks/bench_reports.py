@@ -0,0 +1,63 @@
+"""
+Benchmark for eager versus deferred calculation reports.
+
+Designs a synthetic model once building every member's Efficalc report during
+the design run (eager) and once keeping only the report records (deferred),
+then builds reports for a sample of members from the records. Reports wall
+time and the memory held by the designed members (tracemalloc).
+
+Usage:
+    python benchmarks/bench_reports.py [--members 500] [--reports 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(__file__))
+from models import synthetic_members
+
+
+def run(members: int, eager: bool) -> tuple[list, float, int]:
+    """Return the designed members, wall time in seconds and bytes retained"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    designed = []
+    for member in synthetic_members(members):
+        member.design_member(report=eager)
+        designed.append(member)
+    elapsed = time.perf_counter() - start
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return designed, elapsed, retained
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--members", type=int, default=500)
+    parser.add_argument("--reports", type=int, default=5,
+                        help="number of deferred reports to build on request")
+    args = parser.parse_args()
+
+    # Warm the shape tables so neither mode pays for loading them
+    list(synthetic_members(1))
+
+    eager, eager_time, eager_memory = run(args.members, eager=True)
+    deferred, deferred_time, deferred_memory = run(args.members, eager=False)
+
+    start = time.perf_counter()
+    for member, reference in zip(deferred[:args.reports], eager):
+        assert member.calc_report() == reference.report_html
+    report_time = (time.perf_counter() - start)/max(args.reports, 1)
+
+    print(f"{args.members} members")
+    print(f"{'mode':>9} {'time (s)':>10} {'memory (kB)':>12}")
+    print(f"{'eager':>9} {eager_time:10.2f} {eager_memory/1e3:12.1f}")
+    print(f"{'deferred':>9} {deferred_time:10.2f} {deferred_memory/1e3:12.1f}")
+    print(f"on-demand report: {1000*report_time:.1f} ms per member")
+
+
+if __name__ == "__main__":
+    main()
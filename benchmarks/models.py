@@ -0,0 +1,29 @@
+"""
+Synthetic member models for benchmarks.
+
+Members are drawn from a fixed pool of W shapes, lengths and load
+combinations with a seeded random generator, so every run designs the same
+model.
+"""
+
+import random
+from pysteelmanual import SteelMember
+from pysteelmanual.materials import ASTM_A992_GR_50
+
+SHAPES = ["W8X31", "W10X49", "W12X26", "W12X65", "W14X22", "W14X90",
+          "W16X40", "W18X50", "W21X44", "W24X76"]
+LENGTHS = [96.0, 120.0, 144.0, 168.0, 192.0, 240.0]
+
+
+def synthetic_members(count: int, combinations: int=4, seed: int=360):
+    """Yield count SteelMember objects with random sections, lengths and forces"""
+    rng = random.Random(seed)
+    for i in range(count):
+        length = rng.choice(LENGTHS)
+        force_actions = {f"LC{j+1}": {"axial": rng.uniform(-50, 300),
+                                      "major_flex": rng.uniform(-1500, 1500)}
+                         for j in range(combinations)}
+        yield SteelMember(f"M{i}", rng.choice(SHAPES), ASTM_A992_GR_50, length,
+                          force_actions=force_actions,
+                          design_props={"compression": {"Ly": length/2},
+                                        "major_flex": {"Lb": length/2}})
@@ -0,0 +1,325 @@
+"""
+Benchmark suite for the Chapter E/F calculation functions and SteelMember.
+
+Times per-equation microbenchmarks (E3, E4 and F11, on the fast float path),
+end-to-end round bar capacities (fast path and Efficalc report path),
+vectorized batch kernels, and serial batch design of synthetic models with
+1k, 10k and 100k members. Each benchmark is timed with timeit over several
+repeats and the per-call minimum, median and mean are reported.
+
+Results can be saved as JSON and compared against a stored baseline
+(benchmarks/baseline.json). A benchmark whose minimum time exceeds the
+baseline by more than the threshold (and by more than an absolute noise
+floor, which keeps nanosecond-scale timings from flapping) is a regression,
+and the run exits with status 1. Baselines are machine-specific: regenerate
+one with --save-baseline on the machine used for comparisons.
+
+Usage:
+    python benchmarks/suite.py [--filter NAME] [--sizes 1000 10000 100000]
+                               [--output results.json] [--compare [BASELINE]]
+                               [--threshold 0.3] [--noise-floor 1e-7]
+                               [--save-baseline]
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import timeit
+from datetime import datetime, timezone
+from importlib.metadata import version
+
+sys.path.insert(0, os.path.dirname(__file__))
+import numpy as np
+from efficalc.calculation_runner import CalculationRunner
+from models import synthetic_members
+from pysteelmanual.batch import design_members
+from pysteelmanual.cache import CAPACITY_CACHE
+from pysteelmanual.manualtables import get_column_curve
+from pysteelmanual.materials import ASTM_A36, ASTM_A992_GR_50
+from pysteelmanual.sections import RoundBar
+from pysteelmanual.shapetable import get_shape
+from pysteelmanual.steelcodes.aisc_360_22 import combined, compression, flexure
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+SCHEMA = 1
+
+# name -> (function to time, calls per measurement or None to calibrate, repeats)
+BENCHMARKS = {}
+
+
+def benchmark(name: str, number: int|None=None, repeat: int=7):
+    """Register a function returning the zero-argument callable to time"""
+    def register(setup):
+        BENCHMARKS[name] = (setup, number, repeat)
+        return setup
+    return register
+
+
+def run_report(function, *args, **kwargs):
+    """Run a report-path function the way ReportBuilder does, so the Efficalc
+    objects it creates are released after each call"""
+    CalculationRunner(lambda: function(*args, **kwargs)).calculate_all_items()
+
+
+###########################################################################
+# MICROBENCHMARKS
+###########################################################################
+
+BAR = RoundBar(2.0)
+W_SHAPE = get_shape("W14X90")
+
+
+@benchmark("E2.slenderness_ratio")
+def _():
+    return lambda: compression.calc_slenderness_ratio(120.0, 0.5, 1.0, report=False)
+
+
+@benchmark("E3.elastic_buckling_stress")
+def _():
+    return lambda: compression.calc_elastic_buckling_stress(240.0, 29000.0, report=False)
+
+
+@benchmark("E3.nominal_flexural_buckling_stress")
+def _():
+    return lambda: compression.calc_nominal_flexural_buckling_stress(20.0, 36.0, report=False)
+
+
+@benchmark("E3.nominal_compressive_strength")
+def _():
+    return lambda: compression.calc_nominal_compressive_strength_E3(17.5, 3.14, report=False)
+
+
+@benchmark("E4.ft_elastic_buckling_stress")
+def _():
+    Cw, Ix, Iy, J = W_SHAPE.Cw, W_SHAPE.Ix, W_SHAPE.Iy, W_SHAPE.J
+    return lambda: compression.calc_ft_elastic_buckling_stress_doubly_symmetric(
+        240.0, Cw, Ix, Iy, J, 29000.0, 11200.0, report=False)
+
+
+@benchmark("F11.round_bar_plastic_moment")
+def _():
+    return lambda: flexure.calc_round_bar_plastic_moment(BAR, ASTM_A36, report=False)
+
+
+###########################################################################
+# END-TO-END CAPACITIES
+###########################################################################
+
+@benchmark("round_bar_compressive_capacity")
+def _():
+    return lambda: compression.calc_round_bar_compressive_capacity(
+        BAR, ASTM_A36, 48.0, 48.0, 1.0, 1.0, "lrfd", report=False)
+
+
+@benchmark("round_bar_flexural_capacity")
+def _():
+    return lambda: flexure.calc_round_bar_flexural_capacity(BAR, ASTM_A36, "lrfd", report=False)
+
+
+@benchmark("round_bar_compressive_capacity.report")
+def _():
+    return lambda: run_report(compression.calc_round_bar_compressive_capacity,
+                              BAR, ASTM_A36, 48.0, 48.0, 1.0, 1.0, "lrfd")
+
+
+@benchmark("round_bar_flexural_capacity.report")
+def _():
+    return lambda: run_report(flexure.calc_round_bar_flexural_capacity, BAR, ASTM_A36, "lrfd")
+
+
+@benchmark("w_shape_compressive_capacity")
+def _():
+    return lambda: compression.calc_w_shape_compressive_capacity(
+        W_SHAPE, ASTM_A992_GR_50, 240.0, 240.0, design_method="lrfd", report=False)
+
+
+@benchmark("w_shape_flexural_capacity")
+def _():
+    return lambda: flexure.calc_w_shape_flexural_capacity(
+        W_SHAPE, ASTM_A992_GR_50, 240.0, design_method="lrfd", report=False)
+
+
+###########################################################################
+# BATCH KERNELS
+###########################################################################
+
+@benchmark("round_bar_compressive_capacity_batch.100k")
+def _():
+    rng = np.random.default_rng(360)
+    diameter = rng.uniform(0.5, 6.0, 100_000)
+    length = rng.uniform(12.0, 240.0, 100_000)
+    return lambda: compression.calc_round_bar_compressive_capacity_batch(
+        diameter, length, length, 1.0, 1.0, 36.0, 29000.0, "lrfd")
+
+
+@benchmark("round_bar_flexural_capacity_batch.100k")
+def _():
+    diameter = np.random.default_rng(360).uniform(0.5, 6.0, 100_000)
+    return lambda: flexure.calc_round_bar_flexural_capacity_batch(diameter, 36.0, "lrfd")
+
+
+@benchmark("column_curve.lookup.1M")
+def _():
+    curve = get_column_curve(50.0, 29000.0)
+    slenderness = np.random.default_rng(360).uniform(0.0, 200.0, 1_000_000)
+    return lambda: curve.nominal_stress(slenderness)
+
+
+@benchmark("column_curve.exact.1M")
+def _():
+    curve = get_column_curve(50.0, 29000.0)
+    slenderness = np.random.default_rng(360).uniform(0.0, 200.0, 1_000_000)
+    return lambda: curve.exact(slenderness)
+
+
+@benchmark("h1_interaction_screen.1M")
+def _():
+    rng = np.random.default_rng(360)
+    # 10k members x 10 combinations x 10 stations
+    Pr, Mrx, Mry = (rng.uniform(-500, 500, (10_000, 10, 10)) for _ in range(3))
+    Pc, Mcx, Mcy = (rng.uniform(500, 2000, 10_000) for _ in range(3))
+    return lambda: combined.screen_interaction_H1_1(Pr, Mrx, Pc, Mcx, Mry, Mcy)
+
+
+###########################################################################
+# BATCH DESIGN OF SYNTHETIC MODELS
+###########################################################################
+
+def design_model(members: int):
+    """Design a synthetic model serially, starting from an empty capacity cache"""
+    CAPACITY_CACHE.clear()
+    for result in design_members(synthetic_members(members), workers=0):
+        if not result.ok:
+            raise result.error
+
+
+def register_models(sizes: list[int]):
+    for size in sizes:
+        label = f"{size//1000}k" if size % 1000 == 0 else str(size)
+        benchmark(f"design_members.{label}", number=1,
+                  repeat=3 if size <= 10_000 else 1)(lambda size=size: lambda: design_model(size))
+
+
+###########################################################################
+# RUNNER
+###########################################################################
+
+def measure(setup, number: int|None, repeat: int) -> dict:
+    """Time a benchmark and return per-call statistics in seconds"""
+    function = setup()
+    timer = timeit.Timer(function)
+    if number is None:
+        number, _ = timer.autorange()
+    times = [total/number for total in timer.repeat(repeat=repeat, number=number)]
+    return {"min": min(times),
+            "median": statistics.median(times),
+            "mean": statistics.fmean(times),
+            "number": number,
+            "repeat": repeat}
+
+
+def metadata() -> dict:
+    return {"schema": SCHEMA,
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+            "pysteelmanual": version("pysteelmanual"),
+            "numpy": np.__version__,
+            "efficalc": version("efficalc")}
+
+
+def compare(results: dict, baseline: dict, threshold: float,
+            noise_floor: float=0.0) -> list[str]:
+    """Print a comparison with the baseline and return the regressed benchmarks"""
+    regressions = []
+    print(f"\n{'benchmark':<45} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, result in results["benchmarks"].items():
+        if name not in baseline["benchmarks"]:
+            continue
+        before = baseline["benchmarks"][name]["min"]
+        after = result["min"]
+        change = after/before - 1
+        flag = ""
+        if change > threshold and after - before > noise_floor:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<45} {format_time(before):>12} {format_time(after):>12} "
+              f"{change:+8.1%}{flag}")
+    return regressions
+
+
+def save(path: str, results: dict):
+    with open(path, "w") as file:
+        json.dump(results, file, indent=2)
+        file.write("\n")
+
+
+def format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds/scale:.3f} {unit}"
+    return f"{seconds/1e-9:.1f} ns"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--filter", default="",
+                        help="only run benchmarks whose name contains this text")
+    parser.add_argument("--sizes", type=int, nargs="*", default=[1_000, 10_000, 100_000],
+                        help="synthetic model sizes for batch design")
+    parser.add_argument("--output", help="save results as JSON")
+    parser.add_argument("--compare", nargs="?", const=BASELINE,
+                        help="compare with a baseline JSON file (default: stored baseline)")
+    parser.add_argument("--threshold", type=float, default=0.3,
+                        help="allowed slowdown before failing, as a fraction (default 0.3)")
+    parser.add_argument("--noise-floor", type=float, default=1e-7,
+                        help="ignore slowdowns smaller than this many seconds per call")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="save results as the stored baseline (with --filter, "
+                             "only the benchmarks run are updated)")
+    args = parser.parse_args()
+
+    register_models(args.sizes)
+    results = {"metadata": metadata(), "benchmarks": {}}
+    print(f"{'benchmark':<45} {'min':>12} {'median':>12} {'calls':>8}")
+    start = time.perf_counter()
+    for name, (setup, number, repeat) in BENCHMARKS.items():
+        if args.filter not in name:
+            continue
+        result = measure(setup, number, repeat)
+        results["benchmarks"][name] = result
+        print(f"{name:<45} {format_time(result['min']):>12} "
+              f"{format_time(result['median']):>12} {result['number']:>8}")
+    print(f"total time {time.perf_counter() - start:.1f} s")
+
+    if args.output:
+        save(args.output, results)
+    if args.save_baseline:
+        baseline = results
+        if args.filter and os.path.exists(BASELINE):
+            # Update only the benchmarks that were run
+            with open(BASELINE) as file:
+                baseline = json.load(file)
+            baseline["metadata"] = results["metadata"]
+            baseline["benchmarks"].update(results["benchmarks"])
+        save(BASELINE, baseline)
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        regressions = compare(results, baseline, args.threshold, args.noise_floor)
+        if regressions:
+            print(f"\n{len(regressions)} benchmark(s) slower than baseline by more than "
+                  f"{args.threshold:.0%}: {', '.join(regressions)}")
+            sys.exit(1)
+        print(f"\nNo regressions beyond {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
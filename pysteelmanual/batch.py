@@ -0,0 +1,198 @@
+"""
+Parallel batch design of many SteelMember objects
+
+Members are grouped into chunks and designed across a process pool. Only a
+bounded number of chunks is in flight at a time, so an iterable of members
+(e.g. a generator reading a model file) is consumed incrementally. Errors are
+captured per member and returned with the results instead of aborting the
+batch; a chunk that fails as a whole (a worker that dies, or members or
+results that cannot be pickled) gives that error for each of its members.
+Each worker imports the design modules and loads the AISC shape tables once,
+in its initializer, rather than per task.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, FIRST_COMPLETED, wait
+from itertools import islice
+from typing import Callable, Iterable, Iterator
+from pysteelmanual.resultcache import ResultCache
+from pysteelmanual.resultstore import ResultStore
+from pysteelmanual.steelmember import SteelMember
+
+
+class BatchResult():
+    """Design outcome of one member in a batch. Exactly one of results
+    and error is set."""
+    __slots__ = ("index", "member", "results", "error")
+
+    def __init__(self, index: int, member: SteelMember,
+                 results: dict|None=None, error: Exception|None=None):
+        self.index = index
+        self.member = member
+        self.results = results
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self):
+        status = "ok" if self.ok else f"error={self.error!r}"
+        return f"BatchResult({self.index}, {self.member.label!r}, {status})"
+
+
+###########################################################################
+# CHUNKED PROCESS POOLS
+# Shared with reportexport, which renders reports in the same way
+###########################################################################
+
+def init_worker():
+    """Load the design modules and shape tables once per worker process.
+    Used as the initializer of ProcessPoolExecutor."""
+    from pysteelmanual.shapetable import get_shape_table
+    from pysteelmanual.steelcodes.aisc_360_22 import members
+    for family in members.I_SHAPE_FAMILIES:
+        get_shape_table(family)
+
+
+def chunked(items: Iterable, chunksize: int) -> Iterator[tuple[int, list]]:
+    """Yield (index of the first item, chunk) for consecutive chunks of up
+    to chunksize items, consuming items incrementally"""
+    iterator = iter(items)
+    start = 0
+    while chunk := list(islice(iterator, chunksize)):
+        yield start, chunk
+        start += len(chunk)
+
+
+def submit_chunk(pool: ProcessPoolExecutor, function: Callable, *args) -> Future:
+    """Submit function(*args) to a pool. If the pool cannot accept it (it is
+    broken once a worker has died), return a future holding that error."""
+    try:
+        return pool.submit(function, *args)
+    except Exception as error:
+        future = Future()
+        future.set_exception(error)
+        return future
+
+
+def chunk_outcomes(future: Future, count: int, failure=lambda error: (None, error)) -> list:
+    """Return the result of a chunk's future: a list of count outcomes, one
+    per item. If the whole chunk failed (e.g. a worker died or the chunk
+    could not be pickled), failure(error) is the outcome of every item; the
+    default gives the (results, error) outcomes of design chunks."""
+    try:
+        return future.result()
+    except Exception as error:
+        return [failure(error)]*count
+
+
+###########################################################################
+# MEMBER DESIGN
+###########################################################################
+
+def _design_one(member: SteelMember) -> tuple[dict|None, Exception|None]:
+    try:
+        member.design_member()
+        return member.results, None
+    except Exception as error:
+        return None, error
+
+
+def _design_chunk(chunk: list[SteelMember]) -> list[tuple[dict|None, Exception|None]]:
+    return [_design_one(member) for member in chunk]
+
+
+def _lookup(chunk: list[SteelMember], result_cache: ResultCache|None) -> list:
+    """Return (key, cached results) for each member of a chunk"""
+    if result_cache is None:
+        return [(None, None)]*len(chunk)
+    lookups = []
+    for member in chunk:
+        key = result_cache.key(member)
+        lookups.append((key, result_cache.get(key)))
+    return lookups
+
+
+def _misses(chunk: list[SteelMember], lookups: list) -> list[SteelMember]:
+    return [member for member, (_, cached) in zip(chunk, lookups) if cached is None]
+
+
+def _collect(start: int, chunk: list[SteelMember], lookups: list, outcomes,
+             result_cache: ResultCache|None=None,
+             store: ResultStore|None=None) -> list[BatchResult]:
+    """Merge cached results with the outcomes of the members designed"""
+    batch = []
+    outcomes = iter(outcomes)
+    for offset, (member, (key, cached)) in enumerate(zip(chunk, lookups)):
+        if cached is None:
+            results, error = next(outcomes)
+            if error is None and result_cache is not None:
+                result_cache.put(key, results)
+        else:
+            results, error = cached, None
+        if error is None:
+            member.set_results(results)
+        if store is not None:
+            store.add(member.label, results, error)
+        batch.append(BatchResult(start+offset, member, results, error))
+    return batch
+
+
+def design_members(members: Iterable[SteelMember],
+                   workers: int|None=None,
+                   chunksize: int=64,
+                   ordered: bool=True,
+                   max_pending: int|None=None,
+                   result_cache: ResultCache|None=None,
+                   store: ResultStore|None=None,
+                   ) -> Iterator[BatchResult]:
+    """Design members across a process pool, yielding a BatchResult per member.
+
+    workers defaults to the CPU count; workers=0 designs in the calling
+    process without a pool. With ordered=True results are yielded in input
+    order, otherwise as chunks complete. At most max_pending chunks (default
+    four per worker) are submitted at once. Each member's results and
+    report_record are updated in the calling process as its chunk is
+    collected.
+
+    With a result_cache, members are looked up in the calling process before
+    submission and only those without stored results are designed; new
+    results are stored as they are collected.
+
+    With a store, each member's results (or error) are also written into
+    the ResultStore as they are collected."""
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers == 0:
+        for start, chunk in chunked(members, chunksize):
+            lookups = _lookup(chunk, result_cache)
+            outcomes = _design_chunk(_misses(chunk, lookups))
+            yield from _collect(start, chunk, lookups, outcomes, result_cache, store)
+        return
+    if max_pending is None:
+        max_pending = 4*workers
+
+    chunks = chunked(members, chunksize)
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as pool:
+        def submit(start, chunk):
+            lookups = _lookup(chunk, result_cache)
+            misses = _misses(chunk, lookups)
+            future = submit_chunk(pool, _design_chunk, misses)
+            return future, start, chunk, lookups, len(misses)
+
+        pending = deque(submit(start, chunk) for start, chunk in islice(chunks, max_pending))
+        while pending:
+            if ordered:
+                finished = [pending.popleft()]
+            else:
+                done, _ = wait([item[0] for item in pending], return_when=FIRST_COMPLETED)
+                finished = [item for item in pending if item[0] in done]
+                for item in finished:
+                    pending.remove(item)
+            for future, start, chunk, lookups, count in finished:
+                yield from _collect(start, chunk, lookups, chunk_outcomes(future, count),
+                                    result_cache, store)
+                for next_start, next_chunk in islice(chunks, 1):
+                    pending.append(submit(next_start, next_chunk))
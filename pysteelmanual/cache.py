@@ -0,0 +1,104 @@
+"""
+Memoization of limit-state capacities
+
+Members in a model often share a section, material, unbraced lengths and
+design method, so their capacities are identical. Capacities are cached in a
+least-recently-used cache keyed on the values that determine them. The
+module-level CAPACITY_CACHE is used by member design; it can be resized,
+cleared or disabled, and keeps hit, miss and eviction counters.
+"""
+
+from collections import OrderedDict
+from typing import Callable, Hashable
+from pysteelmanual.instrumentation import register_cache
+from pysteelmanual.materials import SteelMaterial
+from pysteelmanual.sections import SteelSection
+from pysteelmanual.units import UnitSystem
+
+
+class CapacityCache():
+    """Least-recently-used cache of capacities with hit/miss/eviction counters"""
+    def __init__(self, maxsize: int=65536, enabled: bool=True):
+        self.maxsize = maxsize
+        self.enabled = enabled
+        self._data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], float]) -> float:
+        """Return the cached value for key, computing and storing it on a miss"""
+        if not self.enabled:
+            return compute()
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            value = compute()
+            self._data[key] = value
+            self._evict()
+            return value
+        self.hits += 1
+        self._data.move_to_end(key)
+        return value
+
+    def resize(self, maxsize: int):
+        """Change the maximum number of entries, evicting as needed"""
+        self.maxsize = maxsize
+        self._evict()
+
+    def clear(self):
+        """Remove all entries and reset the counters"""
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> dict:
+        """Return the cache counters as a dictionary"""
+        lookups = self.hits + self.misses
+        return {"hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hit_rate": self.hits/lookups if lookups else 0.0}
+
+    def _evict(self):
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+
+CAPACITY_CACHE = CapacityCache()
+register_cache("capacity", CAPACITY_CACHE.stats)
+
+
+def section_key(section: SteelSection) -> Hashable:
+    """Canonical key for the properties of a section"""
+    family = getattr(section, "family", None)
+    if family is not None:
+        # AISC shapes are fully determined by their family and designation
+        return (family, section.label)
+    # Sections are immutable value objects, so they serve as their own key
+    return section
+
+
+def material_key(material: SteelMaterial) -> tuple:
+    """Canonical key for the properties of a material"""
+    return (material.Fy, material.Fu, material.E, material.G)
+
+
+def capacity_key(limit_state: str,
+                 section: SteelSection,
+                 material: SteelMaterial,
+                 geometry: tuple,
+                 design_method: str,
+                 units: UnitSystem,
+                 ) -> tuple:
+    """Canonical key for one limit-state capacity"""
+    return (limit_state, section_key(section), material_key(material),
+            units.label, geometry, design_method.lower())
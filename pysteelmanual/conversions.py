@@ -0,0 +1,211 @@
+"""
+Conversion of sections, materials, forces and results between unit systems
+
+A scale factor is precomputed for each physical quantity (length, area,
+section modulus, moment of inertia, warping constant, force, stress, moment
+and unit weight) and pair of unit systems, from the unit labels of the two
+systems. Each quantity follows its own label: MM_KN stresses are in MPa and
+forces in kN, for example, so converting from IN_KIP scales ksi to MPa and
+kip to kN. Whole arrays are converted with one multiplication per quantity,
+so a shape table, a set of materials or a column of results is converted in
+a single vectorized pass.
+
+Converted AISC shape tables are built through shapetable.get_shape_table
+(family, units), which caches one table per family and unit system.
+
+Strengths calculated from stresses and section properties come out in
+stress times area: MPa times mm^2 is N, not the kN of MM_KN.
+calculation_units and strength_factors give the units of such results and
+the factors converting them to a unit system's force and moment units.
+"""
+
+from functools import cache
+from math import isclose
+from typing import Mapping
+from numpy.typing import ArrayLike
+from pysteelmanual.materials import SteelMaterial
+from pysteelmanual.sections import SteelSection, RoundBar, RectBar
+from pysteelmanual.units import UnitSystem
+
+# Size of each base unit in SI units (m, N, Pa)
+BASE_UNITS = {"in": 0.0254, "ft": 0.3048, "mm": 0.001, "m": 1.0,
+              "kip": 4448.2216152605, "lb": 4.4482216152605, "kN": 1000.0, "N": 1.0,
+              "ksi": 6894757.293168361, "psi": 6894.757293168361,
+              "MPa": 1e6, "kPa": 1e3, "Pa": 1.0}
+
+# Base units of force, for the units of calculated strengths
+FORCE_UNITS = ("kip", "lb", "kN", "N")
+
+# Quantity -> function returning its unit label in a unit system
+QUANTITY_UNITS = {"length": lambda units: units.length,
+                  "area": lambda units: units.area,
+                  "section_modulus": lambda units: units.volume,
+                  "inertia": lambda units: f"{units.length}^4",
+                  "warping": lambda units: f"{units.length}^6",
+                  "force": lambda units: units.force,
+                  "stress": lambda units: units.stress,
+                  "moment": lambda units: units.moment,
+                  "unit_weight": lambda units: units.unit_weight}
+
+# Quantity of each AISC shape property. Properties not listed (weight, which
+# stays in lb/ft as in the designation, and ratios such as H and tan_a) are
+# not converted.
+SHAPE_PROPERTY_QUANTITIES = {
+    **{prop: "length" for prop in (
+        "d", "bf", "tw", "tf", "k", "k1", "x", "y", "eo", "xp", "yp", "rx", "ry", "rz",
+        "ro", "rts", "ho", "T", "WGi", "WGo", "PA", "PA2", "PB", "PC", "PD", "OD", "ID",
+        "tnom", "tdes", "Ht", "h", "B", "b", "t", "zA", "zB", "zC", "wA", "wB", "wC")},
+    **{prop: "area" for prop in ("area", "Wno")},
+    **{prop: "section_modulus" for prop in (
+        "Sx", "Sy", "Sz", "Zx", "Zy", "Qf", "Qw", "C", "SwA", "SwB", "SwC",
+        "SzA", "SzB", "SzC")},
+    **{prop: "inertia" for prop in ("Ix", "Iy", "Iz", "Iw", "J", "Sw1", "Sw2", "Sw3")},
+    "Cw": "warping"}
+
+# Quantity of each force action in SteelMember.force_actions
+FORCE_ACTION_QUANTITIES = {"axial": "force",
+                           "major_flex": "moment"}
+
+
+@cache
+def unit_value(unit: str) -> float:
+    """Return the size of a unit label in SI units. Labels are products of
+    base units with optional powers, with at most one division, e.g. "in^4",
+    "kip-in" or "kN/mm^3"."""
+    numerator, _, denominator = unit.partition("/")
+    value = 1.0
+    for part, power in ((numerator, 1), (denominator, -1)):
+        if not part:
+            continue
+        for token in part.split("-"):
+            name, _, exponent = token.partition("^")
+            if name not in BASE_UNITS:
+                raise ValueError(f"Unknown unit \"{name}\" in \"{unit}\"")
+            value *= BASE_UNITS[name]**(power*int(exponent or 1))
+    return value
+
+
+@cache
+def conversion_factors(from_units: UnitSystem, to_units: UnitSystem) -> dict[str, float]:
+    """Return the factor converting each quantity from one unit system to
+    another. Factors are computed once per pair of unit systems."""
+    return {quantity: unit_value(label(from_units))/unit_value(label(to_units))
+            for quantity, label in QUANTITY_UNITS.items()}
+
+
+@cache
+def calculation_units(units: UnitSystem) -> UnitSystem:
+    """Return the unit system that strengths calculated in a unit system are
+    in: forces in stress times area and moments in force times length. This
+    is units itself if it is consistent, as IN_KIP is."""
+    force_value = unit_value(units.stress)*unit_value(units.area)
+    for force in FORCE_UNITS:
+        if isclose(unit_value(force), force_value, rel_tol=1e-9):
+            break
+    else:
+        raise ValueError(f"No force unit equals {units.stress} times {units.area} "
+                         f"in unit system {units.label}")
+    moment = f"{force}-{units.length}"
+    if force == units.force and unit_value(moment) == unit_value(units.moment):
+        return units
+    return UnitSystem(f"{units.label} (calculation)", units.length, units.area,
+                      units.volume, force, units.stress, moment,
+                      f"{force}/{units.volume}")
+
+
+@cache
+def strength_factors(units: UnitSystem) -> dict[str, float]:
+    """Return the factors converting calculated forces and moments (see
+    calculation_units) to the force and moment units of a unit system. Both
+    are 1 for consistent unit systems."""
+    calculation = calculation_units(units)
+    if calculation == units:
+        return {"force": 1.0, "moment": 1.0}
+    return {"force": unit_value(calculation.force)/unit_value(units.force),
+            "moment": unit_value(calculation.moment)/unit_value(units.moment)}
+
+
+def scale_factor(quantity: str, from_units: UnitSystem, to_units: UnitSystem) -> float:
+    try:
+        return conversion_factors(from_units, to_units)[quantity]
+    except KeyError:
+        raise ValueError(f"Unknown quantity \"{quantity}\". "
+                         f"Available quantities: {tuple(QUANTITY_UNITS)}") from None
+
+
+def convert(values: ArrayLike, quantity: str,
+            from_units: UnitSystem, to_units: UnitSystem) -> ArrayLike:
+    """Convert a value or an array of values of a quantity"""
+    if from_units == to_units:
+        return values
+    return values*scale_factor(quantity, from_units, to_units)
+
+
+###########################################################################
+# SECTIONS AND MATERIALS
+###########################################################################
+
+def convert_material(material: SteelMaterial, units: UnitSystem) -> SteelMaterial:
+    """Return a material with its properties in another unit system"""
+    if material.units == units:
+        return material
+    factors = conversion_factors(material.units, units)
+    return SteelMaterial(material.Fy*factors["stress"], material.Fu*factors["stress"],
+                         material.E*factors["stress"], material.G*factors["stress"],
+                         material.gamma*factors["unit_weight"], units)
+
+
+def convert_materials(materials: Mapping[str, SteelMaterial],
+                      units: UnitSystem) -> dict[str, SteelMaterial]:
+    """Convert a set of named materials to a unit system"""
+    return {name: convert_material(material, units) for name, material in materials.items()}
+
+
+def convert_section(section: SteelSection, units: UnitSystem) -> SteelSection:
+    """Return a section in another unit system. AISC shapes come from the
+    cached converted shape table."""
+    if section.units == units:
+        return section
+    family = getattr(section, "family", None)
+    if family is not None:
+        from pysteelmanual.shapetable import get_shape
+        return get_shape(section.label, family, units)
+    scale = scale_factor("length", section.units, units)
+    if isinstance(section, RoundBar):
+        default_label = f"{section.D}-{section.units.length} Ø Round Bar"
+        label = "" if section.label == default_label else section.label
+        return RoundBar(section.D*scale, label, units)
+    if isinstance(section, RectBar):
+        return RectBar(section.b*scale, section.h*scale, units)
+    raise NotImplementedError("Unit conversion is not implemented for "
+                              f"{getattr(section, 'label', type(section).__name__)}")
+
+
+###########################################################################
+# FORCES AND RESULTS
+###########################################################################
+
+def convert_force_actions(force_actions: dict[str, dict[str, float]],
+                          from_units: UnitSystem,
+                          to_units: UnitSystem) -> dict[str, dict[str, float]]:
+    """Convert SteelMember.force_actions (load combination -> force actions)"""
+    factors = conversion_factors(from_units, to_units)
+    scales = {action: factors[quantity] for action, quantity in FORCE_ACTION_QUANTITIES.items()}
+    return {name: {action: value*scales[action] for action, value in actions.items()}
+            for name, actions in force_actions.items()}
+
+
+def convert_results(results: dict[str, dict],
+                    from_units: UnitSystem,
+                    to_units: UnitSystem) -> dict[str, dict]:
+    """Convert the capacities and demands of SteelMember.results. Ratios
+    and combinations are unchanged."""
+    from pysteelmanual.steelcodes.aisc_360_22.members import LIMIT_STATE_QUANTITIES
+    factors = conversion_factors(from_units, to_units)
+    converted = {}
+    for limit_state, result in results.items():
+        scale = factors[LIMIT_STATE_QUANTITIES[limit_state]]
+        converted[limit_state] = {**result,
+                                  "capacity": result["capacity"]*scale,
+                                  "demand": result["demand"]*scale}
+    return converted
@@ -0,0 +1,67 @@
+"""
+Base class for immutable value objects
+
+Subclasses declare their attributes in __slots__ and set them once in
+__init__ through _init_attributes. Instances have no per-instance __dict__,
+cannot be modified after construction, and compare and hash by value, so they
+can be used as dictionary and cache keys.
+"""
+
+# Attribute names of each Immutable subclass, collected from the MRO once
+_FIELDS = {}
+
+
+class Immutable():
+    """Immutable, slotted value object with value-based equality and hashing"""
+    __slots__ = ()
+
+    def _init_attributes(self, **attributes):
+        for name, value in attributes.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"cannot assign to \"{name}\": "
+                             f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"cannot delete \"{name}\": "
+                             f"{type(self).__name__} is immutable")
+
+    @classmethod
+    def _fields(cls) -> tuple[str, ...]:
+        try:
+            return _FIELDS[cls]
+        except KeyError:
+            fields = []
+            for klass in reversed(cls.__mro__):
+                fields.extend(klass.__dict__.get("__slots__", ()))
+            _FIELDS[cls] = tuple(fields)
+            return _FIELDS[cls]
+
+    def _values(self) -> tuple:
+        return tuple(getattr(self, name, None) for name in self._fields())
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values() == other._values()
+
+    def __hash__(self):
+        return hash((type(self).__name__, self._values()))
+
+    def __repr__(self):
+        values = ", ".join(f"{name}={getattr(self, name, None)!r}" for name in self._fields())
+        return f"{type(self).__name__}({values})"
+
+    def __reduce__(self):
+        # The default slot-based pickling assigns attributes with setattr,
+        # which immutable objects refuse.
+        return (_restore, (type(self), self._fields(), self._values()))
+
+
+def _restore(cls, fields, values):
+    instance = object.__new__(cls)
+    for name, value in zip(fields, values):
+        if value is not None:
+            object.__setattr__(instance, name, value)
+    return instance
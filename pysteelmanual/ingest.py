@@ -0,0 +1,220 @@
+"""
+Streaming ingest of analysis results into member design
+
+Member forces from an analysis are read as a stream of records, each a
+(member label, load combination, force actions) tuple such as
+("B12", "1.2D+1.6L", {"axial": -10.2, "major_flex": 84.1}). A record may be
+one station of a member or an end of it; records for the same member and
+combination are reduced to a demand envelope as they arrive, so the station
+forces are never held in memory. Sources are generators over a CSV or NDJSON
+export (read_force_csv, read_force_ndjson) or a solved Pynite model
+(pynite_forces).
+
+envelope_forces turns records into force_actions dictionaries, one per
+member, and design_from_records feeds them to batch.design_members as each
+member's envelope is completed. With grouped=True (records for each member
+are contiguous, as in most exports) only one member's envelope is held at a
+time; otherwise envelopes for every member are kept until the stream ends,
+which still takes memory proportional to members times combinations rather
+than to the number of records.
+
+Axial force is positive in compression, as in SteelMember.force_actions.
+"""
+
+import csv
+import gzip
+import json
+from typing import Iterable, Iterator, Mapping
+from pysteelmanual.batch import BatchResult, design_members
+from pysteelmanual.resultcache import ResultCache
+from pysteelmanual.resultstore import ResultStore
+from pysteelmanual.steelmember import SteelMember
+
+# Force actions read from exports
+FORCE_ACTIONS = ("axial", "major_flex")
+
+# Record fields mapped to themselves, used when columns are not renamed
+DEFAULT_COLUMNS = {"member": "member", "combination": "combination",
+                   **{action: action for action in FORCE_ACTIONS}}
+
+
+def _open_text(path: str):
+    """Open a text file for reading, decompressing files ending in .gz"""
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", newline="")
+    return open(path, newline="")
+
+
+###########################################################################
+# SOURCES
+###########################################################################
+
+def read_force_csv(path: str,
+                   columns: dict[str, str]={},
+                   axial_sign: float=1.0,
+                   ) -> Iterator[tuple[str, str, dict[str, float]]]:
+    """Yield (member, combination, force actions) records from a CSV file
+    with a header row, one row at a time. columns maps record fields
+    ("member", "combination" and the FORCE_ACTIONS) to column names where
+    they differ; other columns (e.g. station) are ignored, as are empty
+    cells. Use axial_sign=-1 for exports with axial force positive in
+    tension. Files ending in .gz are decompressed as they are read."""
+    columns = {**DEFAULT_COLUMNS, **columns}
+    with _open_text(path) as file:
+        reader = csv.DictReader(file)
+        missing = [columns[field] for field in ("member", "combination")
+                   if columns[field] not in (reader.fieldnames or [])]
+        if missing:
+            raise ValueError(f"Missing columns {missing} in \"{path}\"")
+        actions = [(action, columns[action]) for action in FORCE_ACTIONS
+                   if columns[action] in reader.fieldnames]
+        for row in reader:
+            forces = {action: float(row[column]) for action, column in actions
+                      if row[column] not in ("", None)}
+            if "axial" in forces:
+                forces["axial"] *= axial_sign
+            yield row[columns["member"]], row[columns["combination"]], forces
+
+
+def read_force_ndjson(path: str,
+                      columns: dict[str, str]={},
+                      axial_sign: float=1.0,
+                      ) -> Iterator[tuple[str, str, dict[str, float]]]:
+    """Yield (member, combination, force actions) records from a
+    newline-delimited JSON file with one object per line. columns,
+    axial_sign and .gz files are handled as in read_force_csv; missing or
+    null force actions are skipped and blank lines are ignored."""
+    columns = {**DEFAULT_COLUMNS, **columns}
+    actions = [(action, columns[action]) for action in FORCE_ACTIONS]
+    with _open_text(path) as file:
+        for number, line in enumerate(file, 1):
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            try:
+                member = row[columns["member"]]
+                combination = row[columns["combination"]]
+            except KeyError as error:
+                raise ValueError(f"Missing field {error} on line {number} of \"{path}\"")
+            forces = {action: float(row[key]) for action, key in actions
+                      if row.get(key) is not None}
+            if "axial" in forces:
+                forces["axial"] *= axial_sign
+            yield str(member), str(combination), forces
+
+
+def pynite_forces(model,
+                  combinations: Iterable[str]|None=None,
+                  members: Iterable[str]|None=None,
+                  axial_sign: float=-1.0,
+                  major_axis: str="Mz",
+                  ) -> Iterator[tuple[str, str, dict[str, float]]]:
+    """Yield (member, combination, force actions) records from a solved
+    Pynite FEModel3D, one member and combination at a time. The extreme
+    axial forces and major-axis moments along each member are taken from
+    Pynite's max_axial/min_axial and max_moment/min_moment, so no station
+    forces are stored. combinations and members default to all of the
+    model's load combinations and members. Pynite axial forces are positive
+    in tension, hence the default axial_sign of -1; major_axis is the Pynite
+    moment direction for major-axis bending."""
+    if combinations is None:
+        combinations = list(model.load_combos)
+    else:
+        combinations = list(combinations)
+    if members is None:
+        members = model.members
+    for name in members:
+        member = model.members[name]
+        for combination in combinations:
+            yield name, combination, {
+                "axial": axial_sign*member.max_axial(combination),
+                "major_flex": member.max_moment(major_axis, combination)}
+            yield name, combination, {
+                "axial": axial_sign*member.min_axial(combination),
+                "major_flex": member.min_moment(major_axis, combination)}
+
+
+###########################################################################
+# ENVELOPES
+###########################################################################
+
+def update_envelope(envelope: dict[str, float], forces: dict[str, float]):
+    """Merge one record's force actions into an envelope: the largest axial
+    force (compression positive) and, for other actions, the value of
+    largest magnitude with its sign"""
+    for action, value in forces.items():
+        current = envelope.get(action)
+        if current is None:
+            envelope[action] = value
+        elif action == "axial":
+            if value > current:
+                envelope[action] = value
+        elif abs(value) > abs(current):
+            envelope[action] = value
+
+
+def envelope_forces(records: Iterable[tuple[str, str, dict[str, float]]],
+                    grouped: bool=False,
+                    ) -> Iterator[tuple[str, dict[str, dict[str, float]]]]:
+    """Reduce a stream of force records to (member, force_actions) pairs,
+    where force_actions maps each load combination to its envelope (see
+    update_envelope). The envelope of each action is taken separately, so
+    the governing axial force and moment of a combination may come from
+    different stations.
+
+    With grouped=True the records of each member must be contiguous, and
+    each member is yielded as soon as its records end. Otherwise members are
+    yielded in order of first appearance once the stream is exhausted."""
+    if grouped:
+        label = None
+        force_actions = {}
+        finished = set()
+        for member, combination, forces in records:
+            if member != label:
+                if label is not None:
+                    yield label, force_actions
+                    finished.add(label)
+                if member in finished:
+                    raise ValueError(f"Records for member \"{member}\" are not contiguous")
+                label = member
+                force_actions = {}
+            update_envelope(force_actions.setdefault(combination, {}), forces)
+        if label is not None:
+            yield label, force_actions
+        return
+    envelopes = {}
+    for member, combination, forces in records:
+        update_envelope(envelopes.setdefault(member, {}).setdefault(combination, {}), forces)
+    yield from envelopes.items()
+
+
+###########################################################################
+# DESIGN
+###########################################################################
+
+def design_from_records(records: Iterable[tuple[str, str, dict[str, float]]],
+                        members: Mapping[str, SteelMember],
+                        grouped: bool=False,
+                        workers: int|None=None,
+                        chunksize: int=64,
+                        ordered: bool=True,
+                        result_cache: ResultCache|None=None,
+                        store: ResultStore|None=None,
+                        ) -> Iterator[BatchResult]:
+    """Design members from a stream of force records, yielding a BatchResult
+    per member that has records.
+
+    members maps member labels in the records to SteelMember objects. Each
+    member's force_actions is replaced by its envelope (see envelope_forces)
+    and the member is passed to batch.design_members, with the remaining
+    arguments, as soon as its envelope is complete."""
+    def enveloped():
+        for label, force_actions in envelope_forces(records, grouped):
+            try:
+                member = members[label]
+            except KeyError:
+                raise ValueError(f"No member \"{label}\" for ingested forces")
+            member.force_actions = force_actions
+            yield member
+    return design_members(enveloped(), workers, chunksize, ordered,
+                          result_cache=result_cache, store=store)
@@ -0,0 +1,245 @@
+"""
+Opt-in timing instrumentation for design runs
+
+Functions on the hot path are marked with the instrumented decorator, which
+only registers them and returns them unchanged, so nothing is timed and no
+wrapper is called while instrumentation is off. Starting an Instrumentation
+session swaps timing wrappers in for the registered functions (in their
+module or class namespace, and in any module that imported them by name with
+"from module import name") and stopping it restores the originals. Other
+references taken before the session started, such as functions stored in
+dictionaries or bound to local variables, still call the untimed original.
+
+A session records the call count and the cumulative, maximum and percentile
+latency of every instrumented call, grouped by category: equations and integration
+functions ("equations"), limit states checked by member design
+("limit_states"), section lookups ("lookups") and member-level calls
+("members"). Calls made on the Efficalc report path are recorded separately
+from float-path calls, under the function name with a " [report]" suffix.
+Latencies are inclusive of nested instrumented calls. Percentiles are
+estimated from a bounded random sample of RESERVOIR_SIZE latencies per
+function, so memory use does not grow with the length of the session. Hit
+rates of the registered caches over the session are included in the results.
+
+    with Instrumentation() as session:
+        member.design_member()
+    session.to_dict()
+
+Instrumentation is process-wide: only one session may be active at a time,
+and calls made in worker processes (e.g. by batch.design_members with
+workers > 0) are not recorded.
+"""
+
+import sys
+from functools import wraps
+from time import perf_counter
+from typing import Callable
+
+PERCENTILES = (50, 90, 99)
+# Latencies kept per function for the percentile estimates
+RESERVOIR_SIZE = 1024
+
+# The active session, or None when instrumentation is off
+ACTIVE = None
+
+# (function, category) for every instrumented function
+_REGISTRY = []
+# Cache name -> function returning {"hits": ..., "misses": ...}
+_CACHES = {}
+
+
+def instrumented(category: str="equations") -> Callable:
+    """Register a function (or method) to be timed while a session is active.
+    The function itself is returned unchanged."""
+    def register(function):
+        _REGISTRY.append((function, category))
+        return function
+    return register
+
+
+def register_cache(name: str, stats: Callable[[], dict]):
+    """Register a cache whose hit rate is reported by sessions. stats must
+    return a dictionary with "hits" and "misses" counters."""
+    _CACHES[name] = stats
+
+
+def record(category: str, name: str, elapsed: float):
+    """Record one timed call in the active session, if any"""
+    if ACTIVE is not None:
+        ACTIVE.record(category, name, elapsed)
+
+
+def _owner(function: Callable):
+    """Return the module or class whose attribute holds the function"""
+    owner = sys.modules[function.__module__]
+    for part in function.__qualname__.split(".")[:-1]:
+        owner = getattr(owner, part)
+    return owner
+
+
+def _report_argument(function: Callable) -> tuple[int|None, bool]:
+    """Return the position and default of a function's report parameter"""
+    import inspect
+    try:
+        parameters = list(inspect.signature(function).parameters.values())
+    except (TypeError, ValueError):
+        return None, False
+    for position, parameter in enumerate(parameters):
+        if parameter.name == "report":
+            return position, bool(parameter.default)
+    return None, False
+
+
+def _timing_wrapper(function: Callable, category: str) -> Callable:
+    name = function.__qualname__
+    report_name = f"{name} [report]"
+    position, default = _report_argument(function)
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        start = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            elapsed = perf_counter() - start
+            if position is None:
+                report = False
+            elif len(args) > position:
+                report = args[position]
+            else:
+                report = kwargs.get("report", default)
+            record(category, report_name if report else name, elapsed)
+    return wrapper
+
+
+def _aliases(functions: dict) -> list[tuple[object, str, Callable]]:
+    """Return (module, attribute, function) for every module attribute that
+    refers to one of the functions, keyed by id"""
+    aliases = []
+    for module in list(sys.modules.values()):
+        namespace = getattr(module, "__dict__", None)
+        if not isinstance(namespace, dict):
+            continue
+        for attribute, value in list(namespace.items()):
+            function = functions.get(id(value))
+            if function is not None and value is function:
+                aliases.append((module, attribute, function))
+    return aliases
+
+
+class _Latencies():
+    """Running aggregates of one function's latencies, with a reservoir
+    sample of at most RESERVOIR_SIZE of them for percentiles"""
+    __slots__ = ("calls", "total", "max", "sample")
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.sample = []
+
+    def add(self, elapsed: float, random: Callable[[], float]):
+        self.calls += 1
+        self.total += elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+        if self.calls <= RESERVOIR_SIZE:
+            self.sample.append(elapsed)
+        else:
+            index = int(random()*self.calls)
+            if index < RESERVOIR_SIZE:
+                self.sample[index] = elapsed
+
+
+class Instrumentation():
+    """Timing session for instrumented functions. Use as a context manager
+    or with start() and stop()."""
+    def __init__(self):
+        from random import Random
+        self.latencies = {}
+        self.caches = {}
+        self._patched = []
+        self._cache_start = {}
+        self._random = Random(0).random
+
+    def record(self, category: str, name: str, elapsed: float):
+        """Add one call's latency in seconds"""
+        latencies = self.latencies.setdefault(category, {})
+        try:
+            latencies[name].add(elapsed, self._random)
+        except KeyError:
+            latencies[name] = _Latencies()
+            latencies[name].add(elapsed, self._random)
+
+    def start(self):
+        global ACTIVE
+        if ACTIVE is not None:
+            raise RuntimeError("An instrumentation session is already active")
+        import inspect
+        self._cache_start = {name: stats() for name, stats in _CACHES.items()}
+        functions, wrappers = {}, {}
+        for function, category in _REGISTRY:
+            owner = _owner(function)
+            attribute = function.__name__
+            original = inspect.getattr_static(owner, attribute)
+            wrapper = _timing_wrapper(function, category)
+            setattr(owner, attribute, wrapper)
+            self._patched.append((owner, attribute, original))
+            functions[id(function)] = function
+            wrappers[id(function)] = wrapper
+        # Names imported with "from module import name"
+        for module, attribute, function in _aliases(functions):
+            setattr(module, attribute, wrappers[id(function)])
+            self._patched.append((module, attribute, function))
+        ACTIVE = self
+        return self
+
+    def stop(self):
+        global ACTIVE
+        for owner, attribute, original in reversed(self._patched):
+            setattr(owner, attribute, original)
+        self._patched = []
+        ACTIVE = None
+        for name, stats in _CACHES.items():
+            before = self._cache_start.get(name, {"hits": 0, "misses": 0})
+            after = stats()
+            hits = after["hits"] - before["hits"]
+            misses = after["misses"] - before["misses"]
+            lookups = hits + misses
+            self.caches[name] = {"hits": hits,
+                                 "misses": misses,
+                                 "hit_rate": hits/lookups if lookups else 0.0}
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def to_dict(self) -> dict:
+        """Return per-call statistics in seconds, keyed by category and name,
+        and the cache hit rates of the session"""
+        import numpy as np
+        results = {}
+        for category, latencies in self.latencies.items():
+            results[category] = {}
+            for name, values in sorted(latencies.items()):
+                percentiles = np.percentile(values.sample, PERCENTILES)
+                stats = {"calls": values.calls,
+                         "total": values.total,
+                         "mean": values.total/values.calls,
+                         "max": values.max}
+                for percentile, value in zip(PERCENTILES, percentiles):
+                    stats[f"p{percentile}"] = float(value)
+                results[category][name] = stats
+        results["caches"] = dict(self.caches)
+        return results
+
+    def to_json(self, path: str|None=None, indent: int=2) -> str:
+        """Return the results as JSON, also writing them to path if given"""
+        import json
+        text = json.dumps(self.to_dict(), indent=indent)
+        if path is not None:
+            with open(path, "w") as file:
+                file.write(text + "\n")
+        return text
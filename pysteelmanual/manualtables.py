@@ -0,0 +1,256 @@
+"""
+Precomputed design tables in the style of the AISC Steel Construction Manual
+
+ColumnCurve tabulates the nominal flexural buckling stress Fn (Equations E3-2
+to E3-4) against slenderness Lc/r for one yield stress and modulus, like
+Manual Table 4-14. The grid is built once with the vectorized Chapter E
+functions. Lookups then take a constant number of operations: linear
+interpolation between the two neighbouring grid points, for a single value or
+for an array of millions at once. Slenderness outside the table is evaluated
+with the exact equations.
+
+calc_axial_strength_table builds Manual Table 4-1-style available axial
+strength tables: every shape in a family over a grid of effective lengths,
+computed in one vectorized pass (shapes along one axis, lengths along the
+other) and written to CSV, .npy or .npz. Tables are in kips and feet by
+default, and in the force unit of any other unit system with lengths in a
+chosen unit.
+"""
+
+import csv
+from functools import cache
+from math import ceil, pi, sqrt
+from typing import Iterator
+import numpy as np
+from numpy.typing import ArrayLike
+from pysteelmanual.conversions import strength_factors, unit_value
+from pysteelmanual.materials import SteelMaterial, ASTM_A992_GR_50
+from pysteelmanual.shapetable import get_shape_table
+from pysteelmanual.steelcodes.aisc_360_22 import compression, members
+from pysteelmanual.units import UnitSystem, IN_KIP
+
+# Smallest grid spacing tried before a tolerance is considered unreachable
+MIN_STEP = 1e-4
+
+
+class ColumnCurve():
+    """Table of nominal flexural buckling stress Fn against slenderness Lc/r
+    for one yield stress and modulus of elasticity.
+
+    Fn is tabulated on a uniform grid with the E3-2/E3-3 transition
+    (Fy/Fe = 2.25) on a grid point. Each interval stores its own line, so the
+    small step between the two equations at the transition is kept exactly.
+    Intervals include their upper end, matching the use of E3-2 up to and
+    including the transition (within rounding of the transition slenderness
+    either equation may be used, as with the exact equations).
+
+    The spacing is refined from initial_step until linear interpolation agrees
+    with the exact equations within tolerance (relative to Fn) at the midpoint
+    of every interval, where interpolation error peaks. With the default
+    tolerance of 1e-6, tabulated values match the exact equations to at least
+    six significant figures. The achieved maximum relative error is stored in
+    max_error."""
+    def __init__(self,
+                 yield_stress: float,
+                 elastic_modulus: float,
+                 max_slenderness: float=200.0,
+                 tolerance: float=1e-6,
+                 initial_step: float=0.5,
+                 ):
+        self.yield_stress = yield_stress
+        self.elastic_modulus = elastic_modulus
+        self.max_slenderness = max_slenderness
+        self.tolerance = tolerance
+        # Fy/Fe = 2.25 at the transition between Equations E3-2 and E3-3
+        self.transition = pi*sqrt(2.25*elastic_modulus/yield_stress)
+        # The grid is anchored on the transition if it falls inside the table
+        anchor = min(self.transition, max_slenderness)
+        divisions = max(ceil(anchor/initial_step), 1)
+        while True:
+            step = anchor/divisions
+            intervals = ceil(max_slenderness/step - 1e-9)
+            lower = step*np.arange(intervals)
+            elastic = np.arange(intervals) >= divisions
+            if self.transition <= max_slenderness:
+                lower[divisions] = self.transition
+            start = self._stress(lower, elastic)
+            end = self._stress(lower + step, elastic)
+            middle = self._stress(lower + step/2, elastic)
+            max_error = float(np.max(np.abs((start + end)/2 - middle)/middle))
+            if max_error <= tolerance:
+                break
+            if step < MIN_STEP:
+                raise ValueError(f"Column curve tolerance {tolerance} cannot be met")
+            divisions *= 2
+        self.step = step
+        self.max_error = max_error
+        # Fn = intercept[i] + slope[i]*(Lc/r/step - i) in interval i
+        self.intercept = start
+        self.slope = end - start
+        self._scale = 1/step
+        if self.transition <= max_slenderness:
+            # Keep the transition itself in the last E3-2 interval
+            while self.transition*self._scale > divisions:
+                self._scale = float(np.nextafter(self._scale, 0.0))
+        self._last = intervals - 1
+        # Python floats for scalar lookups without NumPy overhead
+        self._intercept_list = start.tolist()
+        self._slope_list = self.slope.tolist()
+
+    def _stress(self, slenderness: np.ndarray, elastic: np.ndarray) -> np.ndarray:
+        """Equation E3-3 where elastic is set and E3-2 elsewhere, with Fe from
+        Equation E3-4"""
+        with np.errstate(divide="ignore"):
+            Fe = compression.calc_elastic_buckling_stress_batch(slenderness,
+                                                                self.elastic_modulus)
+            ratio = self.yield_stress/Fe
+        return np.where(elastic, 0.877*Fe, (0.658**ratio)*self.yield_stress)
+
+    def exact(self, slenderness: ArrayLike) -> np.ndarray:
+        """Evaluate Fn with the exact Chapter E equations"""
+        with np.errstate(divide="ignore"):
+            Fe = compression.calc_elastic_buckling_stress_batch(slenderness,
+                                                                self.elastic_modulus)
+        return compression.calc_nominal_flexural_buckling_stress_batch(Fe, self.yield_stress)
+
+    def nominal_stress(self, slenderness: ArrayLike) -> float|np.ndarray:
+        """Return Fn for a slenderness or an array of slenderness values"""
+        if isinstance(slenderness, (float, int)) or np.ndim(slenderness) == 0:
+            slenderness = float(slenderness)
+            if not 0 <= slenderness <= self.max_slenderness:
+                return float(self.exact(slenderness))
+            position = slenderness*self._scale
+            index = min(max(ceil(position) - 1, 0), self._last)
+            return self._intercept_list[index] + (position - index)*self._slope_list[index]
+        slenderness = np.asarray(slenderness, dtype=float)
+        position = slenderness*self._scale
+        index = np.ceil(position)
+        index -= 1
+        # fmax/fmin also map NaN to a valid index; NaN is handled below
+        np.fmin(np.fmax(index, 0, out=index), self._last, out=index)
+        index = index.astype(np.intp)
+        stress = self.slope[index]
+        stress *= position - index
+        stress += self.intercept[index]
+        outside = ~((slenderness >= 0) & (slenderness <= self.max_slenderness))
+        if outside.any():
+            stress[outside] = self.exact(slenderness[outside])
+        return stress
+
+    def available_stress(self, slenderness: ArrayLike,
+                         design_method: str="lrfd") -> float|np.ndarray:
+        """Return phi*Fn (LRFD), Fn/Omega (ASD) or Fn (nominal), as tabulated
+        in Manual Table 4-14"""
+        design_method = design_method.lower()
+        if design_method == "nominal":
+            return self.nominal_stress(slenderness)
+        elif design_method == "lrfd":
+            return compression.PHI_C*self.nominal_stress(slenderness)
+        elif design_method == "asd":
+            return self.nominal_stress(slenderness)/compression.OMEGA_C
+        raise ValueError(f"Invalid design method \"{design_method}\"")
+
+    __call__ = nominal_stress
+
+
+@cache
+def get_column_curve(yield_stress: float,
+                     elastic_modulus: float,
+                     max_slenderness: float=200.0,
+                     tolerance: float=1e-6,
+                     ) -> ColumnCurve:
+    """Return the ColumnCurve for a yield stress and modulus. Curves are
+    built on first use and cached."""
+    return ColumnCurve(yield_stress, elastic_modulus, max_slenderness, tolerance)
+
+
+###########################################################################
+# TABLE 4-1. AVAILABLE STRENGTH IN AXIAL COMPRESSION
+###########################################################################
+
+# Entries of an axial strength table other than the per-method strengths
+TABLE_KEYS = ("family", "shapes", "lengths", "length_unit", "force_unit")
+
+
+def calc_axial_strength_table(family: str="W_shapes",
+                              material: SteelMaterial=ASTM_A992_GR_50,
+                              lengths: ArrayLike=np.arange(0, 41),
+                              design_methods: tuple[str, ...]=("lrfd", "asd"),
+                              units: UnitSystem=IN_KIP,
+                              length_unit: str="ft",
+                              ) -> dict:
+    """Calculate the available axial compressive strength of every shape in
+    an AISC I-shape family over a range of effective lengths, as in Manual
+    Table 4-1. The effective length applies to buckling about both axes and
+    to torsional buckling (Lcx = Lcy = Lcz), and the strength is the least of
+    flexural buckling (E3), torsional buckling (E4) and local buckling of
+    slender elements (E7).
+
+    Shapes are taken from the family's table in units, which must also be
+    the units of the material. Lengths are in length_unit (feet by default)
+    and strengths in the force unit of units (kips by default).
+
+    Returns a dictionary with the shape designations ("shapes"), the lengths
+    ("lengths"), their units ("length_unit" and "force_unit") and, for each
+    design method, a (shape, length) array of available strengths."""
+    if family not in members.I_SHAPE_FAMILIES:
+        raise NotImplementedError(f"Axial strength tables are not implemented for {family}")
+    if material.units != units:
+        raise ValueError(f"Incompatible unit systems:\n\
+                            Table units: {units.label}\n\
+                            Material units: {material.units.label}")
+    table = get_shape_table(family, units)
+    lengths = np.asarray(lengths, dtype=float)
+    # Shapes along the first axis and lengths along the second
+    properties = {name: values[:, np.newaxis] for name, values in table.columns.items()}
+    Lc = lengths[np.newaxis, :]*(unit_value(length_unit)/unit_value(units.length))
+    strength = compression.calc_w_shape_compressive_capacity_batch(
+        properties, material.Fy, material.E, material.G, Lc, Lc)
+    Pn = strength["Pn"]*strength_factors(units)["force"]
+    results = {"family": family, "shapes": table.names, "lengths": lengths,
+               "length_unit": length_unit, "force_unit": units.force}
+    for design_method in design_methods:
+        results[design_method.lower()] = _available(Pn, design_method)
+    return results
+
+
+def _available(nominal_strength: np.ndarray, design_method: str) -> np.ndarray:
+    if design_method.lower() == "nominal":
+        return nominal_strength
+    elif design_method.lower() == "lrfd":
+        return compression.PHI_C*nominal_strength
+    elif design_method.lower() == "asd":
+        return nominal_strength/compression.OMEGA_C
+    raise ValueError(f"Invalid design method \"{design_method}\"")
+
+
+def iter_axial_strength_rows(table: dict, decimals: int|None=1) -> Iterator[list]:
+    """Yield the rows of an axial strength table: a header, then one row per
+    shape and design method with the strength at each length"""
+    methods = [key for key in table if key not in TABLE_KEYS]
+    yield ["shape", "design_method"] + [f"{length:g}" for length in table["lengths"]]
+    for row, shape in enumerate(table["shapes"]):
+        for method in methods:
+            values = table[method][row]
+            if decimals is not None:
+                values = np.round(values, decimals)
+            yield [str(shape), method] + values.tolist()
+
+
+def save_axial_strength_table(table: dict, path: str, decimals: int|None=1):
+    """Write an axial strength table to a file, by extension: ".csv" streams
+    the rows of iter_axial_strength_rows (rounded to decimals), ".npy" saves
+    a (design method, shape, length) array of strengths and ".npz" saves the
+    shapes, lengths, units and one array per design method."""
+    methods = [key for key in table if key not in TABLE_KEYS]
+    if path.endswith(".csv"):
+        with open(path, "w", newline="") as file:
+            csv.writer(file).writerows(iter_axial_strength_rows(table, decimals))
+    elif path.endswith(".npy"):
+        np.save(path, np.stack([table[method] for method in methods]))
+    elif path.endswith(".npz"):
+        np.savez(path, shapes=table["shapes"], lengths=table["lengths"],
+                 length_unit=table["length_unit"], force_unit=table["force_unit"],
+                 **{method: table[method] for method in methods})
+    else:
+        raise ValueError(f"Unsupported file type \"{path}\". Use .csv, .npy or .npz")
@@ -1,35 +1,39 @@
 from pysteelmanual.units import unit_systems
 from pysteelmanual.units import UnitSystem, IN_KIP, MM_KN
+from pysteelmanual.immutable import Immutable
+
+class SteelMaterial(Immutable):
+    """Class to hold steel material properties. Materials are immutable
+    and compare by value."""
+    __slots__ = ("Fy", "Fu", "E", "G", "gamma", "units")
 
-class SteelMaterial():
-    """Class to hold steel material properties"""
     def __init__(self, yield_stress: float,
                  ultimate_stress: float,
                  elastic_modulus: float=None,
                  shear_modulus: float=None,
                  unit_weight: float=None,
                  units: UnitSystem=IN_KIP):
-        self.Fy = yield_stress
-        self.Fu = ultimate_stress
+        properties = {"Fy": yield_stress, "Fu": ultimate_stress}
         if elastic_modulus:
-            self.E = elastic_modulus
+            properties["E"] = elastic_modulus
         elif units == IN_KIP:
-            self.E = 29000 # ksi
+            properties["E"] = 29000 # ksi
         elif units == MM_KN:
-            self.E = 200000 # MPa
+            properties["E"] = 200000 # MPa
         if shear_modulus:
-            self.G = shear_modulus
+            properties["G"] = shear_modulus
         elif units == IN_KIP:
-            self.G = 11200 # ksi
+            properties["G"] = 11200 # ksi
         elif units == MM_KN:
-            self.G = 77200 # MPa
+            properties["G"] = 77200 # MPa
         if unit_weight:
-            self.gamma = unit_weight
+            properties["gamma"] = unit_weight
         elif units == IN_KIP:
-            self.gamma = 0.000284 # kip/in^3
+            properties["gamma"] = 0.000284 # kip/in^3
         elif units == MM_KN:
-            self.gamma = 7.85e-8 # kN/mm^3
-        self.units = units
+            properties["gamma"] = 7.85e-8 # kN/mm^3
+        properties["units"] = units
+        self._init_attributes(**properties)
 
 
 ASTM_A36 = SteelMaterial(yield_stress=36, ultimate_stress=58)
@@ -0,0 +1,166 @@
+"""
+Parallel export of calculation reports
+
+Renders the Efficalc reports of many members (or any CalcRecord) across a
+process pool and writes each one to its own HTML file as soon as its chunk
+is rendered, together with an index page linking every report. Only a
+bounded number of chunks is in flight at a time and rendered HTML is not
+returned to the calling process, so memory does not grow with the number of
+reports.
+
+File names are derived from the labels in input order and the index lists
+reports in input order, so the output is identical for any number of
+workers. Errors are captured per report and listed in the index; a chunk
+that fails as a whole (e.g. a worker that dies) gives that error for each of
+its reports.
+"""
+
+import html
+import os
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Callable, Iterable
+from pysteelmanual.batch import chunk_outcomes, chunked, init_worker, submit_chunk
+from pysteelmanual.reports import CalcRecord
+
+
+def report_filename(label: str, used: set[str]) -> str:
+    """Return a file name (without extension) for a report label that is
+    not in used, and add it. Characters other than letters, digits, "-",
+    "_" and "." are replaced with "_", and repeated names get a numeric
+    suffix. Names are compared case-insensitively, for file systems that do."""
+    base = re.sub(r"[^A-Za-z0-9_.-]+", "_", str(label)).strip("._") or "report"
+    name = base
+    count = 1
+    while name.lower() in used:
+        count += 1
+        name = f"{base}_{count}"
+    used.add(name.lower())
+    return name
+
+
+def _render_chunk(folder: str, jobs: list[tuple[str, CalcRecord|None]]) -> list:
+    """Render and write the reports of a chunk. Returns the error for each
+    report, or None if it was written."""
+    outcomes = []
+    for filename, record in jobs:
+        try:
+            if record is None:
+                raise ValueError("Member has not been designed")
+            content = record.html()
+            path = os.path.join(folder, f"{filename}.html")
+            # Write to a temporary file so partially written reports are not left behind
+            with open(path + ".tmp", "w", encoding="utf-8") as file:
+                file.write(content)
+            os.replace(path + ".tmp", path)
+            outcomes.append(None)
+        except Exception as error:
+            outcomes.append(error)
+    return outcomes
+
+
+def _records(items: Iterable) -> Iterable[tuple[str, CalcRecord|None]]:
+    for item in items:
+        if isinstance(item, tuple):
+            yield item
+        else:
+            yield item.label, item.report_record
+
+
+def export_reports(items: Iterable,
+                   folder: str,
+                   workers: int|None=None,
+                   chunksize: int=8,
+                   max_pending: int|None=None,
+                   progress: Callable[[int, int|None], None]|None=None,
+                   index: str|None="index.html",
+                   title: str="Calculation Reports",
+                   ) -> dict:
+    """Write the calculation report of every item to an HTML file in folder.
+
+    items are designed SteelMember objects (their report_record is used) or
+    (label, CalcRecord) pairs, and may be a generator. workers defaults to
+    the CPU count; workers=0 renders in the calling process. At most
+    max_pending chunks (default two per worker) are rendered at once.
+    progress, if given, is called as progress(done, total) after each chunk,
+    with total None when items has no length. Unless index is None, an index
+    page linking the reports in input order is written to folder/index.
+
+    Returns a summary with the number of reports written ("written"), the
+    errors by report file name ("errors"; file names are unique, labels may
+    not be) and the index path ("index")."""
+    os.makedirs(folder, exist_ok=True)
+    total = len(items) if hasattr(items, "__len__") else None
+    # Keep reports from overwriting the index
+    used = {os.path.splitext(index)[0].lower()} if index else set()
+    jobs = ((label, report_filename(label, used), record) for label, record in _records(items))
+    summary = {"written": 0, "errors": {}, "index": None}
+    index_file = None
+    if index is not None:
+        summary["index"] = os.path.join(folder, index)
+        index_file = open(summary["index"], "w", encoding="utf-8")
+        index_file.write(_index_header(title))
+
+    def collect(chunk, outcomes):
+        for (label, filename, _), error in zip(chunk, outcomes):
+            if error is None:
+                summary["written"] += 1
+            else:
+                summary["errors"][filename] = error
+            if index_file is not None:
+                index_file.write(_index_row(label, filename, error))
+        done = summary["written"] + len(summary["errors"])
+        if progress is not None:
+            progress(done, total)
+
+    def render(chunk):
+        return [(filename, record) for _, filename, record in chunk]
+
+    try:
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers == 0:
+            for _, chunk in chunked(jobs, chunksize):
+                collect(chunk, _render_chunk(folder, render(chunk)))
+        else:
+            if max_pending is None:
+                max_pending = 2*workers
+            chunks = chunked(jobs, chunksize)
+            with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as pool:
+                def submit(chunk):
+                    return submit_chunk(pool, _render_chunk, folder, render(chunk)), chunk
+                pending = deque(submit(chunk) for _, chunk in islice(chunks, max_pending))
+                while pending:
+                    # Collected in input order, so the index does not depend on timing
+                    future, chunk = pending.popleft()
+                    collect(chunk, chunk_outcomes(future, len(chunk), lambda error: error))
+                    for _, next_chunk in islice(chunks, 1):
+                        pending.append(submit(next_chunk))
+        if index_file is not None:
+            index_file.write(_index_footer(summary))
+    finally:
+        if index_file is not None:
+            index_file.close()
+    return summary
+
+
+def _index_header(title: str) -> str:
+    return ("<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n"
+            f"<title>{html.escape(title)}</title>\n</head>\n<body>\n"
+            f"<h1>{html.escape(title)}</h1>\n<table>\n"
+            "<tr><th>Member</th><th>Report</th></tr>\n")
+
+
+def _index_row(label: str, filename: str, error: Exception|None) -> str:
+    if error is None:
+        link = f"<a href=\"{html.escape(filename)}.html\">{html.escape(filename)}.html</a>"
+    else:
+        link = f"Failed: {html.escape(f'{type(error).__name__}: {error}')}"
+    return f"<tr><td>{html.escape(str(label))}</td><td>{link}</td></tr>\n"
+
+
+def _index_footer(summary: dict) -> str:
+    return (f"</table>\n<p>{summary['written']} reports written, "
+            f"{len(summary['errors'])} failed.</p>\n</body>\n</html>\n")
@@ -0,0 +1,41 @@
+"""
+Deferred calculation reports
+
+Design runs evaluate capacities on plain floats. A CalcRecord keeps just the
+report function and the numeric inputs of a member's checks (section,
+material, geometry, design method, units and governing demands), which is
+cheap to hold for every member. The Efficalc calculation trace is only built
+when a report is requested, and is the same as building it during the design
+run.
+"""
+
+from typing import Callable
+
+
+class CalcRecord():
+    """Report function and the inputs needed to rebuild a calculation report"""
+    __slots__ = ("function", "inputs")
+
+    def __init__(self, function: Callable, **inputs):
+        self.function = function
+        self.inputs = inputs
+
+    def run(self):
+        """Create the Efficalc objects for the report. Used as the calculation
+        function for Efficalc's ReportBuilder."""
+        self.function(**self.inputs)
+
+    def report_builder(self):
+        """Return an Efficalc ReportBuilder for the report. Efficalc is
+        imported here so that importing the package does not load it."""
+        from efficalc.report_builder import ReportBuilder
+        return ReportBuilder(self.run)
+
+    def html(self) -> str:
+        """Build the calculation report as a complete HTML document"""
+        return self.report_builder().get_html_as_str()
+
+    def save(self, folder: str, filename: str="calc_report") -> str:
+        """Build the calculation report and save it as an HTML file.
+        Returns the file path."""
+        return self.report_builder().save_report(folder, filename)
@@ -0,0 +1,246 @@
+"""
+Persistent cache of member design results
+
+Results are stored in a SQLite database keyed by a content hash of
+everything that determines them: section, material, length, design_props,
+force_actions, design code, design method, units and the library version.
+The member label is not part of the key, so identical members share an
+entry. Passing a ResultCache to SteelMember.design_member or
+batch.design_members reuses stored results, so re-running a model only
+designs members whose inputs changed since the last run.
+
+The database records the library version it was written with and is
+cleared when opened by a different version. The version includes the
+design code version (members.CODE_VERSION), which is bumped with changes
+to the strength code, so results are not reused across such changes even
+when the package version stays the same. Entries beyond max_entries are
+evicted least recently used first.
+"""
+
+import hashlib
+import json
+import sqlite3
+import struct
+from importlib.metadata import version, PackageNotFoundError
+from pysteelmanual.immutable import Immutable
+from pysteelmanual.steelcodes.aisc_360_22 import members
+
+# Bump when the key or stored result format changes
+SCHEMA = 1
+
+
+def library_version() -> str:
+    """Version string covering the design code and the shape database"""
+    versions = []
+    for package in ("pysteelmanual", "steelpy"):
+        try:
+            versions.append(f"{package} {version(package)}")
+        except PackageNotFoundError:
+            versions.append(f"{package} unknown")
+    versions.append(f"aisc_360_22 code {members.CODE_VERSION}")
+    return f"{'; '.join(versions)}; schema {SCHEMA}"
+
+
+def _canonical(value):
+    """Convert a section, material or unit system to JSON-serializable values
+    with a stable form"""
+    if getattr(value, "family", None) is not None:
+        # AISC shapes are fully determined by their family and designation
+        return ["AISCShape", value.family, value.label]
+    if isinstance(value, Immutable):
+        return [type(value).__name__,
+                {name: _canonical(getattr(value, name, None)) for name in value._fields()}]
+    return value
+
+
+# id -> (object, canonical text). Models reuse a few sections, materials and
+# unit systems, so their canonical forms are memoized by identity; the object
+# is kept so its id cannot be reused while the entry exists.
+_CANONICAL_TEXT = {}
+
+
+def _canonical_text(value: Immutable) -> str:
+    entry = _CANONICAL_TEXT.get(id(value))
+    if entry is not None and entry[0] is value:
+        return entry[1]
+    if len(_CANONICAL_TEXT) >= 4096:
+        _CANONICAL_TEXT.clear()
+    text = json.dumps(_canonical(value), sort_keys=True, separators=(",", ":"), default=repr)
+    _CANONICAL_TEXT[id(value)] = (value, text)
+    return text
+
+
+def _mapping_bytes(mapping: dict) -> bytes:
+    """Canonical binary form of a {name: {key: number}} mapping such as
+    force_actions or design_props. Numbers are packed as doubles, so 120 and
+    120.0 give the same bytes; other values are hashed by repr."""
+    parts = []
+    for name in sorted(mapping, key=str):
+        inner = mapping[name]
+        parts.append(str(name).encode())
+        if isinstance(inner, dict):
+            keys = sorted(inner, key=str)
+            parts.append("\x1f".join(map(str, keys)).encode())
+            values = [inner[key] for key in keys]
+            try:
+                parts.append(struct.pack(f"<{len(values)}d", *values))
+            except struct.error:
+                parts.append(repr(values).encode())
+        else:
+            parts.append(repr(inner).encode())
+    # Length prefixes keep the encoding unambiguous
+    return b"".join(b"%d:%s" % (len(part), part) for part in parts)
+
+
+def member_key(member, library: str|None=None) -> str:
+    """Return the content hash of the inputs that determine a member's results"""
+    text = "|".join([_canonical_text(member.section),
+                     _canonical_text(member.material),
+                     _canonical_text(member.units),
+                     repr(float(member.length)),
+                     member.design_code,
+                     member.design_method,
+                     library or library_version()])
+    digest = hashlib.sha256(text.encode())
+    digest.update(_mapping_bytes(member.design_props))
+    digest.update(b"|")
+    digest.update(_mapping_bytes(member.force_actions))
+    return digest.hexdigest()
+
+
+class ResultCache():
+    """SQLite-backed cache of member design results with least-recently-used
+    eviction and hit/miss/eviction counters. Writes are committed in batches
+    of commit_every and when the cache is closed; use it as a context manager
+    to close it automatically."""
+    def __init__(self, path: str, max_entries: int=1_000_000,
+                 library: str|None=None, commit_every: int=1000):
+        self.path = path
+        self.max_entries = max_entries
+        self.library = library or library_version()
+        self.commit_every = commit_every
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._pending = 0
+        self._touched = {}
+        self._connection = sqlite3.connect(path)
+        self._connection.executescript(
+            "CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT);"
+            "CREATE TABLE IF NOT EXISTS results ("
+            "key TEXT PRIMARY KEY, results TEXT NOT NULL, last_used INTEGER NOT NULL);"
+            "CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used);")
+        row = self._connection.execute(
+            "SELECT value FROM meta WHERE name = 'version'").fetchone()
+        if row is None or row[0] != self.library:
+            # Results from another library version may differ
+            self._connection.execute("DELETE FROM results")
+            self._connection.execute(
+                "INSERT OR REPLACE INTO meta (name, value) VALUES ('version', ?)",
+                (self.library,))
+            self._connection.commit()
+        self._size, clock = self._connection.execute(
+            "SELECT COUNT(*), MAX(last_used) FROM results").fetchone()
+        # Access counter used to order entries for eviction
+        self._clock = clock or 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def key(self, member) -> str:
+        """Return the cache key of a member"""
+        return member_key(member, self.library)
+
+    def get(self, key: str) -> dict|None:
+        """Return the stored results for key, or None on a miss"""
+        row = self._connection.execute(
+            "SELECT results FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        # Access times are written with the next commit
+        self._touched[key] = self._tick()
+        self._written()
+        return json.loads(row[0])
+
+    def put(self, key: str, results: dict):
+        """Store the results for key, evicting old entries if needed"""
+        self._touched.pop(key, None)
+        exists = self._connection.execute(
+            "SELECT 1 FROM results WHERE key = ?", (key,)).fetchone()
+        self._connection.execute(
+            "INSERT OR REPLACE INTO results (key, results, last_used) VALUES (?, ?, ?)",
+            (key, json.dumps(results), self._tick()))
+        if exists is None:
+            self._size += 1
+            self._evict()
+        self._written()
+
+    def resize(self, max_entries: int):
+        """Change the maximum number of entries, evicting as needed"""
+        self.max_entries = max_entries
+        self._evict()
+        self._written()
+
+    def clear(self):
+        """Remove all entries and reset the counters"""
+        self._touched.clear()
+        self._connection.execute("DELETE FROM results")
+        self._connection.commit()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> dict:
+        """Return the cache counters as a dictionary. hits counts members
+        whose results were reused and misses members that were designed."""
+        lookups = self.hits + self.misses
+        return {"hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": self._size,
+                "maxsize": self.max_entries,
+                "hit_rate": self.hits/lookups if lookups else 0.0}
+
+    def commit(self):
+        self._flush_touched()
+        self._connection.commit()
+        self._pending = 0
+
+    def close(self):
+        self.commit()
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _tick(self) -> int:
+        self._clock += 1
+        return self._clock
+
+    def _written(self):
+        self._pending += 1
+        if self._pending >= self.commit_every:
+            self.commit()
+
+    def _flush_touched(self):
+        if self._touched:
+            self._connection.executemany(
+                "UPDATE results SET last_used = ? WHERE key = ?",
+                [(clock, key) for key, clock in self._touched.items()])
+            self._touched.clear()
+
+    def _evict(self):
+        excess = self._size - self.max_entries
+        if excess > 0:
+            self._flush_touched()
+            self._connection.execute(
+                "DELETE FROM results WHERE key IN "
+                "(SELECT key FROM results ORDER BY last_used LIMIT ?)", (excess,))
+            self._size -= excess
+            self.evictions += excess
@@ -0,0 +1,282 @@
+"""
+Columnar store of member design results
+
+A ResultStore holds the results of many members as NumPy arrays: one row per
+member and, for each limit state, a capacity, demand and ratio column plus
+the governing load combination as an integer code into a shared table of
+combination names. Compared with a results dictionary per member, this takes
+a few dozen bytes per member and limit state, and filtering, sorting and
+aggregation run as array operations. Limit states a member does not check
+are NaN (combination code -1).
+
+batch.design_members writes into a store passed as store=. Per-member
+dictionaries in the SteelMember.results layout are built on request with
+store[label] or store.results(row).
+"""
+
+import copy
+import csv
+from typing import Iterable
+import numpy as np
+from pysteelmanual.conversions import conversion_factors
+from pysteelmanual.steelcodes.aisc_360_22.members import LIMIT_STATES, LIMIT_STATE_QUANTITIES
+from pysteelmanual.units import UnitSystem
+
+# Float columns stored for each limit state
+FIELDS = ("capacity", "demand", "ratio")
+
+
+class ResultStore():
+    """Array-backed results of many members, one row per member label.
+    Adding results for a label already in the store replaces its row."""
+    def __init__(self, limit_states: Iterable[str]=LIMIT_STATES, capacity: int=1024):
+        self.limit_states = []
+        self.labels = []
+        self.errors = {}
+        self.combinations = []
+        self._rows = {}
+        self._codes = {}
+        self._size = 0
+        self._capacity = max(capacity, 1)
+        self._columns = {}
+        for limit_state in limit_states:
+            self._add_limit_state(limit_state)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, label: str) -> bool:
+        return label in self._rows
+
+    def _add_limit_state(self, limit_state: str):
+        self.limit_states.append(limit_state)
+        for field in FIELDS:
+            self._columns[limit_state, field] = np.full(self._capacity, np.nan)
+        self._columns[limit_state, "combination"] = np.full(self._capacity, -1, dtype=np.int32)
+
+    def _grow(self):
+        self._capacity *= 2
+        for key, column in self._columns.items():
+            grown = np.full(self._capacity, -1 if column.dtype == np.int32 else np.nan,
+                            dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            self._columns[key] = grown
+
+    def _code(self, combination: str|None) -> int:
+        if combination is None:
+            return -1
+        code = self._codes.get(combination)
+        if code is None:
+            code = self._codes[combination] = len(self.combinations)
+            self.combinations.append(combination)
+        return code
+
+    ###########################################################################
+    # WRITING
+    ###########################################################################
+
+    def add(self, label: str, results: dict|None, error: Exception|None=None) -> int:
+        """Store a member's results (in the SteelMember.results layout), or
+        the error that stopped its design, and return its row"""
+        row = self._rows.get(label)
+        if row is None:
+            if self._size == self._capacity:
+                self._grow()
+            row = self._rows[label] = self._size
+            self.labels.append(label)
+            self._size += 1
+        else:
+            for key, column in self._columns.items():
+                column[row] = -1 if column.dtype == np.int32 else np.nan
+        self.errors.pop(label, None)
+        if error is not None:
+            self.errors[label] = error
+            return row
+        for limit_state, result in results.items():
+            if (limit_state, "ratio") not in self._columns:
+                self._add_limit_state(limit_state)
+            for field in FIELDS:
+                self._columns[limit_state, field][row] = result[field]
+            self._columns[limit_state, "combination"][row] = self._code(result["combination"])
+        return row
+
+    def add_batch(self, batch_results: Iterable) -> "ResultStore":
+        """Store the results of batch.design_members"""
+        for result in batch_results:
+            self.add(result.member.label, result.results, result.error)
+        return self
+
+    ###########################################################################
+    # READING
+    ###########################################################################
+
+    def row(self, label: str) -> int:
+        try:
+            return self._rows[label]
+        except KeyError:
+            raise KeyError(f"No results for member \"{label}\"") from None
+
+    def results(self, row: int) -> dict:
+        """Return the results of a row in the SteelMember.results layout"""
+        if not 0 <= row < self._size:
+            raise IndexError(f"Row {row} out of range for {self._size} members")
+        results = {}
+        for limit_state in self.limit_states:
+            if np.isnan(self._columns[limit_state, "capacity"][row]):
+                continue
+            code = int(self._columns[limit_state, "combination"][row])
+            results[limit_state] = {field: float(self._columns[limit_state, field][row])
+                                    for field in FIELDS}
+            results[limit_state]["combination"] = self.combinations[code] if code >= 0 else None
+        return results
+
+    def __getitem__(self, label: str) -> dict:
+        return self.results(self.row(label))
+
+    def column(self, limit_state: str, field: str="ratio") -> np.ndarray:
+        """Return a read-only view of one column, one value per row. The
+        "combination" column holds integer codes into combinations."""
+        if (limit_state, field) not in self._columns:
+            raise ValueError(f"No column \"{field}\" for limit state \"{limit_state}\"")
+        view = self._columns[limit_state, field][:self._size]
+        view.flags.writeable = False
+        return view
+
+    def combination_names(self, limit_state: str) -> np.ndarray:
+        """Return the governing load combination of each row as an array of
+        names (None where the limit state was not checked)"""
+        names = np.array(self.combinations + [None], dtype=object)
+        return names[self.column(limit_state, "combination")]
+
+    def governing_combination(self, label: str, limit_state: str) -> str|None:
+        code = int(self.column(limit_state, "combination")[self.row(label)])
+        return self.combinations[code] if code >= 0 else None
+
+    def select(self, rows: np.ndarray) -> list[str]:
+        """Return the member labels of rows (indices or a boolean mask)"""
+        rows = np.asarray(rows)
+        if rows.dtype == bool:
+            rows = np.flatnonzero(rows)
+        return [self.labels[row] for row in rows.tolist()]
+
+    def filter(self, limit_state: str, field: str="ratio",
+               above: float|None=None, below: float|None=None,
+               combination: str|None=None) -> np.ndarray:
+        """Return the rows where a limit state's field is strictly above
+        and/or below the given values and, if given, the governing
+        combination is combination. Rows that do not check the limit state
+        are excluded."""
+        values = self.column(limit_state, field)
+        mask = ~np.isnan(values)
+        if above is not None:
+            mask &= values > above
+        if below is not None:
+            mask &= values < below
+        if combination is not None:
+            mask &= self.column(limit_state, "combination") == self._codes.get(combination, -2)
+        return np.flatnonzero(mask)
+
+    def sort(self, limit_state: str, field: str="ratio", descending: bool=True) -> np.ndarray:
+        """Return the rows ordered by a limit state's field, with rows that
+        do not check the limit state last"""
+        values = self.column(limit_state, field)
+        return np.argsort(-values if descending else values, kind="stable")
+
+    def governing(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return the largest ratio of each row over all limit states and
+        the index into limit_states of the limit state giving it (-1 for rows
+        without results)"""
+        if not self.limit_states:
+            return np.full(self._size, np.nan), np.full(self._size, -1)
+        ratios = np.column_stack([self.column(limit_state) for limit_state in self.limit_states])
+        checked = ~np.isnan(ratios)
+        index = np.argmax(np.where(checked, ratios, -np.inf), axis=1)
+        ratio = ratios[np.arange(self._size), index]
+        has_results = checked.any(axis=1)
+        return np.where(has_results, ratio, np.nan), np.where(has_results, index, -1)
+
+    def aggregate(self, limit_state: str, field: str="ratio") -> dict:
+        """Return the count, minimum, maximum, mean and sum of a limit
+        state's field over the rows that check it"""
+        values = self.column(limit_state, field)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return {"count": 0, "min": np.nan, "max": np.nan, "mean": np.nan, "sum": 0.0}
+        return {"count": len(values),
+                "min": float(values.min()),
+                "max": float(values.max()),
+                "mean": float(values.mean()),
+                "sum": float(values.sum())}
+
+    def summary(self, field: str="ratio") -> dict[str, dict]:
+        """Return aggregate() of a field for every limit state"""
+        return {limit_state: self.aggregate(limit_state, field)
+                for limit_state in self.limit_states}
+
+    def convert_units(self, from_units: UnitSystem, to_units: UnitSystem) -> "ResultStore":
+        """Return a copy of the store with capacities and demands converted
+        to another unit system, one column at a time"""
+        factors = conversion_factors(from_units, to_units)
+        store = copy.copy(self)
+        store._columns = dict(self._columns)
+        store.labels = list(self.labels)
+        store.errors = dict(self.errors)
+        store.combinations = list(self.combinations)
+        store._rows = dict(self._rows)
+        store._codes = dict(self._codes)
+        store.limit_states = list(self.limit_states)
+        for (limit_state, field), column in self._columns.items():
+            if field in ("capacity", "demand"):
+                column = column*factors[LIMIT_STATE_QUANTITIES[limit_state]]
+            else:
+                column = column.copy()
+            store._columns[limit_state, field] = column
+        return store
+
+    ###########################################################################
+    # EXPORT
+    ###########################################################################
+
+    def to_csv(self, path: str):
+        """Write one row per member with the capacity, demand, ratio and
+        governing combination of each limit state and any design error"""
+        columns = [(limit_state, field) for limit_state in self.limit_states
+                   for field in FIELDS + ("combination",)]
+        values = [self.combination_names(limit_state).tolist() if field == "combination"
+                  else self.column(limit_state, field).tolist()
+                  for limit_state, field in columns]
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["label"] + [f"{limit_state}_{field}"
+                                         for limit_state, field in columns] + ["error"])
+            for row, label in enumerate(self.labels):
+                cells = [column[row] for column in values]
+                cells = ["" if cell is None or cell != cell else cell for cell in cells]
+                error = self.errors.get(label)
+                writer.writerow([label] + cells + ["" if error is None else repr(error)])
+
+    def to_npz(self, path: str):
+        """Save the labels, combination names and every column to a .npz
+        file (errors are not saved)"""
+        arrays = {f"{limit_state}.{field}": self.column(limit_state, field)
+                  for limit_state, field in self._columns}
+        np.savez(path, labels=np.array(self.labels, dtype=str),
+                 combinations=np.array(self.combinations, dtype=str), **arrays)
+
+    @classmethod
+    def from_npz(cls, path: str) -> "ResultStore":
+        """Load a store saved with to_npz"""
+        with np.load(path) as data:
+            names = [name for name in data.files if "." in name]
+            limit_states = list(dict.fromkeys(name.split(".")[0] for name in names))
+            labels = data["labels"].tolist()
+            store = cls(limit_states, capacity=len(labels))
+            store.labels = labels
+            store._rows = {label: row for row, label in enumerate(labels)}
+            store.combinations = data["combinations"].tolist()
+            store._codes = {name: code for code, name in enumerate(store.combinations)}
+            store._size = len(labels)
+            for name in names:
+                limit_state, field = name.split(".")
+                store._columns[limit_state, field][:store._size] = data[name]
+        return store
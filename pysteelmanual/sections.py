@@ -1,45 +1,62 @@
-from steelpy import aisc
+from functools import cache
 from .units import unit_systems
 from math import pi, sqrt
 from pysteelmanual.units import UnitSystem, IN_KIP, MM_KN
+from pysteelmanual.immutable import Immutable
 
-AISC_W_SECTIONS = aisc.profiles["W_shapes"]
 
+@cache
+def get_aisc_profiles() -> dict:
+    """Return the steelpy AISC shape database, keyed by shape family
+    (e.g. "W_shapes"). The database is loaded on first call and cached,
+    so importing pysteelmanual does not pay for it."""
+    from steelpy import aisc
+    return aisc.profiles
+
+
+def __getattr__(name):
+    # AISC_W_SECTIONS used to be loaded at import time; keep it available
+    # as a lazily loaded module attribute.
+    if name == "AISC_W_SECTIONS":
+        return get_aisc_profiles()["W_shapes"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class SteelSection(Immutable):
+    """Generic base class for steel sections. Sections are immutable and
+    compare by value."""
+    __slots__ = ("units",)
 
-class SteelSection():
-    """Generic base class for steel sections"""
     def __init__(self):
-        self.units = None
+        self._init_attributes(units=None)
 
 class RoundBar(SteelSection):
     """Class for round bar section object"""
+    __slots__ = ("D", "R", "area", "Ix", "Iy", "rx", "ry", "Sx", "Sy", "Zx", "Zy", "label")
+
     def __init__(self, diameter: float, label: str="", units: UnitSystem=IN_KIP):
-        self.D = diameter
-        self.R = diameter/2
-        self.area = pi * self.R**2
-        self.Ix = pi * self.R**4 / 4
-        self.Iy = pi * self.R**4 / 4
-        self.rx = sqrt(self.Ix/self.area)
-        self.ry = sqrt(self.Iy/self.area)
-        self.Sx = pi * self.D**3 / 32
-        self.Sy = pi * self.D**3 / 32
-        self.Zx = 4 * self.R**3 / 3
-        self.Zy = 4 * self.R**3 / 3
-        self.units = units
+        R = diameter/2
+        area = pi * R**2
+        Ix = pi * R**4 / 4
+        Iy = pi * R**4 / 4
+        self._init_attributes(D=diameter, R=R, area=area, Ix=Ix, Iy=Iy,
+                              rx=sqrt(Ix/area), ry=sqrt(Iy/area),
+                              Sx=pi * diameter**3 / 32, Sy=pi * diameter**3 / 32,
+                              Zx=4 * R**3 / 3, Zy=4 * R**3 / 3,
+                              units=units)
         if label:
-            self.label = label
+            self._init_attributes(label=label)
         else:
-            self.label = f"{diameter}-{units.length} Ø Round Bar"
+            self._init_attributes(label=f"{diameter}-{units.length} Ø Round Bar")
 
 
 class RectBar(SteelSection):
     """Class for rectangular bar section object"""
+    __slots__ = ("b", "h", "area", "Ix", "Iy", "rx", "ry")
+
     def __init__(self, width: float, height: float, units: UnitSystem=IN_KIP):
-        self.b = width
-        self.h = height
-        self.area = width * height
-        self.Ix = 1/12 * width * height**3
-        self.Iy = 1/12 * height * width**3
-        self.rx = sqrt(self.Ix/self.area)
-        self.ry = sqrt(self.Iy/self.area)
-        self.units = units
\ No newline at end of file
+        area = width * height
+        Ix = 1/12 * width * height**3
+        Iy = 1/12 * height * width**3
+        self._init_attributes(b=width, h=height, area=area, Ix=Ix, Iy=Iy,
+                              rx=sqrt(Ix/area), ry=sqrt(Iy/area), units=units)
\ No newline at end of file
@@ -0,0 +1,254 @@
+"""
+Columnar tables of AISC shape properties
+
+The AISC shape database distributed with steelpy is read directly from its CSV
+files into one NumPy array per property. Sort indexes are precomputed for every
+property, so range queries are answered with binary searches and boolean masks
+instead of scanning Python objects, and designations are looked up through a
+dictionary. Reading the CSV files directly also avoids importing steelpy and
+pandas, which parse the whole database row by row.
+
+All AISC shape properties are in the in-kip unit system, with weight in lb/ft.
+Tables converted to other unit systems are built from the in-kip tables and
+cached per unit system (see get_shape_table).
+"""
+
+import copy
+import csv
+import os
+from functools import cache
+from importlib.util import find_spec
+import numpy as np
+from pysteelmanual.conversions import SHAPE_PROPERTY_QUANTITIES, conversion_factors
+from pysteelmanual.instrumentation import instrumented, register_cache
+from pysteelmanual.sections import SteelSection
+from pysteelmanual.units import UnitSystem, IN_KIP
+
+
+def _shape_file_directory() -> str:
+    """Locate the AISC shape CSV files installed with steelpy without
+    importing steelpy itself."""
+    spec = find_spec("steelpy")
+    if spec is None or not spec.submodule_search_locations:
+        raise ModuleNotFoundError("steelpy is required for the AISC shape database")
+    return os.path.join(spec.submodule_search_locations[0], "shape files")
+
+
+@cache
+def list_shape_families() -> tuple[str, ...]:
+    """Return the names of the available AISC shape families, e.g. "W_shapes"."""
+    directory = _shape_file_directory()
+    return tuple(sorted(file[:-4] for file in os.listdir(directory)
+                        if file.endswith(".csv")))
+
+
+class ShapeTable():
+    """Array-backed table of section properties for one AISC shape family.
+
+    Each property is stored as a float array in ``columns``; missing values
+    are NaN. ``names`` holds the shape designations in database order."""
+    def __init__(self, family: str, names: list[str],
+                 columns: dict[str, np.ndarray],
+                 units: UnitSystem=IN_KIP):
+        self.family = family
+        self.names = np.array(names)
+        self.columns = columns
+        self.units = units
+        self._rows = {name: row for row, name in enumerate(names)}
+        # Stable sort keeps database order for ties; NaN values sort last.
+        self._order = {prop: np.argsort(values, kind="stable")
+                       for prop, values in columns.items()}
+        self._sorted = {prop: values[self._order[prop]]
+                        for prop, values in columns.items()}
+        self._valid = {prop: int(np.count_nonzero(~np.isnan(values)))
+                       for prop, values in columns.items()}
+
+    @classmethod
+    def from_csv(cls, family: str, path: str) -> "ShapeTable":
+        """Build a table from a steelpy shape CSV file"""
+        with open(path, newline="", encoding="utf-8") as file:
+            reader = csv.reader(file)
+            header = next(reader)
+            rows = [row for row in reader if row]
+        names = [row[0] for row in rows]
+        columns = {}
+        for i, prop in enumerate(header[1:], start=1):
+            values = np.empty(len(rows))
+            for j, row in enumerate(rows):
+                try:
+                    values[j] = float(row[i])
+                except ValueError:
+                    values[j] = np.nan  # e.g. "–" for gages that do not apply
+            columns[prop] = values
+        return cls(family, names, columns)
+
+    def convert(self, units: UnitSystem) -> "ShapeTable":
+        """Return a copy of the table with properties in another unit system
+        (see conversions.SHAPE_PROPERTY_QUANTITIES). Each column is scaled by
+        one factor, which keeps its sort order, so the sort indexes are
+        shared rather than rebuilt."""
+        if units == self.units:
+            return self
+        factors = conversion_factors(self.units, units)
+        scales = {prop: factors[SHAPE_PROPERTY_QUANTITIES[prop]]
+                  for prop in self.columns if prop in SHAPE_PROPERTY_QUANTITIES}
+        table = copy.copy(self)
+        table.units = units
+        table.columns = {prop: values*scales[prop] if prop in scales else values
+                         for prop, values in self.columns.items()}
+        table._sorted = {prop: values*scales[prop] if prop in scales else values
+                         for prop, values in self._sorted.items()}
+        return table
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, designation: str) -> bool:
+        return _normalize(designation) in self._rows
+
+    def __getitem__(self, designation: str) -> "AISCShape":
+        return AISCShape(self, self.row(designation))
+
+    def __iter__(self):
+        return (AISCShape(self, row) for row in range(len(self)))
+
+    @property
+    def properties(self) -> tuple[str, ...]:
+        return tuple(self.columns)
+
+    def row(self, designation: str) -> int:
+        """Return the row index of a shape designation"""
+        try:
+            return self._rows[_normalize(designation)]
+        except KeyError:
+            raise KeyError(f"{designation} is not in {self.family}") from None
+
+    @instrumented("lookups")
+    def select(self, criteria: dict[str, dict[str, float]]={},
+               sort_by: str|None="weight") -> np.ndarray:
+        """Return row indices of shapes meeting the criteria.
+
+        Criteria follow steelpy's ``Profile.filter`` format, e.g.
+        ``{"ry": {"min": 2.0}, "weight": {"max": 50}}``. Bounds are inclusive
+        and shapes with a missing (NaN) value for a filtered property are
+        excluded. Rows are returned sorted by ``sort_by`` (database order if
+        None), with ties kept in database order."""
+        mask = np.ones(len(self), dtype=bool)
+        for prop, bounds in criteria.items():
+            self._check_property(prop)
+            sorted_values = self._sorted[prop]
+            lower = 0
+            upper = self._valid[prop]
+            if "min" in bounds:
+                lower = np.searchsorted(sorted_values[:upper], bounds["min"], "left")
+            if "max" in bounds:
+                upper = np.searchsorted(sorted_values[:upper], bounds["max"], "right")
+            in_range = np.zeros(len(self), dtype=bool)
+            in_range[self._order[prop][lower:upper]] = True
+            mask &= in_range
+        if sort_by is None:
+            return np.flatnonzero(mask)
+        self._check_property(sort_by)
+        order = self._order[sort_by]
+        return order[mask[order]]
+
+    def filter(self, criteria: dict[str, dict[str, float]]={},
+               sort_by: str|None="weight") -> dict[str, "AISCShape"]:
+        """Return a dictionary of shapes meeting the criteria, keyed by
+        designation. Same interface as steelpy's ``Profile.filter``."""
+        return {str(self.names[row]): AISCShape(self, row)
+                for row in self.select(criteria, sort_by)}
+
+    def _check_property(self, prop: str):
+        if prop not in self.columns:
+            raise KeyError(f"{self.family} has no property \"{prop}\". "
+                           f"Available properties: {self.properties}")
+
+
+class AISCShape(SteelSection):
+    """Section object for one row of a ShapeTable.
+
+    Properties (area, Ix, Iy, rx, ry, Sx, Zx, J, Cw, weight, ...) are read
+    from the table columns on access, so the object itself only holds a
+    reference to the table and a row index."""
+    __slots__ = ("table", "row")
+
+    def __init__(self, table: ShapeTable, row: int):
+        self._init_attributes(table=table, row=row, units=table.units)
+
+    @property
+    def label(self) -> str:
+        return str(self.table.names[self.row])
+
+    @property
+    def family(self) -> str:
+        return self.table.family
+
+    @instrumented("lookups")
+    def __getattr__(self, name):
+        if name in AISCShape._fields():
+            raise AttributeError(name)
+        try:
+            return float(self.table.columns[name][self.row])
+        except KeyError:
+            raise AttributeError(f"{self.label} has no property \"{name}\"") from None
+
+    def __eq__(self, other):
+        if not isinstance(other, AISCShape):
+            return NotImplemented
+        return self.table is other.table and self.row == other.row
+
+    def __hash__(self):
+        return hash((self.table.family, self.row))
+
+    def __repr__(self):
+        return f"AISCShape({self.label!r})"
+
+    def __reduce__(self):
+        # Pickle by designation so worker processes do not receive a copy
+        # of the whole table.
+        if self.table.units == IN_KIP:
+            return (get_shape, (self.label, self.table.family))
+        return (get_shape, (self.label, self.table.family, self.table.units))
+
+
+def _normalize(designation: str) -> str:
+    return designation.strip().upper().replace(" ", "")
+
+
+@cache
+def get_shape_table(family: str="W_shapes", units: UnitSystem=IN_KIP) -> ShapeTable:
+    """Return the ShapeTable for an AISC shape family, in a unit system.
+    Tables are built on first use and cached, so each family is converted
+    to a unit system only once."""
+    if units != IN_KIP:
+        return get_shape_table(family).convert(units)
+    if family not in list_shape_families():
+        raise KeyError(f"Unknown shape family \"{family}\". "
+                       f"Available families: {list_shape_families()}")
+    path = os.path.join(_shape_file_directory(), f"{family}.csv")
+    return ShapeTable.from_csv(family, path)
+
+
+@cache
+def _designation_index() -> dict[str, str]:
+    return {name: family
+            for family in list_shape_families()
+            for name in get_shape_table(family)._rows}
+
+
+@instrumented("lookups")
+def get_shape(designation: str, family: str|None=None,
+              units: UnitSystem=IN_KIP) -> AISCShape:
+    """Look up an AISC shape by designation, e.g. "W8X10". The family is
+    found automatically unless given. Properties are in units (in-kip by
+    default), from the cached converted table."""
+    if family is None:
+        try:
+            family = _designation_index()[_normalize(designation)]
+        except KeyError:
+            raise KeyError(f"{designation} is not in the AISC shape database") from None
+    return get_shape_table(family, units)[designation]
+
+
+register_cache("shape_tables", lambda: get_shape_table.cache_info()._asdict())
@@ -0,0 +1,128 @@
+"""
+Automatic selection of the lightest adequate section from an AISC shape family
+
+Candidates are taken from a ShapeTable in order of increasing weight, so the
+first adequate shape is the lightest one and the search stops there. Before
+any full check, shapes are screened in one vectorized pass against upper
+bounds on their strength: the yield or flexural buckling strength in
+compression (E4 and E7 can only reduce it) and the plastic moment in flexure.
+Shapes that cannot pass a bound are never fully evaluated.
+"""
+
+import numpy as np
+from pysteelmanual.conversions import strength_factors
+from pysteelmanual.units import UnitSystem, IN_KIP
+from pysteelmanual.materials import SteelMaterial, ASTM_A992_GR_50
+from pysteelmanual.shapetable import AISCShape, get_shape_table
+from pysteelmanual.steelcodes.aisc_360_22 import compression, flexure, members
+
+
+def _strength_factor(design_method: str, phi: float, omega: float) -> float:
+    """Factor converting nominal strength to available strength"""
+    if design_method == "nominal":
+        return 1.0
+    elif design_method == "lrfd":
+        return phi
+    elif design_method == "asd":
+        return 1/omega
+    raise ValueError(f"Invalid design method \"{design_method}\"")
+
+
+def calc_strength_bounds(table, material: SteelMaterial, length: float,
+                         design_props: dict, design_method: str="lrfd",
+                         ) -> dict[str, np.ndarray]:
+    """Return upper bounds on the available strength of every shape in a
+    table, keyed by limit state, in the force and moment units of the
+    table's unit system."""
+    columns = table.columns
+    factors = strength_factors(table.units)
+    Lx, Ly, Kx, Ky, _, _ = members.compression_geometry(length, design_props)
+    slenderness = np.maximum(compression.calc_slenderness_ratio_batch(Lx, columns["rx"], Kx),
+                             compression.calc_slenderness_ratio_batch(Ly, columns["ry"], Ky))
+    Fe = compression.calc_elastic_buckling_stress_batch(slenderness, material.E)
+    Fn = compression.calc_nominal_flexural_buckling_stress_batch(Fe, material.Fy)
+    return {"compression": (_strength_factor(design_method, compression.PHI_C,
+                                             compression.OMEGA_C)
+                            * factors["force"] * Fn * columns["area"]),
+            "major_flex": (_strength_factor(design_method, flexure.PHI_B, flexure.OMEGA_B)
+                           * factors["moment"] * material.Fy * columns["Zx"])}
+
+
+def select_lightest_section(length: float,
+                            design_props: dict,
+                            force_actions: dict[str, dict[str, float]],
+                            material: SteelMaterial=ASTM_A992_GR_50,
+                            family: str="W_shapes",
+                            design_method: str="lrfd",
+                            units: UnitSystem=IN_KIP,
+                            criteria: dict[str, dict[str, float]]={},
+                            max_ratio: float=1.0,
+                            ) -> dict:
+    """Find the lightest shape in a family that satisfies every limit state
+    with a demand in force_actions.
+
+    Shapes are taken from the family's table in units, which must also be
+    the units of the material, lengths and forces. criteria optionally
+    restricts the candidates, in the format of ShapeTable.select (e.g.
+    {"d": {"max": 14}}, in the same units). Returns a dictionary with
+    the selected shape ("section", None if no shape is adequate), its design
+    results ("results"), and search statistics: shapes meeting the criteria
+    ("candidates"), shapes passing the strength bounds ("screened"), shapes
+    fully evaluated ("evaluated") and the names of evaluated shapes skipped
+    because a limit state is not implemented for them ("not_implemented",
+    e.g. shapes with noncompact webs in flexure). Skipped shapes are lighter
+    than the selected one and may be adequate, so they should be checked by
+    other means."""
+    if family not in members.I_SHAPE_FAMILIES:
+        raise NotImplementedError(f"Automatic sizing is not implemented for {family}")
+    if material.units != units:
+        raise ValueError(f"Incompatible unit systems:\n\
+                            Member units: {units.label}\n\
+                            Material units: {material.units.label}")
+    table = get_shape_table(family, units)
+    design_method = design_method.lower()
+    rows = table.select(criteria, sort_by="weight")
+    candidates = len(rows)
+
+    limit_states = members.required_limit_states(force_actions)
+    if "compression" in limit_states:
+        # Checked up front, as the strength bounds do not raise for it
+        members.check_compression_geometry(*members.compression_geometry(length,
+                                                                         design_props))
+    demands = {limit_state: members.calc_demand(limit_state, force_actions)
+               for limit_state in limit_states}
+    bounds = calc_strength_bounds(table, material, length, design_props, design_method)
+    for limit_state in limit_states:
+        demand = demands[limit_state][0]
+        # Small allowance so round-off in the bound never prunes a shape
+        # whose exact capacity is just adequate
+        rows = rows[bounds[limit_state][rows]*(1+1e-9)*max_ratio >= demand]
+
+    evaluated = 0
+    not_implemented = []
+    for row in rows:
+        shape = AISCShape(table, int(row))
+        evaluated += 1
+        results = {}
+        for limit_state in limit_states:
+            try:
+                capacity = members.calc_capacity(limit_state, shape, material, length,
+                                                 design_props, design_method, units)
+            except NotImplementedError:
+                not_implemented.append(shape.label)
+                break
+            demand, combination = demands[limit_state]
+            ratio = demand/capacity if capacity else float("inf")
+            if ratio > max_ratio:
+                break
+            results[limit_state] = {"capacity": capacity,
+                                    "demand": demand,
+                                    "ratio": ratio,
+                                    "combination": combination}
+        else:
+            return {"section": shape, "results": results, "candidates": candidates,
+                    "screened": len(rows), "evaluated": evaluated,
+                    "not_implemented": not_implemented}
+    return {"section": None, "results": {}, "candidates": candidates,
+            "screened": len(rows), "evaluated": evaluated,
+            "not_implemented": not_implemented}
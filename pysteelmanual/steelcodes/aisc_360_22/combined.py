@@ -0,0 +1,160 @@
+"""
+Member design per AISC 360-22 Chapter H, "Design of Members for Combined
+Forces and Torsion"
+
+As in the compression and flexure modules, ``report=False`` evaluates the
+equations on plain floats and returns a float, and ``_batch`` functions
+evaluate over NumPy arrays. screen_interaction_H1_1 applies Equations H1-1a
+and H1-1b to whole models at once: capacities per member against demands per
+member, load combination and station.
+
+Required axial strength is positive in compression. Tension is taken as
+zero, since tensile strength (Chapter D) is not implemented yet; moments are
+taken by magnitude.
+"""
+
+import efficalc as ef
+import numpy as np
+from numpy.typing import ArrayLike
+from pysteelmanual.instrumentation import instrumented
+from pysteelmanual.units import UnitSystem, IN_KIP
+
+###########################################################################
+# H1. DOUBLY AND SINGLY SYMMETRIC MEMBERS SUBJECT TO FLEXURE AND AXIAL FORCE
+###########################################################################
+
+# Pr/Pc at and above which Equation H1-1a applies
+H1_AXIAL_LIMIT = 0.2
+
+
+@instrumented()
+def calc_interaction_ratio_H1_1(required_axial: float,
+                                available_axial: float,
+                                required_major_moment: float,
+                                available_major_moment: float,
+                                required_minor_moment: float=0.0,
+                                available_minor_moment: float|None=None,
+                                units: UnitSystem=IN_KIP,
+                                report: bool=True,
+                                ) -> ef.Calculation|float:
+    """Calculate the interaction ratio of Equations H1-1a and H1-1b for a
+    doubly or singly symmetric member in flexure and compression. The
+    minor-axis term is omitted if available_minor_moment is None."""
+    required_axial = max(required_axial, 0.0)
+    if not report:
+        axial = required_axial/available_axial
+        flexure = abs(required_major_moment)/available_major_moment
+        if available_minor_moment is not None:
+            flexure += abs(required_minor_moment)/available_minor_moment
+        if axial >= H1_AXIAL_LIMIT:
+            return axial + 8/9*flexure
+        return axial/2 + flexure
+
+    Pr = ef.Input("P_r", required_axial, units.force, "Required axial strength")
+    Pc = ef.Input("P_c", available_axial, units.force, "Available axial strength")
+    Mrx = ef.Input("M_{rx}", abs(required_major_moment), units.moment,
+                   "Required flexural strength about the major axis")
+    Mcx = ef.Input("M_{cx}", available_major_moment, units.moment,
+                   "Available flexural strength about the major axis")
+    flexure = Mrx/Mcx
+    if available_minor_moment is not None:
+        Mry = ef.Input("M_{ry}", abs(required_minor_moment), units.moment,
+                       "Required flexural strength about the minor axis")
+        Mcy = ef.Input("M_{cy}", available_minor_moment, units.moment,
+                       "Available flexural strength about the minor axis")
+        flexure = flexure + Mry/Mcy
+    if required_axial/available_axial >= H1_AXIAL_LIMIT:
+        ef.Comparison(Pr/Pc, ">=", H1_AXIAL_LIMIT, "\\text{Use Eq H1-1a}")
+        ratio = ef.Calculation("\\text{Ratio}", Pr/Pc + 8/9*(flexure), "",
+                               "Interaction ratio",
+                               "AISC 360-22 Eq H1-1a")
+    else:
+        ef.Comparison(Pr/Pc, "<", H1_AXIAL_LIMIT, "\\text{Use Eq H1-1b}")
+        ratio = ef.Calculation("\\text{Ratio}", Pr/(2*Pc) + (flexure), "",
+                               "Interaction ratio",
+                               "AISC 360-22 Eq H1-1b")
+    return ratio
+
+
+@instrumented()
+def calc_interaction_ratio_H1_1_batch(required_axial: ArrayLike,
+                                      available_axial: ArrayLike,
+                                      required_major_moment: ArrayLike,
+                                      available_major_moment: ArrayLike,
+                                      required_minor_moment: ArrayLike=0.0,
+                                      available_minor_moment: ArrayLike=np.inf,
+                                      ) -> np.ndarray:
+    """Calculate the interaction ratio of Equations H1-1a and H1-1b for
+    arrays of demands and capacities, which are broadcast against each
+    other. The equation is selected per element. Zero available strengths
+    give infinite ratios for nonzero demands."""
+    Pr = np.maximum(np.asarray(required_axial, dtype=float), 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        axial = Pr/available_axial
+        flexure = np.abs(required_major_moment)/available_major_moment
+        flexure += np.abs(required_minor_moment)/available_minor_moment
+    return np.where(axial >= H1_AXIAL_LIMIT, axial + (8/9)*flexure, axial/2 + flexure)
+
+
+def screen_interaction_H1_1(required_axial: ArrayLike,
+                            required_major_moment: ArrayLike,
+                            available_axial: ArrayLike,
+                            available_major_moment: ArrayLike,
+                            required_minor_moment: ArrayLike=0.0,
+                            available_minor_moment: ArrayLike=np.inf,
+                            chunk_size: int|None=None,
+                            ) -> dict[str, np.ndarray]:
+    """Screen many members for Equations H1-1a and H1-1b without Python
+    loops over members, combinations or stations.
+
+    Demands (Pr, Mrx, Mry) have one row per member followed by any number of
+    axes, e.g. (members, combinations, stations); capacities (Pc, Mcx, Mcy)
+    have one value per member. Demands of NaN (padding for members with
+    fewer stations) are ignored. chunk_size limits the number of members
+    evaluated per pass, bounding the size of temporary arrays.
+
+    Returns a dictionary of per-member arrays: the governing interaction
+    ratio "ratio" (NaN for members without demands), the "location" of the
+    governing demand as a tuple of index arrays over the demand axes after
+    the first (-1 for members without demands), and "equation_a", True
+    where Equation H1-1a governs."""
+    Pr = np.asarray(required_axial, dtype=float)
+    Mrx = np.asarray(required_major_moment, dtype=float)
+    Mry = np.asarray(required_minor_moment, dtype=float)
+    shape = np.broadcast_shapes(Pr.shape, Mrx.shape, Mry.shape)
+    if len(shape) == 0:
+        raise ValueError("Demands must have one row per member")
+    members = shape[0]
+    points = shape[1:]
+    Pc, Mcx, Mcy = (np.broadcast_to(np.asarray(capacity, dtype=float), (members,))
+                    for capacity in (available_axial, available_major_moment,
+                                     available_minor_moment))
+    # Capacities broadcast along the demand axes
+    expand = (slice(None),) + (np.newaxis,)*len(points)
+    chunk_size = chunk_size or members
+    ratio = np.full(members, np.nan)
+    flat_location = np.full(members, -1, dtype=np.intp)
+    equation_a = np.zeros(members, dtype=bool)
+    for start in range(0, members, chunk_size):
+        rows = slice(start, min(start + chunk_size, members))
+        Pr_rows = np.broadcast_to(Pr, shape)[rows]
+        ratios = calc_interaction_ratio_H1_1_batch(
+            Pr_rows, Pc[rows][expand],
+            np.broadcast_to(Mrx, shape)[rows], Mcx[rows][expand],
+            np.broadcast_to(Mry, shape)[rows], Mcy[rows][expand])
+        ratios = ratios.reshape(len(ratios), -1)
+        valid = ~np.isnan(ratios)
+        index = np.argmax(np.where(valid, ratios, -np.inf), axis=1)
+        found = valid.any(axis=1)
+        chunk = np.arange(len(ratios))
+        ratio[rows] = np.where(found, ratios[chunk, index], np.nan)
+        flat_location[rows] = np.where(found, index, -1)
+        governing_Pr = np.maximum(Pr_rows.reshape(len(ratios), -1)[chunk, index], 0.0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            equation_a[rows] = found & (governing_Pr/Pc[rows] >= H1_AXIAL_LIMIT)
+    if points:
+        location = np.unravel_index(np.maximum(flat_location, 0), points)
+        location = tuple(np.where(flat_location >= 0, axis, -1) for axis in location)
+    else:
+        location = ()
+    return {"ratio": ratio, "location": location, "equation_a": equation_a}
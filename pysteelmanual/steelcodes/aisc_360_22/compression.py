@@ -1,11 +1,23 @@
 """
 Member design per AISC 360-22 Chapter E, "Design of Members for Compression"
+
+Each function accepts a ``report`` flag. With ``report=True`` (the default) the
+calculation is built from Efficalc objects for use in calculation reports. With
+``report=False`` the same equations are evaluated on plain floats and a float
+is returned, which is much faster when only the number is needed.
+
+Functions with a ``_batch`` suffix evaluate the same equations over NumPy
+arrays (or any broadcastable inputs) in a single vectorized pass.
 """
 
 import efficalc as ef
+import numpy as np
+from numpy.typing import ArrayLike
+from math import pi, sqrt
 from pysteelmanual.units import unit_systems, UnitSystem, IN_KIP, MM_KN
-from pysteelmanual.sections import RoundBar #RectBar
+from pysteelmanual.sections import SteelSection, RoundBar #RectBar
 from pysteelmanual.materials import SteelMaterial
+from pysteelmanual.instrumentation import instrumented
 
 ###########################################################################
 # E1. GENERAL PROVISIONS
@@ -15,17 +27,56 @@ PHI_C = 0.90    # LRFD strength reduction factor for compression
 OMEGA_C = 1.67  # ASD safety factor for compression
 
 
+def _available_compressive_strength(nominal_strength: float,
+                                    design_method: str) -> float|None:
+    """Apply phi_c or Omega_c to a nominal strength evaluated as a float"""
+    if design_method.lower() == "nominal":
+        return nominal_strength
+    elif design_method.lower() == "lrfd":
+        return PHI_C*nominal_strength
+    elif design_method.lower() == "asd":
+        return nominal_strength/OMEGA_C
+
+
+def _report_available_compressive_strength(Pn: ef.Calculation,
+                                           design_method: str,
+                                           units: UnitSystem=IN_KIP,
+                                           ) -> ef.Calculation:
+    """Apply phi_c or Omega_c to a nominal strength in a calculation report"""
+    if design_method.lower() == "nominal":
+        return Pn
+    elif design_method.lower() == "lrfd":
+        phi = ef.Input("\\phi_c", PHI_C, None,
+                       "LRFD strength reduction factor",
+                       "AISC 360-22 Sect E1")
+        phiPn = ef.Calculation("\\phi_cP_n", phi*Pn, units.force,
+                               "Design compressive strength")
+        return phiPn
+    elif design_method.lower() == "asd":
+        Omega = ef.Input("\\Omega_c", OMEGA_C, None,
+                         "ASD safety factor",
+                         "AISC 360-22 Sect E1")
+        PnOmega = ef.Calculation("P_n/\\Omega_c", Pn/Omega, units.force,
+                                 "Allowable compressive strength")
+        return PnOmega
+
+
 ###########################################################################
 # E2. EFFECTIVE LENGTH
 ###########################################################################
 
+@instrumented()
 def calc_slenderness_ratio(unbraced_length: float, 
                            radius_of_gyration: float,
                            effective_length_factor: float=1.0,
                            subscript="",
                            units: UnitSystem=IN_KIP,
-                           ) -> ef.Calculation:
+                           report: bool=True,
+                           ) -> ef.Calculation|float:
     """Calculate member slenderness, Lc/r = KL/r"""
+    if not report:
+        return (effective_length_factor * unbraced_length) / radius_of_gyration
+
     if subscript:
         length_string = f"L_{subscript}"
         k_string = f"K_{subscript}"
@@ -49,17 +100,33 @@ def calc_slenderness_ratio(unbraced_length: float,
     return slenderness_ratio
 
 
+@instrumented()
+def calc_slenderness_ratio_batch(unbraced_length: ArrayLike,
+                                 radius_of_gyration: ArrayLike,
+                                 effective_length_factor: ArrayLike=1.0,
+                                 ) -> np.ndarray:
+    """Calculate member slenderness, Lc/r = KL/r, for arrays of members"""
+    return ((np.asarray(effective_length_factor, dtype=float)
+             * np.asarray(unbraced_length, dtype=float))
+            / np.asarray(radius_of_gyration, dtype=float))
+
+
 ###########################################################################
 # E3. FLEXURAL BUCKLING OF MEMBERS WITHOUT SLENDER ELEMENTS
 ###########################################################################
 
+@instrumented()
 def calc_nominal_compressive_strength_E3(nominal_stress: float|ef.Calculation|ef.Input, 
                                          area: float,
                                          units: UnitSystem=IN_KIP,
-                                         ) -> ef.Calculation:
+                                         report: bool=True,
+                                         ) -> ef.Calculation|float:
     """Calculate nominal compressive strength per Equation E3-1.
     If Fn is entered as an Efficalc Input or Calculation, it will
     be used without restating its definition."""
+    if not report:
+        return float(nominal_stress) * area
+
     Ag = ef.Input("A_g", area, units.area,
                   "Gross sectional area")
     if isinstance(nominal_stress, ef.Calculation) or isinstance(nominal_stress, ef.Input):
@@ -75,11 +142,18 @@ def calc_nominal_compressive_strength_E3(nominal_stress: float|ef.Calculation|ef
     return Pn
 
 
+@instrumented()
 def calc_nominal_flexural_buckling_stress(elastic_buckling_stress: float,
                                           yield_stress: float,
                                           units: UnitSystem=IN_KIP,
-                                          ) -> ef.Calculation:
+                                          report: bool=True,
+                                          ) -> ef.Calculation|float:
     """Calculate nominal flexural buckling stress per Equations E3-2 and E3-3"""
+    if not report:
+        if yield_stress/elastic_buckling_stress <= 2.25:
+            return (0.658**(yield_stress/elastic_buckling_stress))*yield_stress
+        return 0.877*elastic_buckling_stress
+
     Fe = ef.Input("F_e", elastic_buckling_stress, units.stress,
                   "Elastic buckling stress")
     Fy = ef.Input("F_y", yield_stress, units.stress,
@@ -98,11 +172,29 @@ def calc_nominal_flexural_buckling_stress(elastic_buckling_stress: float,
     return Fn  
 
 
+@instrumented()
+def calc_nominal_flexural_buckling_stress_batch(elastic_buckling_stress: ArrayLike,
+                                                yield_stress: ArrayLike,
+                                                ) -> np.ndarray:
+    """Calculate nominal flexural buckling stress per Equations E3-2 and E3-3
+    for arrays of members. The equation is selected per element."""
+    Fe = np.asarray(elastic_buckling_stress, dtype=float)
+    Fy = np.asarray(yield_stress, dtype=float)
+    with np.errstate(divide="ignore"):
+        ratio = Fy/Fe
+    return np.where(ratio <= 2.25, (0.658**ratio)*Fy, 0.877*Fe)
+
+
+@instrumented()
 def calc_elastic_buckling_stress(slenderness: float, 
                                  elastic_modulus: float,
                                  units: UnitSystem=IN_KIP,
-                                 ) -> ef.Calculation:
+                                 report: bool=True,
+                                 ) -> ef.Calculation|float:
     """Calculate elastic buckling stress per Equation E3-4"""
+    if not report:
+        return pi**2 * elastic_modulus / slenderness ** 2
+
     slenderness_ratio = ef.Input("\\frac{L_c}{r}", slenderness, None, "Member slenderness ratio")
     modulus = ef.Input("E", elastic_modulus, units.stress, "Modulus of elasticity")
     buckling_stress = ef.Calculation("F_e", ef.PI**2 * modulus / slenderness_ratio ** 2,
@@ -111,11 +203,22 @@ def calc_elastic_buckling_stress(slenderness: float,
     return buckling_stress
 
 
+@instrumented()
+def calc_elastic_buckling_stress_batch(slenderness: ArrayLike,
+                                       elastic_modulus: ArrayLike,
+                                       ) -> np.ndarray:
+    """Calculate elastic buckling stress per Equation E3-4 for arrays of members"""
+    slenderness = np.asarray(slenderness, dtype=float)
+    with np.errstate(divide="ignore"):
+        return pi**2 * np.asarray(elastic_modulus, dtype=float) / slenderness**2
+
+
 ###########################################################################
 # E4. TORSIONAL AND FLEXURAL-TORSIONAL BUCKLING OF SINGLE ANGLES AND
 # MEMBERS WITHOUT SLENDER ELEMENTS
 ###########################################################################
 
+@instrumented()
 def calc_ft_elastic_buckling_stress_doubly_symmetric(z_effective_length: float,
                                                      warping_constant: float,
                                                      Ix: float,
@@ -124,8 +227,13 @@ def calc_ft_elastic_buckling_stress_doubly_symmetric(z_effective_length: float,
                                                      elastic_modulus: float,
                                                      shear_modulus: float,
                                                      units: UnitSystem=IN_KIP,
-                                                     ) -> ef.Calculation:
+                                                     report: bool=True,
+                                                     ) -> ef.Calculation|float:
     """Calculate torsional or flexural-torsional elastic buckling stress per Equation E4-2"""
+    if not report:
+        return ((pi**2*elastic_modulus*warping_constant/z_effective_length**2
+                 + shear_modulus*J) * (1/(Ix+Iy)))
+
     Lcz = ef.Input("L_{cz}", z_effective_length, units.length,
                    "Effective member length for buckling about longitudinal axis")
     E = ef.Input("E", elastic_modulus, units.stress,
@@ -150,6 +258,24 @@ def calc_ft_elastic_buckling_stress_doubly_symmetric(z_effective_length: float,
     return Fe
 
 
+@instrumented()
+def calc_ft_elastic_buckling_stress_doubly_symmetric_batch(z_effective_length: ArrayLike,
+                                                           warping_constant: ArrayLike,
+                                                           Ix: ArrayLike,
+                                                           Iy: ArrayLike,
+                                                           J: ArrayLike,
+                                                           elastic_modulus: ArrayLike,
+                                                           shear_modulus: ArrayLike,
+                                                           ) -> np.ndarray:
+    """Calculate torsional or flexural-torsional elastic buckling stress per
+    Equation E4-2 for arrays of members"""
+    Lcz, Cw, Ix, Iy, J, E, G = (np.asarray(value, dtype=float) for value in
+                                (z_effective_length, warping_constant, Ix, Iy, J,
+                                 elastic_modulus, shear_modulus))
+    with np.errstate(divide="ignore"):
+        return (pi**2*E*Cw/Lcz**2 + G*J) * (1/(Ix+Iy))
+
+
 ###########################################################################
 # E5. SINGLE-ANGLE COMPRESSION MEMBERS
 ###########################################################################
@@ -162,10 +288,152 @@ def calc_ft_elastic_buckling_stress_doubly_symmetric(z_effective_length: float,
 # E7. MEMBERS WITH SLENDER ELEMENTS
 ###########################################################################
 
+# Effective width imperfection adjustment factors, Table E7.1
+C1_STIFFENED = 0.18     # Case (a), stiffened elements
+C2_STIFFENED = 1.31
+C1_UNSTIFFENED = 0.22   # Case (c), all other elements
+C2_UNSTIFFENED = 1.49
+
+
+@instrumented()
+def calc_effective_width(width: float,
+                         thickness: float,
+                         limiting_ratio: float,
+                         critical_stress: float,
+                         yield_stress: float,
+                         c1: float,
+                         c2: float,
+                         subscript: str="",
+                         units: UnitSystem=IN_KIP,
+                         report: bool=True,
+                         ) -> ef.Calculation|float:
+    """Calculate the effective width of a slender element per Equations
+    E7-2, E7-3 and E7-5. The limiting ratio is lambda_r from Table B4.1a."""
+    if not report:
+        ratio = width/thickness
+        if ratio <= limiting_ratio*sqrt(yield_stress/critical_stress):
+            return width
+        Fel = (c2*limiting_ratio/ratio)**2*yield_stress
+        return width*(1-c1*sqrt(Fel/critical_stress))*sqrt(Fel/critical_stress)
+
+    sub = f"_{{{subscript}}}" if subscript else ""
+    b = ef.Input(f"b{sub}", width, units.length, "Element width")
+    t = ef.Input(f"t{sub}", thickness, units.length, "Element thickness")
+    lambda_r = ef.Input(f"\\lambda_{{r{subscript}}}", limiting_ratio, None,
+                        "Limiting width-to-thickness ratio", "AISC 360-22 Table B4.1a")
+    Fcr = ef.Input("F_{cr}", critical_stress, units.stress, "Critical stress")
+    Fy = ef.Input("F_y", yield_stress, units.stress, "Yield stress")
+    ratio = ef.Calculation(f"\\lambda{sub}", b/t, None, "Width-to-thickness ratio")
+    limit = ef.Calculation(f"\\lambda_{{r{subscript}}}\\sqrt{{\\frac{{F_y}}{{F_{{cr}}}}}}",
+                           lambda_r*ef.sqrt(Fy/Fcr), None,
+                           "Limit for full effective width")
+    if ratio.result() <= limit.result():
+        ef.Comparison(ratio, "<=", limit, "\\text{Use Eq E7-2}")
+        be = ef.Calculation(f"b_{{e{subscript}}}", b, units.length,
+                            "Effective width", "AISC 360-22 Eq E7-2")
+    else:
+        ef.Comparison(ratio, ">", limit, "\\text{Use Eq E7-3}")
+        C1 = ef.Input(f"c_{{1{subscript}}}", c1, None,
+                      "Effective width imperfection adjustment factor",
+                      "AISC 360-22 Table E7.1")
+        C2 = ef.Input(f"c_{{2{subscript}}}", c2, None,
+                      "Effective width imperfection adjustment factor",
+                      "AISC 360-22 Table E7.1")
+        Fel = ef.Calculation(f"F_{{el{subscript}}}", ef.brackets(C2*lambda_r/ratio)**2*Fy,
+                             units.stress, "Elastic local buckling stress",
+                             "AISC 360-22 Eq E7-5")
+        be = ef.Calculation(f"b_{{e{subscript}}}",
+                            b*ef.brackets(1-C1*ef.sqrt(Fel/Fcr))*ef.sqrt(Fel/Fcr),
+                            units.length, "Effective width", "AISC 360-22 Eq E7-3")
+    return be
+
+
+@instrumented()
+def calc_i_shape_effective_area(section: SteelSection,
+                                material: SteelMaterial,
+                                critical_stress: float,
+                                units: UnitSystem=IN_KIP,
+                                report: bool=True,
+                                ) -> ef.Calculation|float:
+    """Calculate the effective area of a rolled I-shape in compression per
+    Section E7.1. The flanges are taken as four unstiffened elements of width
+    bf/2 and the web as a stiffened element of width h = d - 2k."""
+    E = material.E
+    Fy = material.Fy
+    h = section.d-2*section.k
+    lambda_rf = 0.56*sqrt(E/Fy)
+    lambda_rw = 1.49*sqrt(E/Fy)
+    if not report:
+        be_f = calc_effective_width(section.bf/2, section.tf, lambda_rf, critical_stress,
+                                    Fy, C1_UNSTIFFENED, C2_UNSTIFFENED, report=False)
+        be_w = calc_effective_width(h, section.tw, lambda_rw, critical_stress,
+                                    Fy, C1_STIFFENED, C2_STIFFENED, report=False)
+        return section.area-4*(section.bf/2-be_f)*section.tf-(h-be_w)*section.tw
+
+    Ag = ef.Input("A_g", section.area, units.area, "Gross sectional area")
+    ef.TextBlock("Flanges (unstiffened elements)")
+    be_f = calc_effective_width(section.bf/2, section.tf, lambda_rf, critical_stress,
+                                Fy, C1_UNSTIFFENED, C2_UNSTIFFENED, "f", units)
+    ef.TextBlock("Web (stiffened element)")
+    be_w = calc_effective_width(h, section.tw, lambda_rw, critical_stress,
+                                Fy, C1_STIFFENED, C2_STIFFENED, "w", units)
+    bf = ef.Input("b_f", section.bf, units.length, "Flange width")
+    tf = ef.Input("t_f", section.tf, units.length, "Flange thickness")
+    h = ef.Input("h", h, units.length, "Clear distance between flanges less fillets")
+    tw = ef.Input("t_w", section.tw, units.length, "Web thickness")
+    Ae = ef.Calculation("A_e", Ag-4*ef.brackets(bf/2-be_f)*tf-ef.brackets(h-be_w)*tw,
+                        units.area, "Effective area", "AISC 360-22 Sect E7.1")
+    return Ae
+
+@instrumented()
+def calc_effective_width_batch(width: ArrayLike,
+                               thickness: ArrayLike,
+                               limiting_ratio: ArrayLike,
+                               critical_stress: ArrayLike,
+                               yield_stress: ArrayLike,
+                               c1: float,
+                               c2: float,
+                               ) -> np.ndarray:
+    """Calculate the effective width of slender elements per Equations E7-2,
+    E7-3 and E7-5 for arrays of elements. The equation is selected per
+    element."""
+    b, t, lambda_r, Fcr, Fy = (np.asarray(value, dtype=float) for value in
+                               (width, thickness, limiting_ratio, critical_stress,
+                                yield_stress))
+    ratio = b/t
+    Fel = (c2*lambda_r/ratio)**2*Fy
+    return np.where(ratio <= lambda_r*np.sqrt(Fy/Fcr), b,
+                    b*(1-c1*np.sqrt(Fel/Fcr))*np.sqrt(Fel/Fcr))
+
+
+@instrumented()
+def calc_i_shape_effective_area_batch(properties: dict[str, ArrayLike],
+                                      critical_stress: ArrayLike,
+                                      yield_stress: ArrayLike,
+                                      elastic_modulus: ArrayLike,
+                                      ) -> np.ndarray:
+    """Calculate the effective area of rolled I-shapes in compression per
+    Section E7.1 for arrays of members. properties holds arrays of "area",
+    "d", "k", "bf", "tf" and "tw", e.g. ShapeTable.columns."""
+    area, d, k, bf, tf, tw = (np.asarray(properties[name], dtype=float) for name in
+                              ("area", "d", "k", "bf", "tf", "tw"))
+    E = np.asarray(elastic_modulus, dtype=float)
+    Fy = np.asarray(yield_stress, dtype=float)
+    h = d-2*k
+    lambda_rf = 0.56*np.sqrt(E/Fy)
+    lambda_rw = 1.49*np.sqrt(E/Fy)
+    be_f = calc_effective_width_batch(bf/2, tf, lambda_rf, critical_stress, Fy,
+                                      C1_UNSTIFFENED, C2_UNSTIFFENED)
+    be_w = calc_effective_width_batch(h, tw, lambda_rw, critical_stress, Fy,
+                                      C1_STIFFENED, C2_STIFFENED)
+    return area-4*(bf/2-be_f)*tf-(h-be_w)*tw
+
+
 ###########################################################################
 # INTEGRATION: ROUND BAR
 ###########################################################################
 
+@instrumented()
 def calc_round_bar_compressive_capacity(section: RoundBar, 
                                     material: SteelMaterial,
                                     length_x: float, length_y: float,
@@ -173,8 +441,18 @@ def calc_round_bar_compressive_capacity(section: RoundBar,
                                     design_method: str="nominal",
                                     units: UnitSystem=IN_KIP,
                                     header_level: int=1,
-                                    ) -> ef.Calculation:
+                                    report: bool=True,
+                                    ) -> ef.Calculation|float:
     """Calculate the compressive capacity of a round bar"""
+    if not report:
+        ratio_x = calc_slenderness_ratio(length_x, section.rx, k_x, report=False)
+        ratio_y = calc_slenderness_ratio(length_y, section.ry, k_y, report=False)
+        slenderness = max(ratio_x, ratio_y)
+        Fe = calc_elastic_buckling_stress(slenderness, material.E, report=False)
+        Fn = calc_nominal_flexural_buckling_stress(Fe, material.Fy, report=False)
+        Pn = calc_nominal_compressive_strength_E3(Fn, section.area, report=False)
+        return _available_compressive_strength(Pn, design_method)
+
     ef.Heading("Compressive Capacity of Round Bar", header_level)
     ef.TextBlock("Following AISC 360-22")
     ef.Heading("Limiting Slenderness Ratio", header_level+1)
@@ -187,24 +465,49 @@ def calc_round_bar_compressive_capacity(section: RoundBar,
     Fe = calc_elastic_buckling_stress(slenderness.result(), material.E, units)
     Fn = calc_nominal_flexural_buckling_stress(Fe.result(), material.Fy, units)
     Pn = calc_nominal_compressive_strength_E3(Fn, section.area, units)
+    return _report_available_compressive_strength(Pn, design_method, units)
+
+
+@instrumented()
+def calc_round_bar_compressive_capacity_batch(diameter: ArrayLike,
+                                              length_x: ArrayLike,
+                                              length_y: ArrayLike,
+                                              k_x: ArrayLike,
+                                              k_y: ArrayLike,
+                                              yield_stress: ArrayLike,
+                                              elastic_modulus: ArrayLike,
+                                              design_method: str="nominal",
+                                              ) -> dict[str, np.ndarray]:
+    """Calculate the compressive capacity of many round bars at once.
+
+    All inputs are broadcast against each other, so a sweep can be built from
+    e.g. a column of diameters and a row of lengths. Returns a dictionary of
+    arrays: elastic buckling stress "Fe", nominal stress "Fn", nominal strength
+    "Pn", and available strength "Pc" (Pn, phi_c*Pn or Pn/Omega_c according to
+    the design method)."""
+    D, Lx, Ly, Kx, Ky, Fy, E = np.broadcast_arrays(
+        *(np.asarray(value, dtype=float) for value in
+          (diameter, length_x, length_y, k_x, k_y, yield_stress, elastic_modulus)))
+    R = D/2
+    area = pi * R**2
+    r = np.sqrt((pi * R**4 / 4)/area)
+    slenderness = np.maximum(calc_slenderness_ratio_batch(Lx, r, Kx),
+                             calc_slenderness_ratio_batch(Ly, r, Ky))
+    Fe = calc_elastic_buckling_stress_batch(slenderness, E)
+    Fn = calc_nominal_flexural_buckling_stress_batch(Fe, Fy)
+    Pn = Fn*area
     if design_method.lower() == "nominal":
-        return Pn
+        Pc = Pn
     elif design_method.lower() == "lrfd":
-        phi = ef.Input("\\phi_c", PHI_C, None,
-                       "LRFD strength reduction factor",
-                       "AISC 360-22 Sect E1")
-        phiPn = ef.Calculation("\\phi_cP_n", phi*Pn, units.force,
-                               "Design compressive strength")
-        return phiPn
+        Pc = PHI_C*Pn
     elif design_method.lower() == "asd":
-        Omega = ef.Input("\\Omega_c", OMEGA_C, None,
-                         "ASD safety factor",
-                         "AISC 360-22 Sect E1")
-        PnOmega = ef.Calculation("P_n/\\Omega_c", Pn/Omega, units.force,
-                                 "Allowable compressive strength")
-        return PnOmega
+        Pc = Pn/OMEGA_C
+    else:
+        raise ValueError(f"Invalid design method \"{design_method}\"")
+    return {"Fe": Fe, "Fn": Fn, "Pn": Pn, "Pc": Pc}
 
 
+@instrumented()
 def calc_round_bar_lrfd_capacity(section: RoundBar, 
                                     material: SteelMaterial,
                                     length_x: float, length_y: float,
@@ -220,4 +523,111 @@ def calc_round_bar_lrfd_capacity(section: RoundBar,
 
 ###########################################################################
 # INTEGRATION: W SECTIONS
-###########################################################################
\ No newline at end of file
+###########################################################################
+
+@instrumented()
+def calc_w_shape_compressive_capacity(section: SteelSection,
+                                      material: SteelMaterial,
+                                      length_x: float, length_y: float,
+                                      k_x: float=1.0, k_y: float=1.0,
+                                      length_z: float|None=None, k_z: float=1.0,
+                                      design_method: str="nominal",
+                                      units: UnitSystem=IN_KIP,
+                                      header_level: int=1,
+                                      report: bool=True,
+                                      ) -> ef.Calculation|float:
+    """Calculate the compressive capacity of a W-shape (or other doubly
+    symmetric rolled I-shape) for flexural buckling (E3), torsional buckling
+    (E4) and local buckling of slender elements (E7). The torsional unbraced
+    length defaults to length_y."""
+    if length_z is None:
+        length_z = length_y
+    if not report:
+        ratio_x = calc_slenderness_ratio(length_x, section.rx, k_x, report=False)
+        ratio_y = calc_slenderness_ratio(length_y, section.ry, k_y, report=False)
+        Fe_flex = calc_elastic_buckling_stress(max(ratio_x, ratio_y), material.E,
+                                               report=False)
+        Fe_tor = calc_ft_elastic_buckling_stress_doubly_symmetric(
+            k_z*length_z, section.Cw, section.Ix, section.Iy, section.J,
+            material.E, material.G, report=False)
+        Fn = calc_nominal_flexural_buckling_stress(min(Fe_flex, Fe_tor), material.Fy,
+                                                   report=False)
+        Ae = calc_i_shape_effective_area(section, material, Fn, report=False)
+        return _available_compressive_strength(Fn*Ae, design_method)
+
+    ef.Heading(f"Compressive Capacity of {section.label}", header_level)
+    ef.TextBlock("Following AISC 360-22")
+    ef.Heading("Limiting Slenderness Ratio", header_level+1)
+    ratio_x = calc_slenderness_ratio(length_x, section.rx, k_x, "x", units)
+    ratio_y = calc_slenderness_ratio(length_y, section.ry, k_y, "y", units)
+    slenderness = ef.Calculation("\\frac{L_c}{r}",
+                                 ef.maximum(ratio_x, ratio_y),
+                                 None, "Limiting slenderness ratio for design")
+    ef.Heading("Flexural Buckling", header_level+1)
+    Fe_flex = calc_elastic_buckling_stress(slenderness.result(), material.E, units)
+    ef.Heading("Torsional Buckling", header_level+1)
+    Kz = ef.Input("K_z", k_z, None, "Effective length factor for torsional buckling")
+    Lz = ef.Input("L_z", length_z, units.length,
+                  "Laterally unbraced length for torsional buckling")
+    Lcz = ef.Calculation("L_{cz}", Kz*Lz, units.length,
+                         "Effective member length for buckling about longitudinal axis")
+    Fe_tor = calc_ft_elastic_buckling_stress_doubly_symmetric(
+        Lcz.result(), section.Cw, section.Ix, section.Iy, section.J,
+        material.E, material.G, units)
+    ef.Heading("Nominal Stress", header_level+1)
+    Fe = ef.Calculation("F_e", ef.minimum(Fe_flex, Fe_tor), units.stress,
+                        "Governing elastic buckling stress")
+    Fn = calc_nominal_flexural_buckling_stress(Fe.result(), material.Fy, units)
+    ef.Heading("Local Buckling of Slender Elements", header_level+1)
+    Ae = calc_i_shape_effective_area(section, material, Fn.result(), units)
+    Pn = ef.Calculation("P_n", Fn*Ae, units.force,
+                        "Nominal compressive strength", "AISC 360-22 Eq E7-1")
+    return _report_available_compressive_strength(Pn, design_method, units)
+
+
+@instrumented()
+def calc_w_shape_compressive_capacity_batch(properties: dict[str, ArrayLike],
+                                            yield_stress: ArrayLike,
+                                            elastic_modulus: ArrayLike,
+                                            shear_modulus: ArrayLike,
+                                            length_x: ArrayLike,
+                                            length_y: ArrayLike,
+                                            k_x: ArrayLike=1.0,
+                                            k_y: ArrayLike=1.0,
+                                            length_z: ArrayLike|None=None,
+                                            k_z: ArrayLike=1.0,
+                                            design_method: str="nominal",
+                                            ) -> dict[str, np.ndarray]:
+    """Calculate the compressive capacity of many W-shapes (or other doubly
+    symmetric rolled I-shapes) at once for flexural buckling (E3), torsional
+    buckling (E4) and local buckling of slender elements (E7).
+
+    properties holds arrays of "area", "rx", "ry", "Ix", "Iy", "J", "Cw",
+    "d", "k", "bf", "tf" and "tw", e.g. ShapeTable.columns. All inputs are
+    broadcast against each other, so a table can be built from a column of
+    shapes and a row of lengths. The torsional unbraced length defaults to
+    length_y. Returns a dictionary of arrays: governing elastic buckling
+    stress "Fe", nominal stress "Fn", effective area "Ae", nominal strength
+    "Pn", and available strength "Pc"."""
+    if length_z is None:
+        length_z = length_y
+    properties = {name: np.asarray(values, dtype=float) for name, values in properties.items()}
+    ratio_x = calc_slenderness_ratio_batch(length_x, properties["rx"], k_x)
+    ratio_y = calc_slenderness_ratio_batch(length_y, properties["ry"], k_y)
+    Fe_flex = calc_elastic_buckling_stress_batch(np.maximum(ratio_x, ratio_y), elastic_modulus)
+    Fe_tor = calc_ft_elastic_buckling_stress_doubly_symmetric_batch(
+        np.asarray(k_z, dtype=float)*np.asarray(length_z, dtype=float), properties["Cw"],
+        properties["Ix"], properties["Iy"], properties["J"], elastic_modulus, shear_modulus)
+    Fe = np.minimum(Fe_flex, Fe_tor)
+    Fn = calc_nominal_flexural_buckling_stress_batch(Fe, yield_stress)
+    Ae = calc_i_shape_effective_area_batch(properties, Fn, yield_stress, elastic_modulus)
+    Pn = Fn*Ae
+    if design_method.lower() == "nominal":
+        Pc = Pn
+    elif design_method.lower() == "lrfd":
+        Pc = PHI_C*Pn
+    elif design_method.lower() == "asd":
+        Pc = Pn/OMEGA_C
+    else:
+        raise ValueError(f"Invalid design method \"{design_method}\"")
+    return {"Fe": Fe, "Fn": Fn, "Ae": Ae, "Pn": Pn, "Pc": Pc}
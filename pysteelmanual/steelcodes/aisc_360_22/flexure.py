@@ -1,9 +1,17 @@
 """
 Member design per AISC 360-22 Chapter F, "Design of Members for Flexure"
+
+As in the compression module, ``report=False`` evaluates the equations on
+plain floats and returns a float instead of Efficalc objects, and ``_batch``
+functions evaluate over NumPy arrays.
 """
 import efficalc as ef
-from pysteelmanual.sections import RoundBar
+import numpy as np
+from numpy.typing import ArrayLike
+from math import pi, sqrt
+from pysteelmanual.sections import SteelSection, RoundBar
 from pysteelmanual.materials import SteelMaterial
+from pysteelmanual.instrumentation import instrumented
 from pysteelmanual.units import UnitSystem, IN_KIP
 
 ###########################################################################
@@ -13,15 +21,241 @@ from pysteelmanual.units import UnitSystem, IN_KIP
 PHI_B = 0.90    # LRFD strength reduction factor for flexure
 OMEGA_B = 1.67  # ASD safety factor for flexure
 
+
+def _available_flexural_strength(nominal_strength: float,
+                                 design_method: str) -> float|None:
+    """Apply phi_b or Omega_b to a nominal strength evaluated as a float"""
+    if design_method.lower() == "nominal":
+        return nominal_strength
+    elif design_method.lower() == "lrfd":
+        return PHI_B*nominal_strength
+    elif design_method.lower() == "asd":
+        return nominal_strength/OMEGA_B
+
+###########################################################################
+# F2. DOUBLY SYMMETRIC COMPACT I-SHAPED MEMBERS AND CHANNELS BENT ABOUT
+# THEIR MAJOR AXIS
+###########################################################################
+
+@instrumented()
+def calc_i_shape_plastic_moment(section: SteelSection,
+                                material: SteelMaterial,
+                                units: UnitSystem=IN_KIP,
+                                report: bool=True,
+                                ) -> ef.Calculation|float:
+    """Calculate major-axis plastic moment of an I-shape per Equation F2-1"""
+    if not report:
+        return material.Fy*section.Zx
+
+    Fy = ef.Input("F_y", material.Fy, units.stress, "Yield stress")
+    Zx = ef.Input("Z_x", section.Zx, units.volume,
+                  "Plastic section modulus about the x-axis")
+    Mp = ef.Calculation("M_p", Fy*Zx, units.moment,
+                        "Plastic moment", "AISC 360-22 Eq F2-1")
+    return Mp
+
+
+@instrumented()
+def calc_i_shape_lateral_torsional_buckling_strength(section: SteelSection,
+                                                     material: SteelMaterial,
+                                                     plastic_moment: float|ef.Calculation,
+                                                     unbraced_length: float,
+                                                     Cb: float=1.0,
+                                                     units: UnitSystem=IN_KIP,
+                                                     report: bool=True,
+                                                     ) -> ef.Calculation|float:
+    """Calculate nominal flexural strength for the limit states of yielding
+    and lateral-torsional buckling per Equations F2-2 through F2-6.
+    If Mp is entered as an Efficalc Calculation, it will be used without
+    restating its definition."""
+    if not report:
+        E = material.E
+        Fy = material.Fy
+        Mp = float(plastic_moment)
+        Lb = unbraced_length
+        Lp = 1.76*section.ry*sqrt(E/Fy)
+        Jc_Sxho = section.J*1.0/(section.Sx*section.ho)
+        Lr = 1.95*section.rts*E/(0.7*Fy)*sqrt(Jc_Sxho+sqrt(Jc_Sxho**2+6.76*(0.7*Fy/E)**2))
+        if Lb <= Lp:
+            return Mp
+        elif Lb <= Lr:
+            return min(Cb*(Mp-(Mp-0.7*Fy*section.Sx)*((Lb-Lp)/(Lr-Lp))), Mp)
+        Fcr = Cb*pi**2*E/(Lb/section.rts)**2*sqrt(1+0.078*Jc_Sxho*(Lb/section.rts)**2)
+        return min(Fcr*section.Sx, Mp)
+
+    if isinstance(plastic_moment, ef.Calculation) or isinstance(plastic_moment, ef.Input):
+        Mp = plastic_moment
+    else:
+        Mp = ef.Input("M_p", plastic_moment, units.moment, "Plastic moment")
+    E = ef.Input("E", material.E, units.stress, "Modulus of elasticity")
+    Fy = ef.Input("F_y", material.Fy, units.stress, "Yield stress")
+    Lb = ef.Input("L_b", unbraced_length, units.length,
+                  "Length between points braced against lateral displacement "
+                  "of the compression flange")
+    cb = ef.Input("C_b", Cb, None, "Lateral-torsional buckling modification factor")
+    ry = ef.Input("r_y", section.ry, units.length, "Radius of gyration about the y-axis")
+    rts = ef.Input("r_{ts}", section.rts, units.length, "Effective radius of gyration")
+    J = ef.Input("J", section.J, f"{units.length}^4", "Torsional constant")
+    Sx = ef.Input("S_x", section.Sx, units.volume,
+                  "Elastic section modulus about the x-axis")
+    ho = ef.Input("h_o", section.ho, units.length,
+                  "Distance between the flange centroids")
+    c = ef.Input("c", 1.0, None, "Coefficient for doubly symmetric I-shapes",
+                 "AISC 360-22 Eq F2-8a")
+    Lp = ef.Calculation("L_p", 1.76*ry*ef.sqrt(E/Fy), units.length,
+                        "Limiting laterally unbraced length for the limit state of yielding",
+                        "AISC 360-22 Eq F2-5")
+    Jc_Sxho = ef.Calculation("\\frac{Jc}{S_xh_o}", J*c/ef.brackets(Sx*ho), None,
+                             "Torsional stiffness ratio")
+    Lr = ef.Calculation("L_r", 1.95*rts*E/ef.brackets(0.7*Fy)
+                        *ef.sqrt(Jc_Sxho+ef.sqrt(Jc_Sxho**2+6.76*ef.brackets(0.7*Fy/E)**2)),
+                        units.length,
+                        "Limiting unbraced length for the limit state of inelastic "
+                        "lateral-torsional buckling",
+                        "AISC 360-22 Eq F2-6")
+    if Lb.result() <= Lp.result():
+        ef.Comparison(Lb, "<=", Lp, "\\text{Lateral-torsional buckling does not apply}")
+        Mn = ef.Calculation("M_{n,LTB}", Mp, units.moment,
+                            "Nominal flexural strength for yielding", "AISC 360-22 Eq F2-1")
+    elif Lb.result() <= Lr.result():
+        ef.Comparison(Lb, "<=", Lr, "\\text{Use Eq F2-2}")
+        Mn = ef.Calculation("M_{n,LTB}",
+                            ef.minimum(cb*ef.brackets(Mp-ef.brackets(Mp-0.7*Fy*Sx)
+                                                      *ef.brackets((Lb-Lp)/(Lr-Lp))), Mp),
+                            units.moment,
+                            "Nominal flexural strength for lateral-torsional buckling",
+                            "AISC 360-22 Eq F2-2")
+    else:
+        ef.Comparison(Lb, ">", Lr, "\\text{Use Eq F2-3}")
+        Fcr = ef.Calculation("F_{cr}",
+                             cb*ef.PI**2*E/ef.brackets(Lb/rts)**2
+                             *ef.sqrt(1+0.078*Jc_Sxho*ef.brackets(Lb/rts)**2),
+                             units.stress, "Critical stress", "AISC 360-22 Eq F2-4")
+        Mn = ef.Calculation("M_{n,LTB}", ef.minimum(Fcr*Sx, Mp), units.moment,
+                            "Nominal flexural strength for lateral-torsional buckling",
+                            "AISC 360-22 Eq F2-3")
+    return Mn
+
+
+@instrumented()
+def calc_i_shape_web_is_compact(section: SteelSection,
+                                material: SteelMaterial,
+                                units: UnitSystem=IN_KIP,
+                                report: bool=True,
+                                ) -> bool:
+    """Check whether the web of a rolled I-shape is compact for flexure
+    per AISC 360-22 Table B4.1b, Case 15. h is taken as d - 2k."""
+    if not report:
+        return (section.d-2*section.k)/section.tw <= 3.76*sqrt(material.E/material.Fy)
+
+    d = ef.Input("d", section.d, units.length, "Depth of section")
+    k = ef.Input("k", section.k, units.length,
+                 "Distance from outer face of flange to web toe of fillet")
+    tw = ef.Input("t_w", section.tw, units.length, "Web thickness")
+    E = ef.Input("E", material.E, units.stress, "Modulus of elasticity")
+    Fy = ef.Input("F_y", material.Fy, units.stress, "Yield stress")
+    h_tw = ef.Calculation("\\frac{h}{t_w}", ef.brackets(d-2*k)/tw, None,
+                          "Web width-to-thickness ratio")
+    lambda_pw = ef.Calculation("\\lambda_{pw}", 3.76*ef.sqrt(E/Fy), None,
+                               "Limiting width-to-thickness ratio for compact web",
+                               "AISC 360-22 Table B4.1b")
+    compact = h_tw.result() <= lambda_pw.result()
+    if compact:
+        ef.Comparison(h_tw, "<=", lambda_pw, "\\text{Compact web}")
+    else:
+        ef.Comparison(h_tw, ">", lambda_pw, "\\text{Noncompact or slender web}")
+    return compact
+
+
+###########################################################################
+# F3. DOUBLY SYMMETRIC I-SHAPED MEMBERS WITH COMPACT WEBS AND NONCOMPACT
+# OR SLENDER FLANGES BENT ABOUT THEIR MAJOR AXIS
+###########################################################################
+
+@instrumented()
+def calc_i_shape_flange_local_buckling_strength(section: SteelSection,
+                                                material: SteelMaterial,
+                                                plastic_moment: float|ef.Calculation,
+                                                units: UnitSystem=IN_KIP,
+                                                report: bool=True,
+                                                ) -> ef.Calculation|float|None:
+    """Calculate nominal flexural strength for compression flange local
+    buckling per Equations F3-1 and F3-2. Returns None when the flanges are
+    compact and the limit state does not apply."""
+    if not report:
+        E = material.E
+        Fy = material.Fy
+        Mp = float(plastic_moment)
+        lambda_f = section.bf/(2*section.tf)
+        lambda_pf = 0.38*sqrt(E/Fy)
+        lambda_rf = 1.0*sqrt(E/Fy)
+        if lambda_f <= lambda_pf:
+            return None
+        elif lambda_f <= lambda_rf:
+            return Mp-(Mp-0.7*Fy*section.Sx)*((lambda_f-lambda_pf)/(lambda_rf-lambda_pf))
+        kc = min(max(4/sqrt((section.d-2*section.k)/section.tw), 0.35), 0.76)
+        return 0.9*E*kc*section.Sx/lambda_f**2
+
+    if isinstance(plastic_moment, ef.Calculation) or isinstance(plastic_moment, ef.Input):
+        Mp = plastic_moment
+    else:
+        Mp = ef.Input("M_p", plastic_moment, units.moment, "Plastic moment")
+    E = ef.Input("E", material.E, units.stress, "Modulus of elasticity")
+    Fy = ef.Input("F_y", material.Fy, units.stress, "Yield stress")
+    bf = ef.Input("b_f", section.bf, units.length, "Flange width")
+    tf = ef.Input("t_f", section.tf, units.length, "Flange thickness")
+    Sx = ef.Input("S_x", section.Sx, units.volume,
+                  "Elastic section modulus about the x-axis")
+    lambda_f = ef.Calculation("\\lambda_f", bf/ef.brackets(2*tf), None,
+                              "Flange width-to-thickness ratio")
+    lambda_pf = ef.Calculation("\\lambda_{pf}", 0.38*ef.sqrt(E/Fy), None,
+                               "Limiting slenderness for a compact flange",
+                               "AISC 360-22 Table B4.1b")
+    lambda_rf = ef.Calculation("\\lambda_{rf}", 1.0*ef.sqrt(E/Fy), None,
+                               "Limiting slenderness for a noncompact flange",
+                               "AISC 360-22 Table B4.1b")
+    if lambda_f.result() <= lambda_pf.result():
+        ef.Comparison(lambda_f, "<=", lambda_pf,
+                      "\\text{Compact flanges, flange local buckling does not apply}")
+        return None
+    elif lambda_f.result() <= lambda_rf.result():
+        ef.Comparison(lambda_f, "<=", lambda_rf, "\\text{Noncompact flanges, use Eq F3-1}")
+        Mn = ef.Calculation("M_{n,FLB}",
+                            Mp-ef.brackets(Mp-0.7*Fy*Sx)
+                            *ef.brackets((lambda_f-lambda_pf)/(lambda_rf-lambda_pf)),
+                            units.moment,
+                            "Nominal flexural strength for flange local buckling",
+                            "AISC 360-22 Eq F3-1")
+    else:
+        ef.Comparison(lambda_f, ">", lambda_rf, "\\text{Slender flanges, use Eq F3-2}")
+        d = ef.Input("d", section.d, units.length, "Depth of section")
+        k = ef.Input("k", section.k, units.length,
+                     "Distance from outer face of flange to web toe of fillet")
+        tw = ef.Input("t_w", section.tw, units.length, "Web thickness")
+        kc = ef.Calculation("k_c",
+                            ef.minimum(ef.maximum(4/ef.sqrt(ef.brackets(d-2*k)/tw), 0.35), 0.76),
+                            None, "Flange local buckling coefficient",
+                            "AISC 360-22 Table B4.1b Note [a]")
+        Mn = ef.Calculation("M_{n,FLB}", 0.9*E*kc*Sx/lambda_f**2, units.moment,
+                            "Nominal flexural strength for flange local buckling",
+                            "AISC 360-22 Eq F3-2")
+    return Mn
+
+
 ###########################################################################
 # F11. RECTANGULAR BARS AND ROUNDS
 ###########################################################################
 
+@instrumented()
 def calc_round_bar_plastic_moment(section: RoundBar,
                                   material: SteelMaterial,
                                   units: UnitSystem=IN_KIP,
-                                  ) -> ef.Calculation:
+                                  report: bool=True,
+                                  ) -> ef.Calculation|float:
     """Calculate plastic moment of round bar per Equation F11-2"""
+    if not report:
+        return min(material.Fy*section.Zx, 1.6*material.Fy*section.Sx)
+
     Fy = ef.Input("F_y", material.Fy, units.stress, "Yield stress")
     Sx = ef.Input("S_x", section.Sx, units.volume, "Elastic section modulus")
     Z = ef.Input("Z", section.Zx, units.volume, "Plastic section modulus")
@@ -35,12 +269,18 @@ def calc_round_bar_plastic_moment(section: RoundBar,
 # INTEGRATION: ROUND BARS
 ###########################################################################
 
+@instrumented()
 def calc_round_bar_flexural_capacity(section: RoundBar,
                                      material: SteelMaterial,
                                      design_method: str="nominal",
                                      units: UnitSystem=IN_KIP,
-                                     ) -> ef.Calculation:
+                                     report: bool=True,
+                                     ) -> ef.Calculation|float:
     """Calculate flexural capacity of round bar"""
+    if not report:
+        Mn = calc_round_bar_plastic_moment(section, material, report=False)
+        return _available_flexural_strength(Mn, design_method)
+
     Mn = calc_round_bar_plastic_moment(section, material, units)
 
     if design_method.lower() == "nominal":
@@ -54,4 +294,94 @@ def calc_round_bar_flexural_capacity(section: RoundBar,
         Omega = ef.Input("\\Omega_b", OMEGA_B, None,
                          "ASD safety factor", "AISC 360-22 Sect F1")
         Mn_Omega = ef.Input("M_n/\\Omega_b", Mn/Omega, units.moment, "Allowable flexural strength")
-        return Mn_Omega
\ No newline at end of file
+        return Mn_Omega
+
+
+@instrumented()
+def calc_round_bar_flexural_capacity_batch(diameter: ArrayLike,
+                                           yield_stress: ArrayLike,
+                                           design_method: str="nominal",
+                                           ) -> dict[str, np.ndarray]:
+    """Calculate flexural capacity of many round bars at once.
+
+    Inputs are broadcast against each other. Returns a dictionary of arrays:
+    nominal flexural strength "Mn" (Equation F11-2) and available strength
+    "Mc" (Mn, phi_b*Mn or Mn/Omega_b according to the design method)."""
+    D, Fy = np.broadcast_arrays(np.asarray(diameter, dtype=float),
+                                np.asarray(yield_stress, dtype=float))
+    Sx = pi * D**3 / 32
+    Z = 4 * (D/2)**3 / 3
+    Mn = np.minimum(Fy*Z, 1.6*Fy*Sx)
+    if design_method.lower() == "nominal":
+        Mc = Mn
+    elif design_method.lower() == "lrfd":
+        Mc = PHI_B*Mn
+    elif design_method.lower() == "asd":
+        Mc = Mn/OMEGA_B
+    else:
+        raise ValueError(f"Invalid design method \"{design_method}\"")
+    return {"Mn": Mn, "Mc": Mc}
+
+
+###########################################################################
+# INTEGRATION: W SECTIONS
+###########################################################################
+
+@instrumented()
+def calc_w_shape_flexural_capacity(section: SteelSection,
+                                   material: SteelMaterial,
+                                   unbraced_length: float,
+                                   Cb: float=1.0,
+                                   design_method: str="nominal",
+                                   units: UnitSystem=IN_KIP,
+                                   header_level: int=1,
+                                   report: bool=True,
+                                   ) -> ef.Calculation|float:
+    """Calculate the major-axis flexural capacity of a W-shape (or other
+    doubly symmetric rolled I-shape) per Sections F2 and F3.
+    Shapes with noncompact or slender webs (Sections F4 and F5) are not supported."""
+    if not report:
+        if not calc_i_shape_web_is_compact(section, material, report=False):
+            raise NotImplementedError(f"{section.label} has a noncompact or slender web; "
+                                      "AISC 360-22 Sections F4 and F5 are not implemented")
+        Mp = calc_i_shape_plastic_moment(section, material, report=False)
+        Mn = calc_i_shape_lateral_torsional_buckling_strength(section, material, Mp,
+                                                              unbraced_length, Cb,
+                                                              report=False)
+        Mn_FLB = calc_i_shape_flange_local_buckling_strength(section, material, Mp,
+                                                             report=False)
+        if Mn_FLB is not None:
+            Mn = min(Mn, Mn_FLB)
+        return _available_flexural_strength(Mn, design_method)
+
+    ef.Heading(f"Flexural Capacity of {section.label}", header_level)
+    ef.TextBlock("Following AISC 360-22")
+    ef.Heading("Web Compactness", header_level+1)
+    if not calc_i_shape_web_is_compact(section, material, units):
+        raise NotImplementedError(f"{section.label} has a noncompact or slender web; "
+                                  "AISC 360-22 Sections F4 and F5 are not implemented")
+    ef.Heading("Yielding", header_level+1)
+    Mp = calc_i_shape_plastic_moment(section, material, units)
+    ef.Heading("Lateral-Torsional Buckling", header_level+1)
+    Mn_LTB = calc_i_shape_lateral_torsional_buckling_strength(section, material, Mp,
+                                                              unbraced_length, Cb, units)
+    ef.Heading("Compression Flange Local Buckling", header_level+1)
+    Mn_FLB = calc_i_shape_flange_local_buckling_strength(section, material, Mp, units)
+    if Mn_FLB is None:
+        Mn = ef.Calculation("M_n", Mn_LTB, units.moment, "Nominal flexural strength")
+    else:
+        Mn = ef.Calculation("M_n", ef.minimum(Mn_LTB, Mn_FLB), units.moment,
+                            "Nominal flexural strength")
+    if design_method.lower() == "nominal":
+        return Mn
+    elif design_method.lower() == "lrfd":
+        phi = ef.Input("\\phi_b", PHI_B, None,
+                       "LRFD strength reduction factor", "AISC 360-22 Sect F1")
+        phiMn = ef.Calculation("\\phi_bM_n", phi*Mn, units.moment, "Design flexural strength")
+        return phiMn
+    elif design_method.lower() == "asd":
+        Omega = ef.Input("\\Omega_b", OMEGA_B, None,
+                         "ASD safety factor", "AISC 360-22 Sect F1")
+        Mn_Omega = ef.Calculation("M_n/\\Omega_b", Mn/Omega, units.moment,
+                                  "Allowable flexural strength")
+        return Mn_Omega
@@ -0,0 +1,347 @@
+"""
+Member-level design per AISC 360-22
+
+Dispatches each limit state to the integration functions for the member's
+section type and compares the available strength with the governing demand.
+The integration functions work in conversions.calculation_units, so their
+strengths are scaled to the member's force and moment units here (MM_KN
+strengths are calculated in N and N-mm and reported in kN and kN-mm).
+"""
+
+from itertools import islice
+from time import perf_counter
+from typing import Iterable
+import efficalc as ef
+import numpy as np
+from pysteelmanual import instrumentation
+from pysteelmanual.cache import CAPACITY_CACHE, CapacityCache, capacity_key
+from pysteelmanual.conversions import calculation_units, strength_factors
+from pysteelmanual.units import UnitSystem, IN_KIP
+from pysteelmanual.sections import SteelSection, RoundBar
+from pysteelmanual.materials import SteelMaterial
+from pysteelmanual.shapetable import AISCShape
+from pysteelmanual.steelcodes.aisc_360_22 import compression, flexure
+
+# Version of the results of this module. Bump it with any change to the
+# strength equations or their dispatch that changes a member's results, so
+# persistent result caches written before the change are cleared.
+CODE_VERSION = 1
+
+# Doubly symmetric rolled I-shape families handled by the W-shape functions
+I_SHAPE_FAMILIES = ("W_shapes", "HP_shapes", "M_shapes", "S_shapes")
+
+# Force action used as the demand for each limit state. Axial force is
+# positive in compression.
+LIMIT_STATES = {"compression": "axial",
+                "major_flex": "major_flex"}
+
+# Quantity of the capacity and demand of each limit state, for unit conversion
+LIMIT_STATE_QUANTITIES = {"compression": "force",
+                          "major_flex": "moment"}
+
+# Report heading and required strength symbol for each limit state
+LIMIT_STATE_TITLES = {"compression": "Compression",
+                      "major_flex": "Major-Axis Flexure"}
+REQUIRED_STRENGTH_SYMBOLS = {"compression": "P_r",
+                             "major_flex": "M_r"}
+
+
+def is_i_shape(section: SteelSection) -> bool:
+    """Check whether a section is a doubly symmetric rolled I-shape"""
+    return isinstance(section, AISCShape) and section.family in I_SHAPE_FAMILIES
+
+
+def compression_geometry(length: float, design_props: dict={}) -> tuple:
+    """Return (Lx, Ly, Kx, Ky, Lz, Kz) for compression design. Unbraced
+    lengths "Lx", "Ly" and "Lz" in design_props["compression"] default to
+    the member length (Lz to Ly), and effective length factors "Kx", "Ky"
+    and "Kz" default to 1.0."""
+    props = design_props.get("compression", {})
+    Ly = props.get("Ly", length)
+    return (props.get("Lx", length), Ly, props.get("Kx", 1.0), props.get("Ky", 1.0),
+            props.get("Lz", Ly), props.get("Kz", 1.0))
+
+
+def check_compression_geometry(Lx: float, Ly: float, Kx: float, Ky: float,
+                               Lz: float, Kz: float):
+    """Raise a ValueError unless every effective length KL is positive.
+    The buckling equations divide by them."""
+    for axis, L, K in (("x", Lx, Kx), ("y", Ly, Ky), ("z", Lz, Kz)):
+        if not K*L > 0:
+            raise ValueError(f"Effective length K{axis}*L{axis} must be positive, got {K*L} "
+                             "(unbraced lengths default to the member length)")
+
+
+def major_flex_geometry(length: float, design_props: dict={}) -> tuple:
+    """Return (Lb, Cb) for major-axis flexural design. "Lb" in
+    design_props["major_flex"] defaults to the member length and "Cb"
+    defaults to 1.0."""
+    props = design_props.get("major_flex", {})
+    return (props.get("Lb", length), props.get("Cb", 1.0))
+
+
+def calc_compressive_capacity(section: SteelSection,
+                              material: SteelMaterial,
+                              length: float,
+                              design_props: dict={},
+                              design_method: str="lrfd",
+                              units: UnitSystem=IN_KIP,
+                              report: bool=False,
+                              header_level: int=1,
+                              ):
+    """Calculate the available compressive strength of a member
+    (see compression_geometry for the design_props used)."""
+    Lx, Ly, Kx, Ky, Lz, Kz = compression_geometry(length, design_props)
+    check_compression_geometry(Lx, Ly, Kx, Ky, Lz, Kz)
+    if isinstance(section, RoundBar):
+        return compression.calc_round_bar_compressive_capacity(
+            section, material, Lx, Ly, Kx, Ky, design_method, units, header_level, report)
+    if is_i_shape(section):
+        return compression.calc_w_shape_compressive_capacity(
+            section, material, Lx, Ly, Kx, Ky, Lz, Kz, design_method, units,
+            header_level, report)
+    raise NotImplementedError("Compression design is not implemented for "
+                              f"{getattr(section, 'label', type(section).__name__)}")
+
+
+def calc_major_flexural_capacity(section: SteelSection,
+                                 material: SteelMaterial,
+                                 length: float,
+                                 design_props: dict={},
+                                 design_method: str="lrfd",
+                                 units: UnitSystem=IN_KIP,
+                                 report: bool=False,
+                                 header_level: int=1,
+                                 ):
+    """Calculate the available major-axis flexural strength of a member
+    (see major_flex_geometry for the design_props used)."""
+    Lb, Cb = major_flex_geometry(length, design_props)
+    if not Lb >= 0:
+        raise ValueError(f"Unbraced length Lb must not be negative, got {Lb} "
+                         "(it defaults to the member length)")
+    if isinstance(section, RoundBar):
+        return flexure.calc_round_bar_flexural_capacity(
+            section, material, design_method, units, report=report)
+    if is_i_shape(section):
+        return flexure.calc_w_shape_flexural_capacity(
+            section, material, Lb, Cb, design_method, units, header_level, report)
+    raise NotImplementedError("Flexural design is not implemented for "
+                              f"{getattr(section, 'label', type(section).__name__)}")
+
+
+CAPACITY_FUNCTIONS = {"compression": calc_compressive_capacity,
+                      "major_flex": calc_major_flexural_capacity}
+GEOMETRY_FUNCTIONS = {"compression": compression_geometry,
+                      "major_flex": major_flex_geometry}
+
+
+def limit_state_key(limit_state: str,
+                    section: SteelSection,
+                    material: SteelMaterial,
+                    length: float,
+                    design_props: dict={},
+                    design_method: str="lrfd",
+                    units: UnitSystem=IN_KIP,
+                    ) -> tuple:
+    """Return the key of the inputs a limit-state capacity depends on: the
+    section, material, design method, units and only the geometry used by
+    that limit state. Two members (or one member before and after an update)
+    with equal keys have the same capacity."""
+    geometry = GEOMETRY_FUNCTIONS[limit_state](length, design_props)
+    return capacity_key(limit_state, section, material, geometry, design_method, units)
+
+
+def calc_capacity(limit_state: str,
+                  section: SteelSection,
+                  material: SteelMaterial,
+                  length: float,
+                  design_props: dict={},
+                  design_method: str="lrfd",
+                  units: UnitSystem=IN_KIP,
+                  cache: CapacityCache|None=CAPACITY_CACHE,
+                  ) -> float:
+    """Calculate the available strength for a limit state as a float in the
+    force or moment units of units, reusing the result for members with the
+    same section, material, geometry, design method and units. Pass
+    cache=None to bypass caching."""
+    if instrumentation.ACTIVE is not None:
+        start = perf_counter()
+        capacity = _calc_capacity(limit_state, section, material, length, design_props,
+                                  design_method, units, cache)
+        instrumentation.record("limit_states", limit_state, perf_counter() - start)
+        return capacity
+    return _calc_capacity(limit_state, section, material, length, design_props,
+                          design_method, units, cache)
+
+
+def _calc_capacity(limit_state, section, material, length, design_props,
+                   design_method, units, cache):
+    def compute():
+        capacity = CAPACITY_FUNCTIONS[limit_state](section, material, length, design_props,
+                                                   design_method, calculation_units(units))
+        return capacity*strength_factors(units)[LIMIT_STATE_QUANTITIES[limit_state]]
+    if cache is None:
+        return compute()
+    key = limit_state_key(limit_state, section, material, length, design_props,
+                          design_method, units)
+    return cache.get_or_compute(key, compute)
+
+
+def calc_demand(limit_state: str,
+                force_actions: dict[str, dict[str, float]],
+                ) -> tuple[float, str|None]:
+    """Return the governing demand for a limit state and the name of the
+    load combination that produces it. Compression demand is the largest
+    positive axial force; flexural demand is the largest absolute moment."""
+    action = LIMIT_STATES[limit_state]
+    demand = 0.0
+    combination = None
+    for name, actions in force_actions.items():
+        value = actions.get(action, 0.0)
+        value = max(value, 0.0) if limit_state == "compression" else abs(value)
+        if combination is None or value > demand:
+            demand = value
+            combination = name
+    return demand, combination
+
+
+def required_limit_states(force_actions: dict[str, dict[str, float]]) -> list[str]:
+    """Return the limit states with a demand in any load combination"""
+    return [limit_state for limit_state, action in LIMIT_STATES.items()
+            if any(action in actions for actions in force_actions.values())]
+
+
+def calc_demands(limit_state: str, actions: Iterable[dict[str, float]]) -> np.ndarray:
+    """Return the demand for a limit state from each set of force actions as
+    an array. Compression demand is the positive part of the axial force;
+    flexural demand is the absolute moment. Missing actions are zero."""
+    action = LIMIT_STATES[limit_state]
+    values = np.fromiter((forces.get(action, 0.0) for forces in actions), dtype=float)
+    if limit_state == "compression":
+        return np.maximum(values, 0.0)
+    return np.abs(values)
+
+
+def design_combinations(section: SteelSection,
+                        material: SteelMaterial,
+                        length: float,
+                        design_props: dict,
+                        combinations: Iterable[tuple[str, dict[str, float]]],
+                        design_method: str="lrfd",
+                        units: UnitSystem=IN_KIP,
+                        chunk_size: int=4096,
+                        return_ratios: bool=False,
+                        known_capacities: dict[str, float]={},
+                        ) -> dict[str, dict]:
+    """Check every limit state with a demand in a stream of load combinations.
+
+    combinations is an iterable of (name, force actions) pairs, such as
+    force_actions.items() or a generator. It is consumed in chunks, so the
+    full set is never held in memory. Each limit-state capacity is computed
+    once, the first time a combination has a demand for it, and each chunk's
+    demand/capacity ratios are evaluated as arrays.
+
+    Returns a dictionary keyed by limit state, each holding the available
+    strength ("capacity"), the governing demand ("demand"), the
+    demand/capacity ratio ("ratio") and the governing load combination
+    ("combination"). With return_ratios=True, each also holds the ratio for
+    every combination, in input order ("ratios").
+
+    known_capacities holds available strengths already known, by limit state,
+    which are used instead of being recalculated."""
+    capacities = {}
+    governing = {}
+    ratios = {}
+    seen = 0
+    iterator = iter(combinations)
+    while chunk := list(islice(iterator, chunk_size)):
+        names = [name for name, _ in chunk]
+        actions = [forces for _, forces in chunk]
+        for limit_state, action in LIMIT_STATES.items():
+            if limit_state not in capacities:
+                if not any(action in forces for forces in actions):
+                    continue
+                if limit_state in known_capacities:
+                    capacities[limit_state] = known_capacities[limit_state]
+                else:
+                    capacities[limit_state] = calc_capacity(limit_state, section, material,
+                                                            length, design_props,
+                                                            design_method, units)
+                # Earlier combinations had no demand for this limit state
+                governing[limit_state] = (0.0, 0.0, None)
+                ratios[limit_state] = [np.zeros(seen)]
+            capacity = capacities[limit_state]
+            demands = calc_demands(limit_state, actions)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                chunk_ratios = demands/capacity if capacity else np.full(len(demands), np.inf)
+            i = int(np.argmax(chunk_ratios))
+            if governing[limit_state][2] is None or chunk_ratios[i] > governing[limit_state][0]:
+                governing[limit_state] = (float(chunk_ratios[i]), float(demands[i]), names[i])
+            if return_ratios:
+                ratios[limit_state].append(chunk_ratios)
+        seen += len(chunk)
+
+    results = {}
+    for limit_state in LIMIT_STATES:
+        if limit_state not in capacities:
+            continue
+        ratio, demand, combination = governing[limit_state]
+        results[limit_state] = {"capacity": capacities[limit_state],
+                                "demand": demand,
+                                "ratio": ratio,
+                                "combination": combination}
+        if return_ratios:
+            results[limit_state]["ratios"] = np.concatenate(ratios[limit_state])
+    return results
+
+
+def design_limit_states(section: SteelSection,
+                        material: SteelMaterial,
+                        length: float,
+                        design_props: dict,
+                        force_actions: dict[str, dict[str, float]],
+                        design_method: str="lrfd",
+                        units: UnitSystem=IN_KIP,
+                        known_capacities: dict[str, float]={},
+                        ) -> dict[str, dict]:
+    """Check every limit state with a demand in force_actions.
+
+    Returns a dictionary keyed by limit state, each holding the available
+    strength ("capacity"), the governing demand ("demand"), the
+    demand/capacity ratio ("ratio") and the governing load combination
+    ("combination"). known_capacities are reused as in design_combinations."""
+    return design_combinations(section, material, length, design_props,
+                               force_actions.items(), design_method, units,
+                               known_capacities=known_capacities)
+
+
+def calc_member_report(label: str,
+                       section: SteelSection,
+                       material: SteelMaterial,
+                       length: float,
+                       design_props: dict,
+                       design_method: str,
+                       units: UnitSystem,
+                       demands: dict[str, tuple[float, str|None]],
+                       ):
+    """Build the Efficalc calculation report for a member's limit state
+    checks. demands maps each limit state to its governing demand and load
+    combination. Run inside an Efficalc calculation function, e.g. through
+    ReportBuilder."""
+    ef.Title(f"Member {label}")
+    ef.TextBlock(f"Section: {getattr(section, 'label', type(section).__name__)}")
+    for limit_state, (demand, combination) in demands.items():
+        ef.Heading(LIMIT_STATE_TITLES[limit_state], 1)
+        capacity = CAPACITY_FUNCTIONS[limit_state](section, material, length, design_props,
+                                                   design_method, calculation_units(units),
+                                                   report=True, header_level=2)
+        quantity = LIMIT_STATE_QUANTITIES[limit_state]
+        unit = units.force if quantity == "force" else units.moment
+        factor = strength_factors(units)[quantity]
+        if factor != 1.0:
+            capacity = ef.Calculation(f"{REQUIRED_STRENGTH_SYMBOLS[limit_state][0]}_c",
+                                      factor*capacity, unit,
+                                      f"Available strength in {unit}")
+        required = ef.Input(REQUIRED_STRENGTH_SYMBOLS[limit_state], demand, unit,
+                            f"Required strength (governing combination {combination})")
+        ef.Comparison(required, "<=", capacity)
@@ -1,14 +1,36 @@
-from steelpy.steelpy import Section
+from functools import cache
+from importlib import import_module
+from typing import TYPE_CHECKING
 from .definitions.designcodes import DESIGN_CODES
 from .steelcodes import aisc_360_22
 from .units import UnitSystem, IN_KIP
 from .materials import SteelMaterial
 from .sections import SteelSection
+from .reports import CalcRecord
+from .instrumentation import instrumented
+if TYPE_CHECKING:
+    from .resultcache import ResultCache
+
+# Member design module of each design code. These load NumPy and Efficalc,
+# so they are imported on first use rather than with the package.
+DESIGN_MODULES = {"aisc_360_22": "pysteelmanual.steelcodes.aisc_360_22.members"}
+
+
+@cache
+def design_module(design_code: str):
+    """Return the member design module of a design code, importing it on
+    first use"""
+    return import_module(DESIGN_MODULES[design_code])
 
 
 class SteelMember():
     """
     Member class for steel design.
+
+    force_actions maps load combination names to force actions, e.g.
+    {"LC1": {"axial": 10.5, "major_flex": 5.3}}, with axial force positive
+    in compression. design_props holds limit state parameters such as
+    {"compression": {"Lx": 120, "Ly": 60}, "major_flex": {"Lb": 60}}.
     """
     def __init__(self, 
                  label:str, 
@@ -23,6 +45,11 @@ class SteelMember():
         self.label = label
         self.design_code = design_code.lower()
         self.design_method = design_method.lower()
+        if isinstance(section, str):
+            # Imported here so the shape tables (and NumPy) are only loaded
+            # when a member actually references an AISC designation.
+            from .shapetable import get_shape
+            section = get_shape(section, units=units)
         self.section = section
         self.material = material
         self.length = length
@@ -30,37 +57,194 @@ class SteelMember():
         self.design_props = design_props
         self.force_actions=force_actions
         self.results = {}
+        # Limit state -> (limit_state_key, capacity) of the current results
+        self._capacities = {}
+        self.report_record = None
+        self.report_html = None
         self.validate()
 
     def validate(self):
         if self.design_code not in DESIGN_CODES:
             raise ValueError(f"""Invalid design code \"{self.design_code}\".\n
                              Available codes: {DESIGN_CODES}""")
-        if (self.section.units != self.units or
+        if self.section is None:
+            # Sections may be left for select_section() to choose
+            section_units = self.units
+        else:
+            section_units = self.section.units
+        if (section_units != self.units or
             self.material.units != self.units):
             raise ValueError(f"Incompatible unit systems:\n\
                                 Member units: {self.units.label}\n\
-                                Section units: {self.section.units.label}\n\
+                                Section units: {section_units.label}\n\
                                 Material units: {self.material.units.label}\n\
                                 All components must use same unit system.")
     
-    def design_member(self):
+    @instrumented("members")
+    def design_member(self, report: bool=False, result_cache: "ResultCache|None"=None):
         """
         Run member design checks and populate results dictionary.
+
+        Results are keyed by limit state, each holding the available strength
+        ("capacity"), governing demand ("demand"), demand/capacity ratio
+        ("ratio") and governing load combination ("combination").
+
+        Only the inputs needed to rebuild the calculation report are kept
+        (report_record); calc_report() builds the report on request. With
+        report=True the report HTML is built immediately (report_html).
+
+        Capacities from the previous run whose inputs are unchanged are
+        reused (see update_member); demands and ratios are always evaluated
+        from the current force_actions.
+
+        With a result_cache, stored results for identical inputs are reused
+        and new results are stored.
+        """
+        results = None
+        if result_cache is not None:
+            key = result_cache.key(self)
+            results = result_cache.get(key)
+        if results is None:
+            results = design_module(self.design_code).design_limit_states(
+                self.section, self.material, self.length, self.design_props,
+                self.force_actions, self.design_method, self.units,
+                self.known_capacities())
+            if result_cache is not None:
+                result_cache.put(key, results)
+        self.set_results(results)
+        if report:
+            self.report_html = self.report_record.html()
+
+    def capacity_keys(self, limit_states=None) -> dict[str, tuple]:
+        """
+        Return the key of the inputs each limit-state capacity depends on,
+        by limit state (all limit states of the design code by default).
+        """
+        module = design_module(self.design_code)
+        if limit_states is None:
+            limit_states = module.LIMIT_STATES
+        return {limit_state: module.limit_state_key(limit_state, self.section,
+                                                    self.material, self.length,
+                                                    self.design_props,
+                                                    self.design_method, self.units)
+                for limit_state in limit_states}
+
+    def known_capacities(self) -> dict[str, float]:
+        """
+        Return the capacities of the last design run whose inputs have not
+        changed since, by limit state.
+        """
+        if not self._capacities:
+            return {}
+        keys = self.capacity_keys(self._capacities)
+        return {limit_state: capacity
+                for limit_state, (key, capacity) in self._capacities.items()
+                if keys[limit_state] == key}
+
+    def set_results(self, results: dict):
         """
-        self.results = {"Placeholder":"Results"}
+        Store design results, along with the inputs their capacities depend
+        on and the record for building the calculation report.
+        """
+        self.results = results
+        keys = self.capacity_keys(results)
+        self._capacities = {limit_state: (keys[limit_state], result["capacity"])
+                            for limit_state, result in results.items()}
+        self.report_record = self.create_report_record()
+        self.report_html = None
+
+    def create_report_record(self) -> CalcRecord:
+        """
+        Record the member inputs and governing demands of the current results
+        for building the calculation report later.
+        """
+        design_props = {limit_state: dict(props)
+                        for limit_state, props in self.design_props.items()}
+        demands = {limit_state: (result["demand"], result["combination"])
+                   for limit_state, result in self.results.items()}
+        return CalcRecord(design_module(self.design_code).calc_member_report,
+                          label=self.label, section=self.section,
+                          material=self.material, length=self.length,
+                          design_props=design_props,
+                          design_method=self.design_method, units=self.units,
+                          demands=demands)
+
+    def calc_report(self) -> str:
+        """
+        Return the calculation report of the last design run as HTML,
+        building it from report_record if it was not built eagerly.
+        """
+        if self.report_html is not None:
+            return self.report_html
+        if self.report_record is None:
+            raise ValueError(f"Member {self.label} has not been designed")
+        return self.report_record.html()
+
+    @instrumented("members")
+    def design_combinations(self, combinations=None, chunk_size: int=4096,
+                            return_ratios: bool=False) -> dict:
+        """
+        Run member design checks against a stream of load combinations and
+        populate results dictionary.
+
+        combinations is an iterable of (name, force actions) pairs, e.g. a
+        generator over an analysis export, and defaults to
+        force_actions.items(). Capacities are computed once per limit state
+        and ratios are evaluated in vectorized chunks. With return_ratios=True
+        each limit state also holds the ratio for every combination
+        ("ratios"). Returns the results.
+        """
+        if combinations is None:
+            combinations = self.force_actions.items()
+        self.set_results(design_module(self.design_code).design_combinations(
+            self.section, self.material, self.length, self.design_props,
+            combinations, self.design_method, self.units, chunk_size, return_ratios,
+            self.known_capacities()))
+        return self.results
+
+    @instrumented("members")
+    def select_section(self, family: str="W_shapes",
+                       criteria: dict[str, dict[str, float]]={},
+                       max_ratio: float=1.0) -> dict:
+        """
+        Select the lightest adequate shape in an AISC shape family for the
+        member's length, design_props and force_actions. If a shape is found,
+        the member is updated to use it and its design results are stored.
+        Returns the search summary from sizing.select_lightest_section.
+        """
+        from .sizing import select_lightest_section
+        selection = select_lightest_section(self.length, self.design_props,
+                                            self.force_actions, self.material,
+                                            family, self.design_method, self.units,
+                                            criteria, max_ratio)
+        if selection["section"] is not None:
+            self.section = selection["section"]
+            self.set_results(selection["results"])
+        return selection
 
     def clear_results(self):
         """
         Clear member design results.
         """
         self.results = {}
+        self._capacities = {}
+        self.report_record = None
+        self.report_html = None
         print("Member results cleared")
 
     def update_member(self, section=None, length=None, units=None,
                       force_actions=None, design_props=None):
         """
-        Update member parameters and clear results.
+        Update member parameters and invalidate the results that depend on
+        them.
+
+        A limit state's result is removed when an input of its capacity
+        changes (the section, units, or the length and design_props used by
+        that limit state), and every result is removed when force_actions
+        change. Capacities with unchanged inputs are kept, so the next
+        design_member() recalculates only the affected ones: a new
+        design_props["major_flex"]["Lb"] keeps the compression result, and new
+        force_actions only re-evaluate demands and ratios.
         """
         if section:
             self.section=section
@@ -72,4 +256,16 @@ class SteelMember():
             self.force_actions=force_actions
         if design_props:
             self.design_props=design_props
-        self.clear_results()
\ No newline at end of file
+        keys = self.capacity_keys(self._capacities)
+        self._capacities = {limit_state: value
+                            for limit_state, value in self._capacities.items()
+                            if keys[limit_state] == value[0]}
+        if force_actions:
+            results = {}
+        else:
+            results = {limit_state: result for limit_state, result in self.results.items()
+                       if limit_state in self._capacities}
+        if len(results) < len(self.results):
+            self.results = results
+            self.report_record = None
+            self.report_html = None
\ No newline at end of file
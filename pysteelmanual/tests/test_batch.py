@@ -0,0 +1,61 @@
+import os
+from concurrent.futures.process import BrokenProcessPool
+from pysteelmanual import SteelMember
+from pysteelmanual.batch import design_members
+from pysteelmanual.materials import ASTM_A36, ASTM_A992_GR_50
+from pysteelmanual.sections import RectBar
+
+
+def make_members(count):
+    members = []
+    for i in range(count):
+        members.append(SteelMember(f"M{i}", "W12X26", ASTM_A992_GR_50, 120 + i,
+                                   force_actions={"LC1": {"axial": 100 + i, "major_flex": 500}}))
+    # Rectangular bars are not designed yet, so this member fails
+    members.append(SteelMember("Bad", RectBar(2, 4), ASTM_A36, 120,
+                               force_actions={"LC1": {"axial": 10}}))
+    return members
+
+
+def test_design_members_matches_serial():
+    expected = [result.results for result in design_members(make_members(25), workers=0)]
+    results = list(design_members(make_members(25), workers=2, chunksize=4))
+    assert [result.index for result in results] == list(range(26))
+    assert [result.results for result in results] == expected
+    assert results[0].member.results == expected[0]
+
+
+def test_design_members_preserves_errors():
+    results = sorted(design_members(make_members(10), workers=2, chunksize=3, ordered=False),
+                     key=lambda result: result.index)
+    assert [result.index for result in results] == list(range(11))
+    assert all(result.ok for result in results[:-1])
+    assert isinstance(results[-1].error, NotImplementedError)
+    assert results[-1].results is None
+
+
+def test_design_members_reports_chunk_failures():
+    members = make_members(6)[:6]
+    # A lambda cannot be pickled, so the chunk holding this member never
+    # reaches a worker
+    members[2].design_props = {"note": lambda: None}
+    results = list(design_members(members, workers=2, chunksize=2))
+    assert [result.index for result in results] == list(range(6))
+    assert [result.ok for result in results] == [True, True, False, False, True, True]
+    assert results[3].error is results[2].error
+
+
+class CrashingMember(SteelMember):
+    def design_member(self, *args, **kwargs):
+        os._exit(1)
+
+
+def test_design_members_survives_worker_crash():
+    members = make_members(4)[:4]
+    members.insert(1, CrashingMember("Crash", "W12X26", ASTM_A992_GR_50, 120,
+                                     force_actions={"LC1": {"axial": 100}}))
+    results = list(design_members(members, workers=1, chunksize=1, max_pending=2))
+    assert [result.index for result in results] == list(range(5))
+    assert isinstance(results[1].error, BrokenProcessPool)
+    # Members in chunks after the crash are reported as failed, not dropped
+    assert all(isinstance(result.error, BrokenProcessPool) for result in results[2:])
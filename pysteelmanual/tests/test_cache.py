@@ -0,0 +1,52 @@
+from pysteelmanual import SteelMember
+from pysteelmanual.cache import CAPACITY_CACHE, CapacityCache, section_key
+from pysteelmanual.materials import ASTM_A36, ASTM_A992_GR_50
+from pysteelmanual.sections import RoundBar
+from pysteelmanual.steelcodes.aisc_360_22 import members
+
+
+def test_capacity_cache_lru():
+    cache = CapacityCache(maxsize=2)
+    assert cache.get_or_compute("a", lambda: 1.0) == 1.0
+    assert cache.get_or_compute("b", lambda: 2.0) == 2.0
+    assert cache.get_or_compute("a", lambda: -1.0) == 1.0  # hit, "a" now most recent
+    assert cache.get_or_compute("c", lambda: 3.0) == 3.0   # evicts "b"
+    assert cache.get_or_compute("b", lambda: 4.0) == 4.0
+    assert cache.stats() == {"hits": 1, "misses": 4, "evictions": 2, "size": 2,
+                             "maxsize": 2, "hit_rate": 0.2}
+    cache.resize(1)
+    assert len(cache) == 1
+    cache.clear()
+    assert cache.stats()["misses"] == 0 and len(cache) == 0
+
+
+def test_capacity_cache_disabled():
+    cache = CapacityCache(enabled=False)
+    assert cache.get_or_compute("a", lambda: 1.0) == 1.0
+    assert cache.get_or_compute("a", lambda: 2.0) == 2.0
+    assert cache.stats()["misses"] == 0 and len(cache) == 0
+
+
+def test_section_key_is_value_based():
+    assert section_key(RoundBar(1.0)) == section_key(RoundBar(1.0))
+    assert section_key(RoundBar(1.0)) != section_key(RoundBar(1.25))
+
+
+def test_repeated_members_hit_cache():
+    CAPACITY_CACHE.clear()
+    force_actions = {"LC1": {"axial": 100, "major_flex": 500}}
+    results = []
+    for i in range(5):
+        member = SteelMember(f"B{i}", "W12X26", ASTM_A992_GR_50, 144,
+                             force_actions=force_actions)
+        member.design_member()
+        results.append(member.results)
+    assert all(result == results[0] for result in results)
+    assert CAPACITY_CACHE.stats()["misses"] == 2
+    assert CAPACITY_CACHE.stats()["hits"] == 8
+    uncached = members.calc_capacity("compression", member.section, ASTM_A992_GR_50, 144,
+                                     cache=None)
+    assert uncached == results[0]["compression"]["capacity"]
+    # A different material is a different key
+    members.calc_capacity("compression", member.section, ASTM_A36, 144)
+    assert CAPACITY_CACHE.stats()["misses"] == 3
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+from efficalc.calculation_runner import CalculationRunner
+from pysteelmanual.steelcodes.aisc_360_22 import combined
+
+
+def test_interaction_ratio_branches():
+    # H1-1a: 0.5 + 8/9*(0.3 + 0.15)
+    assert combined.calc_interaction_ratio_H1_1(50, 100, -60, 200, 15, 100, report=False) == \
+        pytest.approx(0.5 + 8/9*0.45)
+    # H1-1b: 0.1/2 + 0.3, tension taken as zero
+    assert combined.calc_interaction_ratio_H1_1(10, 100, 60, 200, report=False) == \
+        pytest.approx(0.35)
+    assert combined.calc_interaction_ratio_H1_1(-10, 100, 60, 200, report=False) == \
+        pytest.approx(0.3)
+    batch = combined.calc_interaction_ratio_H1_1_batch([50, 10, -10], 100, [-60, 60, 60], 200,
+                                                       [15, 0, 0], [100, np.inf, np.inf])
+    assert np.allclose(batch, [0.5 + 8/9*0.45, 0.35, 0.3])
+
+
+def test_interaction_ratio_report():
+    results = {}
+    def calculation():
+        results["a"] = combined.calc_interaction_ratio_H1_1(50, 100, -60, 200, 15, 100)
+        results["b"] = combined.calc_interaction_ratio_H1_1(10, 100, 60, 200)
+    CalculationRunner(calculation).calculate_all_items()
+    assert results["a"].result() == pytest.approx(0.5 + 8/9*0.45)
+    assert results["b"].result() == pytest.approx(0.35)
+
+
+def test_screen_matches_loops():
+    rng = np.random.default_rng(360)
+    members, combinations, stations = 50, 4, 7
+    Pr = rng.uniform(-100, 400, (members, combinations, stations))
+    Mrx = rng.uniform(-900, 900, (members, combinations, stations))
+    Mry = rng.uniform(-200, 200, (members, combinations, stations))
+    Pc = rng.uniform(300, 900, members)
+    Mcx = rng.uniform(500, 2000, members)
+    Mcy = rng.uniform(200, 800, members)
+    Pr[3, :, 4:] = np.nan  # member 3 has fewer stations
+    Pr[7] = np.nan         # member 7 has no demands
+
+    screen = combined.screen_interaction_H1_1(Pr, Mrx, Pc, Mcx, Mry, Mcy)
+    chunked = combined.screen_interaction_H1_1(Pr, Mrx, Pc, Mcx, Mry, Mcy, chunk_size=8)
+    assert np.array_equal(screen["ratio"], chunked["ratio"], equal_nan=True)
+    for i in range(members):
+        ratios = [(combined.calc_interaction_ratio_H1_1(Pr[i, j, k], Pc[i], Mrx[i, j, k], Mcx[i],
+                                                        Mry[i, j, k], Mcy[i], report=False), j, k)
+                  for j in range(combinations) for k in range(stations)
+                  if not np.isnan(Pr[i, j, k])]
+        if not ratios:
+            assert np.isnan(screen["ratio"][i])
+            assert screen["location"][0][i] == -1
+            continue
+        ratio, j, k = max(ratios, key=lambda item: item[0])
+        assert screen["ratio"][i] == pytest.approx(ratio)
+        assert (screen["location"][0][i], screen["location"][1][i]) == (j, k)
+        assert screen["equation_a"][i] == (max(Pr[i, j, k], 0)/Pc[i] >= 0.2)
@@ -1,9 +1,18 @@
+import random
 from math import isclose
+import numpy as np
+import pytest
 import pysteelmanual.steelcodes.aisc_360_22.compression as comp
+from pysteelmanual.sections import RoundBar
+from pysteelmanual.materials import ASTM_A36, ASTM_A992_GR_50
+from pysteelmanual.shapetable import get_shape, get_shape_table, AISCShape
 from pysteelmanual.units import unit_systems
 
+report_modes = pytest.mark.parametrize("report", [True, False], ids=["report", "fast"])
 
-def test_calc_slenderness_ratio():
+
+@report_modes
+def test_calc_slenderness_ratio(report):
     L1 = 144.5
     r1 = 2.0
 
@@ -11,29 +20,33 @@ def test_calc_slenderness_ratio():
     r2 = 1.6
     K2 = 0.8
 
-    assert comp.calc_slenderness_ratio(L1, r1).result() == 72.25
-    assert comp.calc_slenderness_ratio(L2, r2, K2).result() == 83.0
+    assert float(comp.calc_slenderness_ratio(L1, r1, report=report)) == 72.25
+    assert float(comp.calc_slenderness_ratio(L2, r2, K2, report=report)) == 83.0
 
 
-def test_calc_nominal_compressive_strength_E3():
+@report_modes
+def test_calc_nominal_compressive_strength_E3(report):
     Fn = 204.3
     Ag = 25
 
-    assert isclose(comp.calc_nominal_compressive_strength_E3(Fn, Ag), 5107.5)
+    assert isclose(comp.calc_nominal_compressive_strength_E3(Fn, Ag, report=report), 5107.5)
 
 
-def test_calc_nominal_flexural_buckling_stress():
+@report_modes
+def test_calc_nominal_flexural_buckling_stress(report):
     Fy = 50
-    assert isclose(comp.calc_nominal_flexural_buckling_stress(61, Fy), 35.47928304622102)
-    assert isclose(comp.calc_nominal_flexural_buckling_stress(13.61, Fy), 11.93597)
+    assert isclose(comp.calc_nominal_flexural_buckling_stress(61, Fy, report=report), 35.47928304622102)
+    assert isclose(comp.calc_nominal_flexural_buckling_stress(13.61, Fy, report=report), 11.93597)
 
 
-def test_calc_elastic_buckling_stress():
-    assert isclose(comp.calc_elastic_buckling_stress(68.5, 29000), 60.99814111)
-    assert isclose(comp.calc_elastic_buckling_stress(145, 29000), 13.61324745)
+@report_modes
+def test_calc_elastic_buckling_stress(report):
+    assert isclose(comp.calc_elastic_buckling_stress(68.5, 29000, report=report), 60.99814111)
+    assert isclose(comp.calc_elastic_buckling_stress(145, 29000, report=report), 13.61324745)
 
 
-def test_calc_ft_elastic_buckling_stress_doubly_symmetric():
+@report_modes
+def test_calc_ft_elastic_buckling_stress_doubly_symmetric(report):
     Lcz = 206.3
     Cw = 9940
     Ix = 2070
@@ -42,4 +55,92 @@ def test_calc_ft_elastic_buckling_stress_doubly_symmetric():
     E = 29000
     G = 11200
 
-    assert isclose(comp.calc_ft_elastic_buckling_stress_doubly_symmetric(Lcz, Cw, Ix, Iy, J, E, G), 62.1312022)
\ No newline at end of file
+    assert isclose(comp.calc_ft_elastic_buckling_stress_doubly_symmetric(Lcz, Cw, Ix, Iy, J, E, G, report=report), 62.1312022)
+
+
+def test_fast_path_matches_report_path():
+    rng = random.Random(360)
+    for _ in range(200):
+        L = rng.uniform(12, 600)
+        r = rng.uniform(0.25, 6)
+        K = rng.uniform(0.5, 2.1)
+        E = rng.uniform(25000, 30000)
+        Fy = rng.uniform(30, 100)
+        slenderness = comp.calc_slenderness_ratio(L, r, K)
+        Fe = comp.calc_elastic_buckling_stress(slenderness.result(), E)
+        Fn = comp.calc_nominal_flexural_buckling_stress(Fe.result(), Fy)
+        assert comp.calc_slenderness_ratio(L, r, K, report=False) == slenderness.result()
+        assert comp.calc_elastic_buckling_stress(slenderness.result(), E, report=False) == Fe.result()
+        assert comp.calc_nominal_flexural_buckling_stress(Fe.result(), Fy, report=False) == Fn.result()
+        assert (comp.calc_nominal_compressive_strength_E3(Fn, 10.0, report=False)
+                == comp.calc_nominal_compressive_strength_E3(Fn, 10.0).result())
+        assert (comp.calc_ft_elastic_buckling_stress_doubly_symmetric(L, 9940, 2070, 92.9, 6.03, E, 11200, report=False)
+                == comp.calc_ft_elastic_buckling_stress_doubly_symmetric(L, 9940, 2070, 92.9, 6.03, E, 11200).result())
+
+
+@pytest.mark.parametrize("design_method", ["nominal", "lrfd", "asd"])
+def test_calc_round_bar_compressive_capacity_fast_path(design_method):
+    bar = RoundBar(1.25)
+    report = comp.calc_round_bar_compressive_capacity(bar, ASTM_A36, 96, 48, 1.0, 1.0, design_method)
+    fast = comp.calc_round_bar_compressive_capacity(bar, ASTM_A36, 96, 48, 1.0, 1.0, design_method,
+                                                    report=False)
+    assert fast == report.result()
+
+
+@pytest.mark.parametrize("design_method", ["nominal", "lrfd", "asd"])
+def test_calc_round_bar_compressive_capacity_batch(design_method):
+    diameters = np.array([0.5, 0.75, 1.0, 1.25, 2.0])[:, None]
+    lengths = np.array([12.0, 48.0, 96.0, 240.0])[None, :]
+    results = comp.calc_round_bar_compressive_capacity_batch(
+        diameters, lengths, lengths/2, 1.0, 1.0, ASTM_A36.Fy, ASTM_A36.E, design_method)
+    assert results["Pc"].shape == (5, 4)
+    for i, D in enumerate(diameters[:, 0]):
+        for j, L in enumerate(lengths[0]):
+            expected = comp.calc_round_bar_compressive_capacity(RoundBar(D), ASTM_A36, L, L/2, 1.0, 1.0,
+                                                                design_method, report=False)
+            assert isclose(results["Pc"][i, j], expected, rel_tol=1e-14)
+
+
+def test_calc_round_bar_compressive_capacity_batch_selects_equation():
+    Fe = np.array([61, 13.61])
+    assert np.allclose(comp.calc_nominal_flexural_buckling_stress_batch(Fe, 50),
+                       [35.47928304622102, 11.93597])
+
+
+@pytest.mark.parametrize("name, length, expected", [("W14X90", 240, 876.7),   # Manual Table 4-1a: 876
+                                                    ("W14X43", 0.01, 562.2)])  # slender web
+def test_calc_w_shape_compressive_capacity(name, length, expected):
+    shape = get_shape(name)
+    report = comp.calc_w_shape_compressive_capacity(shape, ASTM_A992_GR_50, length, length,
+                                                    design_method="lrfd")
+    fast = comp.calc_w_shape_compressive_capacity(shape, ASTM_A992_GR_50, length, length,
+                                                  design_method="lrfd", report=False)
+    assert fast == report.result()
+    assert isclose(fast, expected, abs_tol=0.05)
+
+
+def test_calc_effective_width():
+    # Fully effective below the E7-2 limit, reduced above it
+    assert comp.calc_effective_width(10.0, 0.5, 35.9, 50, 50, 0.18, 1.31, report=False) == 10.0
+    reduced = comp.calc_effective_width(20.0, 0.5, 35.9, 50, 50, 0.18, 1.31)
+    assert reduced.result() < 20.0
+    assert comp.calc_effective_width(20.0, 0.5, 35.9, 50, 50, 0.18, 1.31, report=False) == reduced.result()
+
+
+@pytest.mark.parametrize("design_method", ["nominal", "lrfd", "asd"])
+def test_calc_w_shape_compressive_capacity_batch(design_method):
+    table = get_shape_table("W_shapes")
+    rows = np.arange(0, len(table), 7)
+    properties = {name: values[rows, None] for name, values in table.columns.items()}
+    lengths = np.array([0.01, 60.0, 180.0, 480.0])[None, :]
+    results = comp.calc_w_shape_compressive_capacity_batch(
+        properties, ASTM_A992_GR_50.Fy, ASTM_A992_GR_50.E, ASTM_A992_GR_50.G,
+        lengths, lengths/2, design_method=design_method)
+    assert results["Pc"].shape == (len(rows), 4)
+    for i, row in enumerate(rows):
+        for j, L in enumerate(lengths[0]):
+            expected = comp.calc_w_shape_compressive_capacity(AISCShape(table, int(row)),
+                                                              ASTM_A992_GR_50, L, L/2,
+                                                              design_method=design_method,
+                                                              report=False)
+            assert isclose(results["Pc"][i, j], expected, rel_tol=1e-14)
@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+from pysteelmanual import SteelMember
+from pysteelmanual.batch import design_members
+from pysteelmanual.conversions import (unit_value, scale_factor, convert, convert_material,
+                                       convert_materials, convert_section,
+                                       convert_force_actions, convert_results,
+                                       calculation_units, strength_factors)
+from pysteelmanual.materials import ASTM_A36, ASTM_A992_GR_50
+from pysteelmanual.resultstore import ResultStore
+from pysteelmanual.sections import RoundBar
+from pysteelmanual.shapetable import get_shape, get_shape_table
+from pysteelmanual.units import IN_KIP, MM_KN
+
+
+def test_scale_factors():
+    assert unit_value("kip-in") == pytest.approx(4448.2216152605*0.0254)
+    assert scale_factor("length", IN_KIP, MM_KN) == pytest.approx(25.4)
+    assert scale_factor("inertia", IN_KIP, MM_KN) == pytest.approx(25.4**4)
+    assert scale_factor("warping", IN_KIP, MM_KN) == pytest.approx(25.4**6)
+    assert scale_factor("stress", IN_KIP, MM_KN) == pytest.approx(6.894757)
+    assert scale_factor("moment", IN_KIP, MM_KN) == pytest.approx(4.4482216*25.4)
+    assert scale_factor("force", MM_KN, IN_KIP) == pytest.approx(1/4.4482216)
+    assert np.allclose(convert(np.array([1.0, 2.0]), "area", IN_KIP, MM_KN), [645.16, 1290.32])
+    with pytest.raises(ValueError):
+        scale_factor("speed", IN_KIP, MM_KN)
+    with pytest.raises(ValueError):
+        unit_value("furlong")
+
+
+def test_converted_shape_table_is_cached():
+    table = get_shape_table("W_shapes", MM_KN)
+    assert get_shape_table("W_shapes", MM_KN) is table
+    assert table.units == MM_KN
+    shape = get_shape("W14X90", units=MM_KN)
+    original = get_shape("W14X90")
+    assert shape.units == MM_KN
+    assert shape.d == pytest.approx(original.d*25.4)
+    assert shape.Zx == pytest.approx(original.Zx*25.4**3)
+    assert shape.Cw == pytest.approx(original.Cw*25.4**6)
+    assert shape.weight == original.weight
+    assert convert_section(original, MM_KN) == shape
+    criteria = {"Zx": {"min": 100*25.4**3, "max": 200*25.4**3}}
+    assert list(table.select(criteria)) == list(get_shape_table("W_shapes").select(
+        {"Zx": {"min": 100, "max": 200}}))
+
+
+def test_convert_materials_and_sections():
+    material = convert_material(ASTM_A992_GR_50, MM_KN)
+    assert material.units == MM_KN
+    assert material.Fy == pytest.approx(344.74, rel=1e-4)
+    assert material.E == pytest.approx(199948, rel=1e-5)
+    assert convert_material(material, IN_KIP).Fy == pytest.approx(50)
+    assert convert_materials({"A36": ASTM_A36}, MM_KN)["A36"].Fu == pytest.approx(399.9, rel=1e-3)
+    bar = convert_section(RoundBar(2.0), MM_KN)
+    assert bar.D == pytest.approx(50.8)
+    assert bar.label == "50.8-mm Ø Round Bar"
+
+
+def test_strength_factors():
+    assert calculation_units(IN_KIP) is IN_KIP
+    assert strength_factors(IN_KIP) == {"force": 1.0, "moment": 1.0}
+    # MPa times mm^2 is N
+    assert calculation_units(MM_KN).force == "N"
+    assert calculation_units(MM_KN).moment == "N-mm"
+    assert strength_factors(MM_KN) == pytest.approx({"force": 1e-3, "moment": 1e-3})
+
+
+def test_design_in_converted_units():
+    force_actions = {"LC1": {"axial": 300.0, "major_flex": 2000.0}}
+    member = SteelMember("C1", "W14X90", ASTM_A992_GR_50, 240.0, force_actions=force_actions)
+    member.design_member()
+    metric = SteelMember("C1", "W14X90", convert_material(ASTM_A992_GR_50, MM_KN), 240.0*25.4,
+                         units=MM_KN,
+                         force_actions=convert_force_actions(force_actions, IN_KIP, MM_KN))
+    assert metric.section.units == MM_KN
+    metric.design_member()
+    expected = convert_results(member.results, IN_KIP, MM_KN)
+    for limit_state in ("compression", "major_flex"):
+        for field in ("capacity", "demand", "ratio"):
+            assert metric.results[limit_state][field] == pytest.approx(
+                expected[limit_state][field], rel=1e-3)
+    # Manual Table 4-1a: phi*Pn = 876 kips at Lc = 20 ft
+    assert metric.results["compression"]["capacity"] == pytest.approx(876.7*4.4482216, rel=1e-3)
+    # Strengths calculated in N and N-mm are converted in the report
+    report = metric.calc_report()
+    assert "\\mathrm{N}" in report and "P_c" in report and "M_c" in report
+
+    store = ResultStore().add_batch(design_members([member], workers=0))
+    converted = store.convert_units(IN_KIP, MM_KN)
+    assert converted["C1"]["compression"]["capacity"] == pytest.approx(
+        expected["compression"]["capacity"])
+    assert converted["C1"]["major_flex"]["demand"] == pytest.approx(2000*4.4482216*25.4)
+    assert converted["C1"]["major_flex"]["ratio"] == member.results["major_flex"]["ratio"]
+    assert store["C1"] == member.results
@@ -0,0 +1,37 @@
+from math import isclose
+import numpy as np
+import pytest
+import pysteelmanual.steelcodes.aisc_360_22.flexure as flex
+from pysteelmanual.sections import RoundBar
+from pysteelmanual.materials import ASTM_A36, ASTM_A572_GR_50, ASTM_A992_GR_50
+from pysteelmanual.shapetable import get_shape
+
+
+@pytest.mark.parametrize("design_method", ["nominal", "lrfd", "asd"])
+def test_calc_round_bar_flexural_capacity_batch(design_method):
+    diameters = np.array([0.5, 1.0, 1.5, 3.0])
+    results = flex.calc_round_bar_flexural_capacity_batch(diameters, ASTM_A36.Fy, design_method)
+    for D, Mc in zip(diameters, results["Mc"]):
+        expected = flex.calc_round_bar_flexural_capacity(RoundBar(D), ASTM_A36, design_method)
+        assert isclose(Mc, expected.result(), rel_tol=1e-14)
+
+
+def test_calc_round_bar_flexural_capacity_batch_broadcasts():
+    results = flex.calc_round_bar_flexural_capacity_batch([[1.0], [2.0]],
+                                                          [ASTM_A36.Fy, ASTM_A572_GR_50.Fy])
+    assert results["Mn"].shape == (2, 2)
+    with pytest.raises(ValueError):
+        flex.calc_round_bar_flexural_capacity_batch(1.0, 36, "bogus")
+
+
+@pytest.mark.parametrize("name, Lb, expected", [("W18X50", 0, 378.75),     # phi*Mp
+                                                ("W18X50", 120, 324.19),   # inelastic LTB
+                                                ("W18X50", 300, 129.73),   # elastic LTB
+                                                ("W6X15", 0, 38.12)])      # noncompact flange
+def test_calc_w_shape_flexural_capacity(name, Lb, expected):
+    shape = get_shape(name)
+    report = flex.calc_w_shape_flexural_capacity(shape, ASTM_A992_GR_50, Lb, design_method="lrfd")
+    fast = flex.calc_w_shape_flexural_capacity(shape, ASTM_A992_GR_50, Lb, design_method="lrfd",
+                                               report=False)
+    assert fast == report.result()
+    assert isclose(fast/12, expected, abs_tol=0.01)
@@ -0,0 +1,79 @@
+import gzip
+import json
+import pytest
+from pysteelmanual import SteelMember
+from pysteelmanual.ingest import (read_force_csv, read_force_ndjson, pynite_forces,
+                                  envelope_forces, design_from_records)
+from pysteelmanual.materials import ASTM_A992_GR_50
+
+ROWS = [("C1", "LC1", 0, 100, -20), ("C1", "LC1", 60, 110, 45), ("C1", "LC1", 120, 90, -60),
+        ("C1", "LC2", 0, -30, 5), ("C1", "LC2", 120, -40, 8),
+        ("C2", "LC1", 0, 250, 0), ("C2", "LC1", 144, 240, 12)]
+
+ENVELOPES = {"C1": {"LC1": {"axial": 110, "major_flex": -60},
+                    "LC2": {"axial": -30, "major_flex": 8}},
+             "C2": {"LC1": {"axial": 250, "major_flex": 12}}}
+
+
+def test_read_force_csv(tmp_path):
+    path = tmp_path / "forces.csv"
+    lines = ["Member,Combo,Station,P,Mz"] + [",".join(map(str, row)) for row in ROWS]
+    path.write_text("\n".join(lines) + "\n")
+    records = read_force_csv(str(path), {"member": "Member", "combination": "Combo",
+                                         "axial": "P", "major_flex": "Mz"}, axial_sign=-1)
+    assert next(records) == ("C1", "LC1", {"axial": -100.0, "major_flex": -20.0})
+    with pytest.raises(ValueError):
+        next(read_force_csv(str(path)))
+
+
+def test_envelope_forces_grouped_and_ungrouped(tmp_path):
+    path = tmp_path / "forces.ndjson.gz"
+    with gzip.open(path, "wt") as file:
+        for member, combination, station, axial, moment in ROWS:
+            file.write(json.dumps({"member": member, "combination": combination,
+                                   "station": station, "axial": axial,
+                                   "major_flex": moment}) + "\n")
+    grouped = envelope_forces(read_force_ndjson(str(path)), grouped=True)
+    assert next(grouped) == ("C1", ENVELOPES["C1"])
+    assert dict(grouped) == {"C2": ENVELOPES["C2"]}
+    assert dict(envelope_forces(read_force_ndjson(str(path)))) == ENVELOPES
+
+    records = [("C1", "LC1", {"axial": 1.0}), ("C2", "LC1", {"axial": 2.0}),
+               ("C1", "LC2", {"axial": 3.0})]
+    with pytest.raises(ValueError):
+        list(envelope_forces(records, grouped=True))
+    assert dict(envelope_forces(records))["C1"] == {"LC1": {"axial": 1.0}, "LC2": {"axial": 3.0}}
+
+
+class PyniteMember():
+    def __init__(self, axial, moment):
+        self.axial, self.moment = axial, moment
+    def max_axial(self, combo): return max(self.axial[combo])
+    def min_axial(self, combo): return min(self.axial[combo])
+    def max_moment(self, direction, combo): return max(self.moment[direction][combo])
+    def min_moment(self, direction, combo): return min(self.moment[direction][combo])
+
+
+class PyniteModel():
+    load_combos = {"LC1": None, "LC2": None}
+    members = {"C1": PyniteMember({"LC1": [-100, -110, -90], "LC2": [30, 40]},
+                                  {"Mz": {"LC1": [-20, 45, -60], "LC2": [5, 8]}})}
+
+
+def test_pynite_forces():
+    assert dict(envelope_forces(pynite_forces(PyniteModel()))) == {"C1": ENVELOPES["C1"]}
+
+
+def test_design_from_records_matches_direct_design():
+    members = {label: SteelMember(label, "W14X90", ASTM_A992_GR_50, 144) for label in ENVELOPES}
+    records = ((member, combination, {"axial": axial, "major_flex": moment})
+               for member, combination, _, axial, moment in ROWS)
+    results = list(design_from_records(records, members, grouped=True, workers=0))
+    assert [result.member.label for result in results] == ["C1", "C2"]
+    for result in results:
+        expected = SteelMember("X", "W14X90", ASTM_A992_GR_50, 144,
+                               force_actions=ENVELOPES[result.member.label])
+        expected.design_member()
+        assert result.results == expected.results
+    with pytest.raises(ValueError):
+        list(design_from_records([("C3", "LC1", {"axial": 1.0})], members, workers=0))
@@ -0,0 +1,84 @@
+import json
+import sys
+import types
+import pytest
+from pysteelmanual import SteelMember
+from pysteelmanual.cache import CAPACITY_CACHE
+from pysteelmanual import instrumentation
+from pysteelmanual.instrumentation import Instrumentation
+from pysteelmanual.materials import ASTM_A36, ASTM_A992_GR_50
+from pysteelmanual.sections import RoundBar
+from pysteelmanual.shapetable import AISCShape
+from pysteelmanual.steelcodes.aisc_360_22 import compression
+
+
+def test_instrumentation_records_calls_and_restores_functions():
+    original = compression.calc_elastic_buckling_stress
+    original_getattr = AISCShape.__dict__["__getattr__"]
+    CAPACITY_CACHE.clear()
+    with Instrumentation() as session:
+        assert compression.calc_elastic_buckling_stress is not original
+        for _ in range(3):
+            member = SteelMember("C1", "W14X90", ASTM_A992_GR_50, 240,
+                                 force_actions={"LC1": {"axial": 500, "major_flex": 2000}})
+            member.design_member()
+    assert compression.calc_elastic_buckling_stress is original
+    assert AISCShape.__dict__["__getattr__"] is original_getattr
+
+    results = session.to_dict()
+    assert results["members"]["SteelMember.design_member"]["calls"] == 3
+    assert results["limit_states"]["compression"]["calls"] == 3
+    # Capacities are computed once, then served from the cache
+    assert results["equations"]["calc_w_shape_compressive_capacity"]["calls"] == 1
+    assert results["caches"]["capacity"] == {"hits": 4, "misses": 2, "hit_rate": 4/6}
+    assert results["lookups"]["get_shape"]["calls"] == 3
+    stats = results["members"]["SteelMember.design_member"]
+    assert stats["p50"] <= stats["p99"] <= stats["max"] <= stats["total"]
+    assert json.loads(session.to_json()) == results
+
+
+def test_instrumentation_separates_report_path():
+    with Instrumentation() as session:
+        compression.calc_round_bar_compressive_capacity(RoundBar(2), ASTM_A36, 48, 48, 1, 1,
+                                                        report=False)
+        compression.calc_round_bar_compressive_capacity(RoundBar(2), ASTM_A36, 48, 48, 1, 1)
+    equations = session.to_dict()["equations"]
+    assert equations["calc_round_bar_compressive_capacity"]["calls"] == 1
+    assert equations["calc_round_bar_compressive_capacity [report]"]["calls"] == 1
+    assert equations["calc_slenderness_ratio [report]"]["calls"] == 2
+
+
+def test_instrumentation_single_session():
+    with Instrumentation():
+        with pytest.raises(RuntimeError):
+            Instrumentation().start()
+    # Nothing is recorded once the session has stopped
+    session = Instrumentation()
+    compression.calc_elastic_buckling_stress(100, 29000, report=False)
+    assert session.to_dict() == {"caches": {}}
+
+
+def test_instrumentation_patches_imported_names(monkeypatch):
+    # Equivalent to "from ...compression import calc_elastic_buckling_stress"
+    module = types.ModuleType("imports_buckling")
+    module.buckling = compression.calc_elastic_buckling_stress
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    with Instrumentation() as session:
+        module.buckling(100, 29000, report=False)
+    assert module.buckling is compression.calc_elastic_buckling_stress
+    stats = session.to_dict()["equations"]["calc_elastic_buckling_stress"]
+    assert stats["calls"] == 1
+
+
+def test_instrumentation_bounds_latency_sample(monkeypatch):
+    monkeypatch.setattr(instrumentation, "RESERVOIR_SIZE", 10)
+    session = Instrumentation()
+    for elapsed in range(1, 101):
+        session.record("equations", "f", float(elapsed))
+    assert len(session.latencies["equations"]["f"].sample) == 10
+    stats = session.to_dict()["equations"]["f"]
+    assert stats["calls"] == 100
+    assert stats["total"] == 5050
+    assert stats["mean"] == 50.5
+    assert stats["max"] == 100
+    assert 1 <= stats["p50"] <= stats["p99"] <= 100
@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+from pysteelmanual.conversions import convert_material, unit_value
+from pysteelmanual.manualtables import (ColumnCurve, get_column_curve,
+                                        calc_axial_strength_table, save_axial_strength_table)
+from pysteelmanual.materials import ASTM_A992_GR_50
+from pysteelmanual.shapetable import get_shape
+from pysteelmanual.steelcodes.aisc_360_22 import compression
+from pysteelmanual.units import MM_KN
+
+
+@pytest.mark.parametrize("yield_stress", [36, 50, 65, 70])
+def test_column_curve_within_tolerance(yield_stress):
+    curve = ColumnCurve(yield_stress, 29000)
+    assert curve.max_error <= 1e-6
+    slenderness = np.random.default_rng(360).uniform(0, 200, 200_000)
+    exact = curve.exact(slenderness)
+    assert np.max(np.abs(curve(slenderness) - exact)/exact) <= 1e-6
+
+
+def test_column_curve_matches_scalar_equations():
+    curve = get_column_curve(50, 29000)
+    for slenderness in [0.0, 25.0, 80.0, curve.transition, 113.5, 150.0, 200.0]:
+        if slenderness:
+            Fe = compression.calc_elastic_buckling_stress(slenderness, 29000, report=False)
+            Fn = compression.calc_nominal_flexural_buckling_stress(Fe, 50, report=False)
+        else:
+            Fn = 50.0
+        assert curve(slenderness) == pytest.approx(Fn, rel=1e-6)
+        assert curve(np.array([slenderness]))[0] == curve(slenderness)
+
+
+def test_column_curve_exact_outside_table():
+    curve = get_column_curve(50, 29000)
+    slenderness = np.array([-5.0, 250.0, np.nan, 120.0])
+    stress = curve(slenderness)
+    assert stress[1] == curve.exact(250.0)
+    assert np.isnan(stress[2])
+    assert curve(250.0) == curve.exact(250.0)
+
+
+def test_column_curve_available_stress():
+    # AISC Manual Table 4-14, Fy = 50 ksi, Lc/r = 100
+    curve = get_column_curve(50, 29000)
+    assert curve.available_stress(100, "lrfd") == pytest.approx(21.7, abs=0.05)
+    assert curve.available_stress(100, "asd") == pytest.approx(14.4, abs=0.05)
+    with pytest.raises(ValueError):
+        curve.available_stress(100, "lsd")
+
+
+def test_axial_strength_table():
+    table = calc_axial_strength_table()
+    row = list(table["shapes"]).index("W14X90")
+    assert table["lrfd"].shape == table["asd"].shape == (len(table["shapes"]), 41)
+    # AISC Manual Table 4-1a, W14X90
+    assert table["lrfd"][row, 0] == pytest.approx(1190, abs=3)
+    assert table["asd"][row, 0] == pytest.approx(793, abs=1)
+    assert table["lrfd"][row, 20] == pytest.approx(876, abs=1)
+    assert table["lrfd"][row, 40] == pytest.approx(356, abs=1)
+    for length in (10, 25):
+        expected = compression.calc_w_shape_compressive_capacity(
+            get_shape("W14X90"), ASTM_A992_GR_50, 12*length, 12*length,
+            design_method="asd", report=False)
+        assert table["asd"][row, length] == pytest.approx(expected, rel=1e-14)
+
+
+def test_axial_strength_table_in_converted_units():
+    table = calc_axial_strength_table(lengths=[0, 10, 20])
+    metric = calc_axial_strength_table(material=convert_material(ASTM_A992_GR_50, MM_KN),
+                                       lengths=[0, 3.048, 6.096], units=MM_KN,
+                                       length_unit="m")
+    assert (metric["length_unit"], metric["force_unit"]) == ("m", "kN")
+    kips_per_kN = unit_value("kN")/unit_value("kip")
+    assert np.allclose(metric["lrfd"]*kips_per_kN, table["lrfd"], rtol=1e-6)
+    with pytest.raises(ValueError):
+        calc_axial_strength_table(units=MM_KN)
+
+
+def test_save_axial_strength_table(tmp_path):
+    table = calc_axial_strength_table(lengths=[0, 10, 20])
+    save_axial_strength_table(table, str(tmp_path/"table.csv"))
+    lines = (tmp_path/"table.csv").read_text().splitlines()
+    assert lines[0] == "shape,design_method,0,10,20"
+    assert len(lines) == 1 + 2*len(table["shapes"])
+    save_axial_strength_table(table, str(tmp_path/"table.npy"))
+    assert np.array_equal(np.load(tmp_path/"table.npy"), np.stack([table["lrfd"], table["asd"]]))
+    save_axial_strength_table(table, str(tmp_path/"table.npz"))
+    assert np.array_equal(np.load(tmp_path/"table.npz")["asd"], table["asd"])
+    assert np.load(tmp_path/"table.npz")["length_unit"] == "ft"
+    with pytest.raises(ValueError):
+        save_axial_strength_table(table, str(tmp_path/"table.xlsx"))
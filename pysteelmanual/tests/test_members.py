@@ -0,0 +1,60 @@
+from math import isclose
+import pytest
+from pysteelmanual import SteelMember
+from pysteelmanual.sections import RoundBar, RectBar
+from pysteelmanual.materials import ASTM_A36, ASTM_A992_GR_50
+from pysteelmanual.shapetable import get_shape
+from pysteelmanual.steelcodes.aisc_360_22 import members
+
+force_actions = {"LC1": {"axial": 300, "major_flex": -1500},
+                 "LC2": {"axial": -50, "major_flex": 2500}}
+
+
+def test_calc_demand():
+    assert members.calc_demand("compression", force_actions) == (300, "LC1")
+    assert members.calc_demand("major_flex", force_actions) == (2500, "LC2")
+    # Tension is not a compression demand
+    assert members.calc_demand("compression", {"LC1": {"axial": -50}}) == (0.0, "LC1")
+
+
+def test_required_limit_states():
+    assert members.required_limit_states(force_actions) == ["compression", "major_flex"]
+    assert members.required_limit_states({"LC1": {"major_flex": 10}}) == ["major_flex"]
+    assert members.required_limit_states({}) == []
+
+
+def test_design_limit_states_w_shape():
+    results = members.design_limit_states(get_shape("W14X90"), ASTM_A992_GR_50, 240,
+                                          {"major_flex": {"Lb": 120}}, force_actions)
+    # Manual Table 4-1a: phi*Pn = 876 kips at Lc = 20 ft
+    assert isclose(results["compression"]["capacity"], 876.7, abs_tol=0.05)
+    # Manual Table 3-2: phi*Mpx = 574 kip-ft (noncompact flange, Lb < Lp)
+    assert isclose(results["major_flex"]["capacity"]/12, 573.6, abs_tol=0.05)
+    for result in results.values():
+        assert result["ratio"] == result["demand"]/result["capacity"]
+    assert results["major_flex"]["combination"] == "LC2"
+
+
+def test_design_limit_states_design_methods():
+    shape = get_shape("W14X90")
+    lrfd = members.design_limit_states(shape, ASTM_A992_GR_50, 240, {}, force_actions, "lrfd")
+    asd = members.design_limit_states(shape, ASTM_A992_GR_50, 240, {}, force_actions, "asd")
+    assert isclose(asd["compression"]["capacity"]*1.67, lrfd["compression"]["capacity"]/0.9)
+    assert isclose(asd["major_flex"]["capacity"]*1.67, lrfd["major_flex"]["capacity"]/0.9)
+
+
+def test_design_limit_states_dispatch():
+    results = members.design_limit_states(RoundBar(2.0), ASTM_A36, 60, {},
+                                          {"LC1": {"axial": 30, "major_flex": 20}})
+    assert list(results) == ["compression", "major_flex"]
+    with pytest.raises(NotImplementedError):
+        members.design_limit_states(RectBar(1.0, 2.0), ASTM_A36, 60, {}, {"LC1": {"axial": 30}})
+
+
+def test_steelmember_design_member():
+    member = SteelMember("B1", "W14X90", ASTM_A992_GR_50, 240,
+                         force_actions=force_actions,
+                         design_props={"major_flex": {"Lb": 120}})
+    member.design_member()
+    assert member.results == members.design_limit_states(
+        member.section, ASTM_A992_GR_50, 240, {"major_flex": {"Lb": 120}}, force_actions)
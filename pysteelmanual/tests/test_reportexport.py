@@ -0,0 +1,67 @@
+import os
+from pysteelmanual import SteelMember
+from pysteelmanual.materials import ASTM_A992_GR_50
+from pysteelmanual.reportexport import export_reports, report_filename
+from pysteelmanual.reports import CalcRecord
+
+
+def make_members():
+    members = [SteelMember(label, "W12X26", ASTM_A992_GR_50, 120 + 12*i,
+                           force_actions={"LC1": {"axial": 50 + 10*i, "major_flex": 300}})
+               for i, label in enumerate(["C1", "C2", "c1", "B/3", "index"])]
+    for member in members:
+        member.design_member()
+    members.append(SteelMember("Undesigned", "W12X26", ASTM_A992_GR_50, 120))
+    return members
+
+
+def read_folder(folder):
+    return {name: open(os.path.join(folder, name), encoding="utf-8").read()
+            for name in sorted(os.listdir(folder))}
+
+
+def test_report_filename():
+    used = set()
+    assert [report_filename(label, used) for label in ["C1", "c1", "C1", "B/3", "../"]] == \
+        ["C1", "c1_2", "C1_3", "B_3", "report"]
+
+
+def test_export_reports_is_deterministic(tmp_path):
+    calls = []
+    serial = export_reports(make_members(), str(tmp_path / "serial"), workers=0, chunksize=2,
+                            progress=lambda done, total: calls.append((done, total)))
+    parallel = export_reports(iter(make_members()), str(tmp_path / "parallel"), workers=2,
+                              chunksize=1)
+    assert serial["written"] == parallel["written"] == 5
+    assert list(serial["errors"]) == ["Undesigned"]
+    assert calls == [(2, 6), (4, 6), (6, 6)]
+    files = read_folder(tmp_path / "serial")
+    assert files == read_folder(tmp_path / "parallel")
+    assert sorted(files) == ["B_3.html", "C1.html", "C2.html", "c1_2.html",
+                             "index.html", "index_2.html"]
+    assert files["C1.html"] == make_members()[0].calc_report()
+    index = files["index.html"]
+    assert index.index("C1.html") < index.index("C2.html") < index.index("c1_2.html")
+    assert "Failed: ValueError" in index
+
+
+def test_export_reports_records_chunk_failures(tmp_path):
+    items = [(member.label, member.report_record) for member in make_members()[:4]]
+    # A lambda cannot be pickled, so this chunk never reaches a worker
+    items[1] = ("Lambda", CalcRecord(lambda: None))
+    summary = export_reports(items, str(tmp_path), workers=2, chunksize=2)
+    assert summary["written"] == 2
+    assert list(summary["errors"]) == ["C1", "Lambda"]
+    assert isinstance(summary["errors"]["Lambda"], Exception)
+    assert sorted(os.listdir(tmp_path)) == ["B_3.html", "c1_2.html", "index.html"]
+    assert open(tmp_path / "index.html", encoding="utf-8").read().count("Failed: ") == 2
+
+
+def test_export_reports_counts_duplicate_label_errors(tmp_path):
+    calls = []
+    summary = export_reports([("C1", None), ("C1", None), ("c1", None)], str(tmp_path),
+                             workers=0, progress=lambda done, total: calls.append(done))
+    assert list(summary["errors"]) == ["C1", "C1_2", "c1_3"]
+    assert calls == [3]
+    assert "0 reports written, 3 failed" in open(tmp_path / "index.html",
+                                                  encoding="utf-8").read()
@@ -0,0 +1,75 @@
+import pickle
+import efficalc as ef
+from efficalc.report_builder import ReportBuilder
+from pysteelmanual import SteelMember
+from pysteelmanual.batch import design_members
+from pysteelmanual.materials import ASTM_A36, ASTM_A992_GR_50
+from pysteelmanual.sections import RoundBar
+from pysteelmanual.shapetable import get_shape
+from pysteelmanual.steelcodes.aisc_360_22 import compression, flexure
+
+
+def make_member():
+    return SteelMember("C1", "W14X90", ASTM_A992_GR_50, 240,
+                       force_actions={"LC1": {"axial": 500, "major_flex": 2000},
+                                      "LC2": {"axial": 650}},
+                       design_props={"compression": {"Ly": 120}, "major_flex": {"Lb": 120}})
+
+
+def report_body(calculation):
+    """Build an Efficalc report and return the HTML of its calculation items"""
+    html = ReportBuilder(calculation).get_html_as_str()
+    body = html[html.index("<body"):html.rindex("</body>")]
+    return body[body.index(">")+1:].strip()
+
+
+def test_deferred_report_matches_direct_calculation():
+    member = make_member()
+    member.design_member()
+    assert member.report_html is None
+    html = member.calc_report()
+    assert "Member C1" in html and "LC2" in html
+
+    # The same checks built directly from the capacity functions, with the
+    # limit state headings numbered as in the member report
+    shape = get_shape("W14X90")
+    def compression_only():
+        ef.Heading("Compression", 1)
+        compression.calc_w_shape_compressive_capacity(shape, ASTM_A992_GR_50, 240, 120,
+                                                      design_method="lrfd", header_level=2)
+    def flexure_only():
+        ef.Heading("Compression", 1)
+        ef.Heading("Major-Axis Flexure", 1)
+        flexure.calc_w_shape_flexural_capacity(shape, ASTM_A992_GR_50, 120,
+                                               design_method="lrfd", header_level=2)
+    assert report_body(compression_only) in html
+    flexure_body = report_body(flexure_only)
+    assert flexure_body[flexure_body.index("Major-Axis Flexure"):] in html
+
+    eager = make_member()
+    eager.design_member(report=True)
+    assert eager.report_html == html
+
+
+def test_report_record_is_a_snapshot():
+    member = make_member()
+    member.design_member()
+    expected = member.calc_report()
+    member.design_props["major_flex"]["Lb"] = 240
+    member.force_actions["LC1"]["major_flex"] = 9000
+    assert member.calc_report() == expected
+
+
+def test_report_record_pickles():
+    member = SteelMember("B1", RoundBar(2), ASTM_A36, 48,
+                         force_actions={"LC1": {"axial": 5, "major_flex": 3}})
+    member.design_member()
+    record = pickle.loads(pickle.dumps(member.report_record))
+    assert record.html() == member.calc_report()
+
+
+def test_batch_sets_report_record():
+    members = [make_member() for _ in range(3)]
+    results = list(design_members(members, workers=2, chunksize=1))
+    assert all(result.ok for result in results)
+    assert members[1].calc_report() == members[0].calc_report()
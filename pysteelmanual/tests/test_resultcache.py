@@ -0,0 +1,91 @@
+from pysteelmanual import SteelMember
+from pysteelmanual.batch import design_members
+from pysteelmanual.materials import ASTM_A36, ASTM_A992_GR_50
+from pysteelmanual.resultcache import ResultCache, member_key, library_version
+from pysteelmanual.steelcodes.aisc_360_22 import members as aisc_members
+from pysteelmanual.sections import RoundBar
+
+
+def make_members(count, axial=100):
+    return [SteelMember(f"M{i}", "W12X26", ASTM_A992_GR_50, 120 + i,
+                        force_actions={"LC1": {"axial": axial + i, "major_flex": 500}})
+            for i in range(count)]
+
+
+def test_member_key_depends_on_content_only():
+    first, second = make_members(2)
+    copy = SteelMember("Other", "W12X26", ASTM_A992_GR_50, 120,
+                       force_actions={"LC1": {"major_flex": 500, "axial": 100}})
+    assert member_key(first) == member_key(copy)
+    assert member_key(first) != member_key(second)
+    bar = SteelMember("B", RoundBar(2), ASTM_A36, 48, force_actions={"LC1": {"axial": 5}})
+    assert member_key(bar) != member_key(SteelMember("B", RoundBar(2.5), ASTM_A36, 48,
+                                                     force_actions={"LC1": {"axial": 5}}))
+
+
+def test_result_cache_reuses_unchanged_members(tmp_path):
+    path = str(tmp_path/"results.sqlite")
+    with ResultCache(path) as cache:
+        for member in make_members(5):
+            member.design_member(result_cache=cache)
+        assert cache.stats()["misses"] == 5
+
+    members = make_members(5)
+    members[2].force_actions["LC1"]["axial"] = 300
+    with ResultCache(path) as cache:
+        for member in members:
+            member.design_member(result_cache=cache)
+        assert cache.stats()["hits"] == 4
+        assert cache.stats()["misses"] == 1
+        assert len(cache) == 6
+    expected = make_members(5)
+    expected[0].design_member()
+    assert members[0].results == expected[0].results
+    assert members[0].calc_report() == expected[0].calc_report()
+
+
+def test_result_cache_invalidated_on_version_change(tmp_path):
+    path = str(tmp_path/"results.sqlite")
+    with ResultCache(path, library="1.0") as cache:
+        make_members(1)[0].design_member(result_cache=cache)
+    with ResultCache(path, library="1.0") as cache:
+        assert len(cache) == 1
+    with ResultCache(path, library="1.1") as cache:
+        assert len(cache) == 0
+
+
+def test_result_cache_invalidated_on_code_version_change(tmp_path, monkeypatch):
+    path = str(tmp_path/"results.sqlite")
+    with ResultCache(path) as cache:
+        make_members(1)[0].design_member(result_cache=cache)
+    version = library_version()
+    monkeypatch.setattr(aisc_members, "CODE_VERSION", aisc_members.CODE_VERSION + 1)
+    assert library_version() != version
+    with ResultCache(path) as cache:
+        assert len(cache) == 0
+
+
+def test_result_cache_evicts_least_recently_used(tmp_path):
+    with ResultCache(str(tmp_path/"results.sqlite"), max_entries=3) as cache:
+        members = make_members(4)
+        for member in members[:3]:
+            member.design_member(result_cache=cache)
+        cache.get(cache.key(members[0]))
+        members[3].design_member(result_cache=cache)
+        assert len(cache) == 3
+        assert cache.stats()["evictions"] == 1
+        assert cache.get(cache.key(members[1])) is None
+        assert cache.get(cache.key(members[0])) is not None
+
+
+def test_design_members_with_result_cache(tmp_path):
+    path = str(tmp_path/"results.sqlite")
+    expected = [result.results for result in design_members(make_members(10), workers=0)]
+    with ResultCache(path) as cache:
+        list(design_members(make_members(6), workers=0, result_cache=cache))
+    with ResultCache(path) as cache:
+        results = list(design_members(make_members(10), workers=2, chunksize=3,
+                                      result_cache=cache))
+        assert cache.stats()["hits"] == 6
+        assert cache.stats()["misses"] == 4
+    assert [result.results for result in results] == expected
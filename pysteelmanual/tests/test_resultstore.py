@@ -0,0 +1,79 @@
+import csv
+import numpy as np
+import pytest
+from pysteelmanual import SteelMember
+from pysteelmanual.batch import design_members
+from pysteelmanual.materials import ASTM_A36, ASTM_A992_GR_50
+from pysteelmanual.resultstore import ResultStore
+from pysteelmanual.sections import RectBar
+
+
+def make_members(count):
+    members = [SteelMember(f"M{i}", "W12X26", ASTM_A992_GR_50, 120 + 6*i,
+                           force_actions={"LC1": {"axial": 20*i},
+                                          "LC2": {"axial": 10*i, "major_flex": 100*i}})
+               for i in range(count)]
+    members.append(SteelMember("T1", "W12X26", ASTM_A992_GR_50, 120,
+                               force_actions={"LC3": {"major_flex": 900}}))
+    members.append(SteelMember("Bad", RectBar(2, 4), ASTM_A36, 120,
+                               force_actions={"LC1": {"axial": 10}}))
+    return members
+
+
+def test_store_matches_member_results():
+    store = ResultStore(capacity=4)
+    results = list(design_members(make_members(20), workers=0, store=store))
+    assert len(store) == 22
+    for result in results:
+        if result.ok:
+            assert store[result.member.label] == result.member.results
+    assert isinstance(store.errors["Bad"], NotImplementedError)
+    assert store["Bad"] == {}
+    assert "compression" not in store["T1"]
+    assert store.governing_combination("M5", "compression") == "LC1"
+    assert store.governing_combination("T1", "compression") is None
+
+
+def test_filter_sort_aggregate():
+    store = ResultStore().add_batch(design_members(make_members(20), workers=0))
+    ratios = np.array([store[f"M{i}"]["compression"]["ratio"] for i in range(20)])
+    rows = store.filter("compression", above=0.5)
+    assert store.select(rows) == [f"M{i}" for i in range(20) if ratios[i] > 0.5]
+    assert store.select(store.sort("compression")[:3]) == ["M19", "M18", "M17"]
+    # Members without the limit state sort last
+    assert store.select(store.sort("compression", descending=False)[-2:]) == ["T1", "Bad"]
+    summary = store.aggregate("compression")
+    assert summary["count"] == 20
+    assert summary["max"] == pytest.approx(ratios.max())
+    assert store.select(store.filter("major_flex", combination="LC3")) == ["T1"]
+    ratio, index = store.governing()
+    assert store.limit_states[index[store.row("T1")]] == "major_flex"
+    assert index[store.row("Bad")] == -1
+
+    store.add("M19", {})
+    assert "M19" not in store.select(store.filter("compression", above=0.0))
+
+
+def test_export(tmp_path):
+    store = ResultStore().add_batch(design_members(make_members(5), workers=0))
+    store.to_npz(str(tmp_path / "results.npz"))
+    loaded = ResultStore.from_npz(str(tmp_path / "results.npz"))
+    assert loaded.labels == store.labels
+    assert all(loaded[label] == store[label] for label in store.labels)
+
+    store.to_csv(str(tmp_path / "results.csv"))
+    with open(tmp_path / "results.csv") as file:
+        rows = list(csv.DictReader(file))
+    assert rows[1]["label"] == "M1"
+    assert float(rows[1]["compression_ratio"]) == store["M1"]["compression"]["ratio"]
+    assert rows[-2]["compression_ratio"] == ""
+    assert "NotImplementedError" in rows[-1]["error"]
+
+
+def test_governing_without_limit_states():
+    store = ResultStore(limit_states=())
+    store.add("E1", None, ValueError("not designed"))
+    ratio, index = store.governing()
+    assert np.isnan(ratio).all() and len(ratio) == 1
+    assert index.tolist() == [-1]
+    assert len(ResultStore(limit_states=()).governing()[0]) == 0
@@ -0,0 +1,47 @@
+import copy
+import pickle
+import subprocess
+import sys
+import pytest
+from pysteelmanual import sections
+from pysteelmanual.materials import SteelMaterial, ASTM_A992_GR_50
+from pysteelmanual.units import UnitSystem, IN_KIP, MM_KN
+
+
+def test_import_does_not_load_shape_database():
+    code = "import sys, pysteelmanual; print('steelpy' in sys.modules)"
+    completed = subprocess.run([sys.executable, "-c", code],
+                               capture_output=True, text=True, check=True)
+    assert completed.stdout.strip() == "False"
+
+
+def test_get_aisc_profiles_is_cached():
+    assert sections.get_aisc_profiles() is sections.get_aisc_profiles()
+    assert sections.AISC_W_SECTIONS is sections.get_aisc_profiles()["W_shapes"]
+
+
+def test_sections_are_immutable_values():
+    bar = sections.RoundBar(1.0)
+    assert bar == sections.RoundBar(1.0)
+    assert hash(bar) == hash(sections.RoundBar(1.0))
+    assert bar != sections.RoundBar(1.0, units=MM_KN)
+    assert sections.RectBar(2, 4) == sections.RectBar(2, 4)
+    assert not hasattr(bar, "__dict__")
+    with pytest.raises(AttributeError):
+        bar.D = 2.0
+    assert pickle.loads(pickle.dumps(bar)) == bar
+    assert copy.copy(bar) == bar
+    assert {bar: "cached"}[sections.RoundBar(1.0)] == "cached"
+
+
+def test_materials_and_units_are_immutable_values():
+    assert SteelMaterial(50, 65) == ASTM_A992_GR_50
+    assert hash(SteelMaterial(50, 65)) == hash(ASTM_A992_GR_50)
+    assert SteelMaterial(50, 65, units=MM_KN).E == 200000
+    assert SteelMaterial(50, 65, units=MM_KN) != ASTM_A992_GR_50
+    assert UnitSystem(*(getattr(IN_KIP, name) for name in UnitSystem._fields())) == IN_KIP
+    with pytest.raises(AttributeError):
+        ASTM_A992_GR_50.Fy = 65
+    with pytest.raises(AttributeError):
+        IN_KIP.length = "ft"
+    assert pickle.loads(pickle.dumps(ASTM_A992_GR_50)) == ASTM_A992_GR_50
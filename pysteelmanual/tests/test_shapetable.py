@@ -0,0 +1,53 @@
+import pickle
+import numpy as np
+import pytest
+from pysteelmanual import SteelMember
+from pysteelmanual.materials import ASTM_A992_GR_50
+from pysteelmanual.sections import SteelSection
+from pysteelmanual.shapetable import get_shape, get_shape_table, list_shape_families
+
+
+def test_get_shape():
+    shape = get_shape("W8X10")
+    assert isinstance(shape, SteelSection)
+    assert shape.label == "W8X10"
+    assert shape.family == "W_shapes"
+    assert shape.area == 2.96
+    assert shape.ry == 0.841
+    assert get_shape("w8x10") == shape
+    assert get_shape("HSS6X6X1_2").family == "HSS_shapes"
+    with pytest.raises(KeyError):
+        get_shape("W8X11")
+    with pytest.raises(AttributeError):
+        shape.OD
+
+
+def test_select_matches_steelpy_filter():
+    criteria = {"ry": {"min": 2.0}, "weight": {"max": 50}}
+    table = get_shape_table("W_shapes")
+    rows = table.select(criteria)
+    assert list(table.names[rows]) == ["W8X31", "W8X35", "W8X40", "W10X45", "W8X48", "W10X49"]
+    assert np.all(np.diff(table.columns["weight"][rows]) >= 0)
+    assert list(table.filter(criteria)) == list(table.names[rows])
+
+
+def test_select_every_family_matches_scan():
+    criteria = {"area": {"min": 5.0, "max": 20.0}, "rx": {"min": 1.5}}
+    for family in list_shape_families():
+        table = get_shape_table(family)
+        area = table.columns["area"]
+        rx = table.columns["rx"]
+        expected = np.flatnonzero((area >= 5.0) & (area <= 20.0) & (rx >= 1.5))
+        assert sorted(table.select(criteria, sort_by=None)) == list(expected)
+
+
+def test_shape_pickles_by_designation():
+    shape = get_shape("W14X90")
+    data = pickle.dumps(shape)
+    assert len(data) < 200
+    assert pickle.loads(data) == shape
+
+
+def test_steelmember_resolves_designation():
+    member = SteelMember("Column", "W8X10", ASTM_A992_GR_50, 120)
+    assert member.section == get_shape("W8X10")
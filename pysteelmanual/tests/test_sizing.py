@@ -0,0 +1,80 @@
+import pytest
+from pysteelmanual import SteelMember
+from pysteelmanual.conversions import convert_material, convert_force_actions
+from pysteelmanual.materials import ASTM_A992_GR_50, SteelMaterial
+from pysteelmanual.shapetable import get_shape_table
+from pysteelmanual.sizing import select_lightest_section
+from pysteelmanual.steelcodes.aisc_360_22 import members
+from pysteelmanual.units import IN_KIP, MM_KN
+
+
+def brute_force_lightest(length, design_props, force_actions):
+    table = get_shape_table("W_shapes")
+    adequate = []
+    for shape in table:
+        results = members.design_limit_states(shape, ASTM_A992_GR_50, length,
+                                              design_props, force_actions)
+        if all(result["ratio"] <= 1.0 for result in results.values()):
+            adequate.append(shape)
+    return min(adequate, key=lambda shape: shape.weight).weight
+
+
+def test_select_lightest_section_matches_brute_force():
+    cases = [(240, {}, {"LC1": {"axial": 500}}),
+             (144, {"major_flex": {"Lb": 48}}, {"LC1": {"major_flex": 2400}}),
+             (180, {"compression": {"Ly": 90}, "major_flex": {"Lb": 90}},
+              {"LC1": {"axial": 150, "major_flex": 900},
+               "LC2": {"axial": 300, "major_flex": -300}})]
+    for length, design_props, force_actions in cases:
+        selection = select_lightest_section(length, design_props, force_actions)
+        assert selection["section"].weight == brute_force_lightest(length, design_props,
+                                                                   force_actions)
+        assert all(result["ratio"] <= 1.0 for result in selection["results"].values())
+        assert selection["evaluated"] <= selection["screened"] <= selection["candidates"]
+        assert selection["evaluated"] < selection["candidates"]
+
+
+def test_select_lightest_section_with_criteria():
+    selection = select_lightest_section(240, {}, {"LC1": {"axial": 500}},
+                                        criteria={"d": {"max": 14.5}})
+    assert selection["section"].d <= 14.5
+    assert select_lightest_section(240, {}, {"LC1": {"axial": 1e6}})["section"] is None
+
+
+def test_select_lightest_section_reports_unsupported_shapes():
+    # M10X7.5 has a noncompact web for Fy = 100 ksi (Section F4 is not implemented)
+    selection = select_lightest_section(60, {}, {"LC1": {"major_flex": 200}},
+                                        material=SteelMaterial(100, 110), family="M_shapes")
+    assert selection["not_implemented"] == ["M10X7_5"]
+    assert selection["section"].label == "M10X8"
+    default = select_lightest_section(240, {}, {"LC1": {"axial": 500}})
+    assert default["not_implemented"] == []
+
+
+def test_steelmember_select_section():
+    member = SteelMember("C1", None, ASTM_A992_GR_50, 240,
+                         force_actions={"LC1": {"axial": 500}})
+    selection = member.select_section()
+    assert member.section == selection["section"]
+    member.design_member()
+    assert member.results["compression"]["ratio"] <= 1.0
+    assert member.results["compression"]["combination"] == "LC1"
+
+
+def test_select_section_in_converted_units():
+    force_actions = {"LC1": {"axial": 150, "major_flex": 900},
+                     "LC2": {"axial": 300, "major_flex": -300}}
+    design_props = {"compression": {"Ly": 90}, "major_flex": {"Lb": 90}}
+    member = SteelMember("C1", None, ASTM_A992_GR_50, 180, force_actions=force_actions,
+                         design_props=design_props)
+    member.select_section()
+    metric_props = {name: {key: value*25.4 for key, value in props.items()}
+                    for name, props in design_props.items()}
+    metric = SteelMember("C1", None, convert_material(ASTM_A992_GR_50, MM_KN), 180*25.4,
+                         units=MM_KN, design_props=metric_props,
+                         force_actions=convert_force_actions(force_actions, IN_KIP, MM_KN))
+    selection = metric.select_section()
+    assert selection["section"].label == member.section.label
+    assert selection["section"].units == MM_KN
+    for limit_state, result in member.results.items():
+        assert metric.results[limit_state]["ratio"] == pytest.approx(result["ratio"], rel=1e-6)
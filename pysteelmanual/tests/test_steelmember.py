@@ -1,4 +1,9 @@
+import math
+import subprocess
+import sys
+import pytest
 from pysteelmanual import SteelMember
+from pysteelmanual.materials import ASTM_A992_GR_50
 from pysteelmanual.units import unit_systems
 
 
@@ -18,4 +23,133 @@ def test_steelmember_methods():
     assert member.section == "W8X10"
     assert member.length == 1200
     assert member.force_actions["LC1"]["axial"] == 10.5
-    assert member.design_props["major_flex"] == {"Lb":300}
\ No newline at end of file
+    assert member.design_props["major_flex"] == {"Lb":300}
+
+def test_design_combinations_streams_generator():
+    def combinations(count):
+        for i in range(count):
+            yield f"LC{i}", {"axial": 400 * math.sin(i), "major_flex": 30 * i % 2000}
+
+    member = SteelMember("C1", "W14X90", ASTM_A992_GR_50, 240)
+    results = member.design_combinations(combinations(1000), chunk_size=64,
+                                         return_ratios=True)
+    member.update_member(force_actions=dict(combinations(1000)))
+    member.design_member()
+    for limit_state, result in results.items():
+        expected = member.results[limit_state]
+        assert result["ratio"] == expected["ratio"]
+        assert result["combination"] == expected["combination"]
+        assert result["capacity"] == expected["capacity"]
+        assert len(result["ratios"]) == 1000
+        assert result["ratios"].max() == result["ratio"]
+    assert results["compression"]["combination"] == "LC699"  # largest sin(i) for i < 1000
+
+
+def test_design_member_requires_length():
+    member = SteelMember("C1", "W14X90", ASTM_A992_GR_50,
+                         force_actions={"LC1": {"axial": 100.0}})
+    with pytest.raises(ValueError, match="must be positive"):
+        member.design_member()
+    with pytest.raises(ValueError, match="must be positive"):
+        member.select_section()
+    # Explicit unbraced lengths do not need the member length
+    member.update_member(design_props={"compression": {"Lx": 240, "Ly": 120}})
+    member.design_member()
+    assert member.results["compression"]["capacity"] > 0
+    beam = SteelMember("B1", "W14X90", ASTM_A992_GR_50,
+                       force_actions={"LC1": {"major_flex": 100.0}})
+    beam.design_member()
+    assert beam.results["major_flex"]["ratio"] > 0
+
+
+def test_design_combinations_late_limit_state():
+    combinations = [("LC1", {"axial": 100}), ("LC2", {"axial": 50}),
+                    ("LC3", {"axial": 10, "major_flex": 300})]
+    member = SteelMember("C1", "W12X26", ASTM_A992_GR_50, 144)
+    results = member.design_combinations(iter(combinations), chunk_size=2, return_ratios=True)
+    assert results["compression"]["combination"] == "LC1"
+    assert results["major_flex"]["combination"] == "LC3"
+    assert list(results["major_flex"]["ratios"][:2]) == [0.0, 0.0]
+
+
+def _count_capacities(monkeypatch):
+    from pysteelmanual.steelcodes.aisc_360_22 import members
+    calls = []
+    calc_capacity = members.calc_capacity
+    def counting(limit_state, *args, **kwargs):
+        calls.append(limit_state)
+        return calc_capacity(limit_state, *args, cache=None, **kwargs)
+    monkeypatch.setattr(members, "calc_capacity", counting)
+    return calls
+
+
+def test_update_member_force_actions_keeps_capacities(monkeypatch):
+    calls = _count_capacities(monkeypatch)
+    member = SteelMember("C1", "W14X90", ASTM_A992_GR_50, 240,
+                         force_actions={"LC1": {"axial": 300, "major_flex": 500}},
+                         design_props={"major_flex": {"Lb": 120}})
+    member.design_member()
+    capacities = {ls: result["capacity"] for ls, result in member.results.items()}
+    assert sorted(calls) == ["compression", "major_flex"]
+
+    member.update_member(force_actions={"LC2": {"axial": 600, "major_flex": 250}})
+    assert member.results == {}
+    assert member.report_record is None
+    member.design_member()
+    assert len(calls) == 2
+    assert member.results["compression"]["capacity"] == capacities["compression"]
+    assert member.results["compression"]["demand"] == 600
+    assert member.results["major_flex"]["combination"] == "LC2"
+
+
+def test_update_member_invalidates_dependent_limit_state(monkeypatch):
+    calls = _count_capacities(monkeypatch)
+    member = SteelMember("C1", "W14X90", ASTM_A992_GR_50, 240,
+                         force_actions={"LC1": {"axial": 300, "major_flex": 500}},
+                         design_props={"compression": {"Ly": 120}, "major_flex": {"Lb": 120}})
+    member.design_member()
+    compression = member.results["compression"]
+    flexure = member.results["major_flex"]["capacity"]
+
+    member.update_member(design_props={"compression": {"Ly": 120}, "major_flex": {"Lb": 240}})
+    assert member.results == {"compression": compression}
+    calls.clear()
+    member.design_member()
+    assert calls == ["major_flex"]
+    assert member.results["compression"]["capacity"] == compression["capacity"]
+    assert member.results["major_flex"]["capacity"] < flexure
+
+    # Lx defaults to the length, so only compression depends on it here
+    member.update_member(length=300)
+    assert list(member.results) == ["major_flex"]
+    calls.clear()
+    member.design_member()
+    assert calls == ["compression"]
+
+
+def test_design_member_detects_direct_changes(monkeypatch):
+    calls = _count_capacities(monkeypatch)
+    member = SteelMember("C1", "W14X90", ASTM_A992_GR_50, 240,
+                         force_actions={"LC1": {"axial": 300}})
+    member.design_member()
+    capacity = member.results["compression"]["capacity"]
+    member.design_member()
+    assert calls == ["compression"]
+    member.length = 480
+    member.design_member()
+    assert calls == ["compression", "compression"]
+    assert member.results["compression"]["capacity"] < capacity
+
+
+def test_shape_tables_load_only_for_aisc_designations():
+    code = ("import sys\n"
+            "from pysteelmanual import SteelMember\n"
+            "from pysteelmanual.materials import ASTM_A36\n"
+            "from pysteelmanual.sections import RoundBar\n"
+            "SteelMember('B1', RoundBar(2.0), ASTM_A36, 48)\n"
+            "print('numpy' in sys.modules, 'pysteelmanual.shapetable' in sys.modules)\n"
+            "SteelMember('B2', 'W8X10', ASTM_A36, 48)\n"
+            "print('numpy' in sys.modules, 'pysteelmanual.shapetable' in sys.modules)\n")
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                            check=True).stdout
+    assert output.split() == ["False", "False", "True", "True"]
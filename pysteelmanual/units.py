@@ -1,25 +1,26 @@
+from pysteelmanual.immutable import Immutable
+
 unit_systems = {"in-kip": {"length":"in", "area":"in^2", "volume":"in^3",
                            "force":"kip", "stress":"ksi", "moment":"kip-in"},
                 "mm-kN": {"length":"mm", "area":"mm^2", "volume":"mm^3",
                           "force":"kN", "stress":"MPa", "moment":"kN-mm"}}
 
 
-class UnitSystem():
+class UnitSystem(Immutable):
     """Set of units for structural calculations.
     
-    Units should be derived from consistent base units for length and force"""
+    Units should be derived from consistent base units for length and force.
+    Unit systems are immutable and compare by value."""
+    __slots__ = ("label", "length", "area", "volume", "force", "stress",
+                 "moment", "unit_weight")
+
     def __init__(self, label,
                  length: str, area: str, volume: str,
                  force: str, stress: str, moment: str,
                  unit_weight: str):
-        self.label = label
-        self.length = length
-        self.area = area
-        self.volume = volume
-        self.force = force
-        self.stress = stress
-        self.moment = moment
-        self.unit_weight = unit_weight
+        self._init_attributes(label=label, length=length, area=area, volume=volume,
+                              force=force, stress=stress, moment=moment,
+                              unit_weight=unit_weight)
 
 
 IN_KIP = UnitSystem(label="IN_KIP",